@@ -0,0 +1,80 @@
+"""Compara el tiempo de las analíticas con NumPy y con Python puro.
+
+Uso: python -m benchmarks.analytics [--tasks N] [--repeat R] [--seed S]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Callable
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analytics.columns import TaskColumns, DAY, to_seconds
+from src.analytics.report import HAS_NUMPY, analyze
+
+CATEGORIES = ("General", "Trabajo", "Estudio", "Casa", "Salud", "Ocio")
+
+def synthetic_columns(count: int, now: datetime, seed: int) -> TaskColumns:
+    """
+    Genera columnas de tareas aleatorias reproducibles.
+
+    Args:
+        count: Número de tareas
+        now: Fecha de referencia
+        seed: Semilla del generador
+
+    Returns:
+        TaskColumns: Columnas generadas
+    """
+    rng = random.Random(seed)
+    reference = to_seconds(now)
+    columns = TaskColumns()
+    for _ in range(count):
+        columns.append(reference + rng.uniform(-30, 90) * DAY,
+                       reference - rng.expovariate(1 / 5) * DAY,
+                       rng.randint(0, 100), rng.randint(1, 3), rng.choice(CATEGORIES),
+                       rng.random() < 0.3)
+    return columns
+
+def best_seconds(run: Callable[[], object], repeat: int) -> float:
+    """
+    Ejecuta una función varias veces y devuelve el mejor tiempo.
+
+    Args:
+        run: Función a medir
+        repeat: Número de repeticiones
+
+    Returns:
+        float: Mejor tiempo en segundos
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    """Ejecuta la medición y muestra los resultados."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="Número de tareas")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por variante")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla de los datos")
+    args = parser.parse_args()
+
+    now = datetime.now()
+    columns = synthetic_columns(args.tasks, now, args.seed)
+    print(f"Tareas: {args.tasks}, repeticiones: {args.repeat}")
+    python_time = best_seconds(lambda: analyze(columns, now, use_numpy=False), args.repeat)
+    print(f"{'Python puro':<12} {python_time * 1000:10.1f} ms")
+    if not HAS_NUMPY:
+        print("NumPy no está instalado; se omite la variante vectorizada.")
+        return
+    numpy_time = best_seconds(lambda: analyze(columns, now, use_numpy=True), args.repeat)
+    print(f"{'NumPy':<12} {numpy_time * 1000:10.1f} ms  (x{python_time / numpy_time:.1f})")
+
+if __name__ == "__main__":
+    main()
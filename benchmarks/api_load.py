@@ -0,0 +1,107 @@
+"""Prueba de carga de la API HTTP con clientes concurrentes locales.
+
+Uso: python -m benchmarks.api_load [--clients C] [--requests R] [--tasks N] [--write-ratio W]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.api.server import ApiServer
+from src.core.manager import ProcrastinationManager
+from src.data.storage import Storage
+
+async def request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str,
+                  path: str, body: bytes = b"", headers: str = "") -> Tuple[int, str]:
+    """
+    Envía una petición por una conexión persistente y lee la respuesta.
+
+    Returns:
+        Tuple[int, str]: Código de estado y ETag (vacía si no hay)
+    """
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n{headers}\r\n"
+                 .encode() + body)
+    status_line = await reader.readline()
+    length, etag = 0, ""
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+        elif name.lower() == "etag":
+            etag = value.strip()
+    await reader.readexactly(length)
+    return int(status_line.split()[1]), etag
+
+async def client(port: int, count: int, write_ratio: float, seed: int) -> List[float]:
+    """
+    Ejecuta un cliente que mezcla listados condicionales y altas de tareas.
+
+    Returns:
+        List[float]: Latencia de cada petición en segundos
+    """
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    latencies: List[float] = []
+    etag = ""
+    for number in range(count):
+        start = time.perf_counter()
+        if rng.random() < write_ratio:
+            body = json.dumps({"name": f"Carga {seed}-{number}", "deadline": "2099-01-01"})
+            status, _ = await request(reader, writer, "POST", "/tasks", body.encode())
+            assert status == 201, status
+        else:
+            headers = f"If-None-Match: {etag}\r\n" if etag else ""
+            status, new_etag = await request(reader, writer, "GET", "/tasks?limit=50",
+                                             headers=headers)
+            assert status in (200, 304), status
+            etag = new_etag or etag
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+    return latencies
+
+async def run(args: argparse.Namespace, filename: str) -> None:
+    """Arranca el servidor, lanza los clientes y muestra los resultados."""
+    storage = Storage(filename)
+    manager = ProcrastinationManager(storage)
+    manager.add_tasks({"name": f"Tarea {i}", "deadline": "2099-01-01"} for i in range(args.tasks))
+    server = ApiServer(manager, port=0)
+    await server.start()
+    try:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(client(server.port, args.requests, args.write_ratio, seed)
+                                         for seed in range(args.clients)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await server.stop()
+    latencies = sorted(latency for result in results for latency in result)
+    total = len(latencies)
+    print(f"Clientes: {args.clients}, peticiones: {total}, tareas iniciales: {args.tasks}, "
+          f"escrituras: {args.write_ratio:.0%}")
+    print(f"Rendimiento: {total / elapsed:8.0f} peticiones/s")
+    print(f"Latencia p50: {latencies[total // 2] * 1000:6.2f} ms  "
+          f"p99: {latencies[int(total * 0.99)] * 1000:6.2f} ms")
+
+def main() -> None:
+    """Ejecuta la prueba de carga."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=32, help="Clientes concurrentes")
+    parser.add_argument("--requests", type=int, default=200, help="Peticiones por cliente")
+    parser.add_argument("--tasks", type=int, default=1000, help="Tareas iniciales")
+    parser.add_argument("--write-ratio", type=float, default=0.1,
+                        help="Fracción de peticiones que crean tareas")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args, os.path.join(directory, "tasks.json")))
+
+if __name__ == "__main__":
+    main()
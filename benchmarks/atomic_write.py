@@ -0,0 +1,69 @@
+"""Mide la latencia de guardado con escritura directa y con escritura atómica.
+
+Uso: python -m benchmarks.atomic_write [--tasks N] [--repeat R]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.storage import Storage
+from src.models.task import Task, Priority
+
+def direct_save(storage: Storage, tasks: List[Task]) -> None:
+    """Guarda las tareas abriendo el archivo en modo 'w', como antes de la escritura atómica."""
+    with open(storage.filename, 'w', encoding='utf-8') as file:
+        json.dump([storage._task_to_dict(task) for task in tasks], file, indent=4) # pylint: disable=protected-access
+
+def median_ms(save: Callable[[], None], repeat: int) -> float:
+    """
+    Ejecuta un guardado varias veces y devuelve la mediana.
+
+    Args:
+        save: Guardado a medir
+        repeat: Número de repeticiones
+
+    Returns:
+        float: Mediana de la latencia en milisegundos
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        save()
+        timings.append((time.perf_counter() - start) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+def main() -> None:
+    """Ejecuta la medición y muestra los resultados."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000, help="Número de tareas")
+    parser.add_argument("--repeat", type=int, default=15, help="Repeticiones por variante")
+    args = parser.parse_args()
+
+    deadline = datetime.now() + timedelta(days=7)
+    tasks = [Task(f"Tarea {i}", "Descripción", deadline, Priority.MEDIA)
+             for i in range(args.tasks)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "tasks.json")
+        variants = {
+            "escritura directa": lambda: direct_save(Storage(filename), tasks),
+            "atómica sin fsync": lambda: Storage(filename, fsync=False).save_tasks(tasks),
+            "atómica con fsync": lambda: Storage(filename).save_tasks(tasks),
+            "atómica con fsync y 3 copias": lambda: Storage(filename, backups=3).save_tasks(tasks),
+        }
+        print(f"Tareas: {args.tasks}, repeticiones: {args.repeat}")
+        baseline = None
+        for name, save in variants.items():
+            latency = median_ms(save, args.repeat)
+            baseline = baseline or latency
+            print(f"{name:<30} {latency:8.2f} ms  (x{latency / baseline:.2f})")
+
+if __name__ == "__main__":
+    main()
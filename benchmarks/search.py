@@ -0,0 +1,73 @@
+"""Mide la construcción del índice de búsqueda y el tiempo de las consultas.
+
+Uso: python -m benchmarks.search [--tasks N] [--repeat R] [--seed S]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.search import SearchIndex
+from src.models.task import Task, Priority
+
+CATEGORIES = ("General", "Trabajo", "Estudio", "Casa", "Salud", "Ocio")
+WORDS = ("informe revisión canción presupuesto llamada médico compra reunión proyecto código "
+         "programar limpieza factura viaje estudio examen lectura correo declaración "
+         "impuestos gimnasio cumpleaños mudanza entrevista memoria").split()
+QUERIES = ("informe", "prog", "cancion presupuesto", "medico salud", "declaracoin",
+           "mudanza trabajo entrevista")
+
+def synthetic_tasks(count: int, seed: int) -> List[Task]:
+    """
+    Genera tareas con textos aleatorios reproducibles.
+
+    Args:
+        count: Número de tareas
+        seed: Semilla del generador
+
+    Returns:
+        List[Task]: Tareas generadas
+    """
+    rng = random.Random(seed)
+    deadline = datetime.now() + timedelta(days=30)
+    return [Task(" ".join(rng.choices(WORDS, k=3)), " ".join(rng.choices(WORDS, k=8)),
+                 deadline, Priority.MEDIA, rng.choice(CATEGORIES)) for _ in range(count)]
+
+def main() -> None:
+    """Ejecuta la medición y muestra los resultados."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100_000, help="Número de tareas")
+    parser.add_argument("--repeat", type=int, default=20, help="Repeticiones por consulta")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla de los datos")
+    args = parser.parse_args()
+
+    tasks = synthetic_tasks(args.tasks, args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "tasks.json.search")
+        start = time.perf_counter()
+        index = SearchIndex(filename)
+        index.load(tasks)
+        print(f"Tareas: {args.tasks}")
+        print(f"{'Construcción':<28} {(time.perf_counter() - start) * 1000:10.1f} ms")
+        index.save()
+        start = time.perf_counter()
+        SearchIndex(filename).load(tasks)
+        print(f"{'Carga del índice guardado':<28} {(time.perf_counter() - start) * 1000:10.1f} ms")
+
+    for query in QUERIES:
+        index.search(query, limit=20)
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = index.search(query, limit=20)
+            best = min(best, time.perf_counter() - start)
+        print(f"{query!r:<28} {best * 1000:10.3f} ms  ({len(results)} resultados)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Mide las operaciones principales del gestor con tareas sintéticas y detecta regresiones.
+
+Uso: python -m benchmarks.suite [--sizes 1000,100000] [--repeat R] [--seed S]
+                                [--storage json] [--output resultados.json]
+                                [--baseline base.json [--update-baseline]] [--tolerance 0.25]
+
+Cada operación se mide varias veces y se anota el mejor tiempo; la memoria
+máxima se mide aparte, en una ejecución más con `tracemalloc`, para que su
+sobrecarga no altere los tiempos. Las operaciones del gestor se miden sobre un
+gestor ya cargado, como las llama la interfaz al mostrar cada menú; la
+comprobación de procrastinación usa un gestor recién cargado en cada
+repetición, porque solo la primera llamada encuentra tareas que vencer.
+
+Con `--baseline` los resultados se comparan con los de una ejecución anterior
+y el programa termina con código 1 si alguna operación es más lenta o usa más
+memoria de lo que permite `--tolerance`.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.dataset import generate_tasks
+from src.core.manager import ProcrastinationManager
+from src.data.backends import BACKENDS, DEFAULT_FILES, create_storage
+
+RESULTS_VERSION = 1
+MIN_SECONDS = 0.001
+"""Diferencia de tiempo por debajo de la cual no se considera regresión (ruido de medida)."""
+MIN_BYTES = 64 * 1024
+"""Diferencia de memoria por debajo de la cual no se considera regresión."""
+
+Operation = Tuple[str, Callable[[], object]]
+
+def best_seconds(run: Callable[[], object], repeat: int,
+                 prepare: Optional[Callable[[], object]] = None) -> float:
+    """
+    Ejecuta una función varias veces y devuelve el mejor tiempo.
+
+    Args:
+        run: Función a medir
+        repeat: Número de repeticiones
+        prepare: Función que se ejecuta, sin medirse, antes de cada repetición
+
+    Returns:
+        float: Mejor tiempo en segundos
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        if prepare is not None:
+            prepare()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def peak_bytes(run: Callable[[], object],
+               prepare: Optional[Callable[[], object]] = None) -> int:
+    """
+    Mide la memoria máxima reservada durante una ejecución.
+
+    Args:
+        run: Función a medir
+        prepare: Función que se ejecuta antes, sin medirse
+
+    Returns:
+        int: Bytes reservados en el punto de mayor uso
+    """
+    if prepare is not None:
+        prepare()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def measure(operations: List[Operation], size: int, repeat: int,
+            prepare: Optional[Callable[[], object]] = None) -> List[Dict[str, Any]]:
+    """
+    Mide el tiempo y la memoria de cada operación.
+
+    Args:
+        operations: Nombre y función de cada operación
+        size: Número de tareas de los datos
+        repeat: Repeticiones para el tiempo
+        prepare: Función que se ejecuta, sin medirse, antes de cada ejecución de
+            cada operación; por ejemplo, para partir siempre del mismo estado
+
+    Returns:
+        List[Dict[str, Any]]: Un resultado por operación
+    """
+    results = []
+    for name, run in operations:
+        seconds = best_seconds(run, repeat, prepare)
+        results.append({"operation": name, "tasks": size, "seconds": seconds,
+                        "peak_bytes": peak_bytes(run, prepare)})
+    return results
+
+def run_size(size: int, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """
+    Genera los datos de un tamaño y mide todas las operaciones.
+
+    Args:
+        size: Número de tareas
+        args: Opciones de la línea de órdenes
+
+    Returns:
+        List[Dict[str, Any]]: Un resultado por operación
+    """
+    tasks = generate_tasks(size, args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        storage = create_storage(args.storage, os.path.join(
+            directory, DEFAULT_FILES.get(args.storage, "tasks.json")))
+        storage.fsync = args.fsync
+        try:
+            results = measure([("storage.save_tasks", lambda: storage.save_tasks(tasks)),
+                               ("storage.load_tasks", storage.load_tasks),
+                               ("manager.load", lambda: ProcrastinationManager(storage))],
+                              size, args.repeat)
+            manager = ProcrastinationManager(storage)
+            results += measure([("manager.get_tasks", manager.get_tasks),
+                                ("manager.get_category_stats", manager.get_category_stats)],
+                               size, args.repeat)
+            # Tras la primera llamada ya no queda nada que vencer: cada repetición
+            # parte de un gestor recién cargado, cuya carga no se mide.
+            fresh: List[ProcrastinationManager] = []
+
+            def load_manager() -> None:
+                fresh[:] = [ProcrastinationManager(storage)]
+
+            results += measure([("manager.check_procrastination",
+                                 lambda: fresh[0].check_procrastination())],
+                               size, args.repeat, prepare=load_manager)
+        finally:
+            close = getattr(storage, "close", None)
+            if close is not None:
+                close()
+    return results
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]],
+            tolerance: float) -> Dict[Tuple[str, int], List[str]]:
+    """
+    Busca las operaciones que empeoraron respecto a una ejecución anterior.
+
+    Solo se comparan las operaciones medidas con el mismo número de tareas en
+    ambas ejecuciones. Un empeoramiento cuenta si supera la tolerancia relativa
+    y además `MIN_SECONDS` o `MIN_BYTES`, para no avisar por ruido.
+
+    Args:
+        results: Resultados nuevos
+        baseline: Resultados de referencia
+        tolerance: Empeoramiento relativo admitido (0.25 es un 25 %)
+
+    Returns:
+        Dict[Tuple[str, int], List[str]]: Para cada operación y número de tareas con
+            regresiones, la descripción de cada una
+    """
+    reference = {(entry["operation"], entry["tasks"]): entry for entry in baseline}
+    regressions: Dict[Tuple[str, int], List[str]] = {}
+    for entry in results:
+        key = (entry["operation"], entry["tasks"])
+        old = reference.get(key)
+        if old is None:
+            continue
+        problems = []
+        if (entry["seconds"] > old["seconds"] * (1 + tolerance)
+                and entry["seconds"] - old["seconds"] > MIN_SECONDS):
+            problems.append(f"tiempo {old['seconds'] * 1000:.1f} → "
+                            f"{entry['seconds'] * 1000:.1f} ms")
+        if (entry["peak_bytes"] > old["peak_bytes"] * (1 + tolerance)
+                and entry["peak_bytes"] - old["peak_bytes"] > MIN_BYTES):
+            problems.append(f"memoria {old['peak_bytes'] / 2**20:.1f} → "
+                            f"{entry['peak_bytes'] / 2**20:.1f} MiB")
+        if problems:
+            regressions[key] = problems
+    return regressions
+
+def read_baseline(filename: str, storage: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Lee los resultados de referencia.
+
+    Args:
+        filename: Archivo de resultados
+        storage: Almacenamiento que se está midiendo
+
+    Returns:
+        Optional[List[Dict[str, Any]]]: Los resultados, o None si el archivo no existe
+            o se midió con otro almacenamiento
+    """
+    try:
+        with open(filename, encoding='utf-8') as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        print(f"No existe la referencia {filename}; no se compara.")
+        return None
+    if data.get("storage") != storage:
+        print(f"La referencia {filename} es del almacenamiento {data.get('storage')}; "
+              "no se compara.")
+        return None
+    return data["results"]
+
+def write_results(filename: str, results: List[Dict[str, Any]], args: argparse.Namespace) -> None:
+    """
+    Guarda los resultados en JSON junto con los datos de la ejecución.
+
+    Args:
+        filename: Archivo de destino
+        results: Resultados de la medición
+        args: Opciones de la línea de órdenes
+    """
+    data = {"version": RESULTS_VERSION, "created": datetime.now().isoformat(timespec='seconds'),
+            "python": platform.python_version(), "platform": platform.platform(),
+            "storage": args.storage, "seed": args.seed, "repeat": args.repeat,
+            "results": results}
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=2)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ejecuta la medición, muestra los resultados y los compara con la referencia.
+
+    Returns:
+        int: 1 si hay regresiones respecto a la referencia, 0 en otro caso
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,100000",
+                        help="Números de tareas separados por comas, como 1000,100000,1000000")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por operación")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla de los datos")
+    parser.add_argument("--storage", choices=sorted(BACKENDS), default="json",
+                        help="Formato de almacenamiento medido")
+    parser.add_argument("--fsync", action="store_true",
+                        help="Sincroniza cada guardado con el disco")
+    parser.add_argument("--output", metavar="ARCHIVO", help="Guarda los resultados en JSON")
+    parser.add_argument("--baseline", metavar="ARCHIVO",
+                        help="Resultados de referencia con los que comparar")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Tras comparar, guarda los resultados como nueva referencia")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Empeoramiento relativo admitido antes de avisar")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    baseline = read_baseline(args.baseline, args.storage) if args.baseline else None
+    reference = {(entry["operation"], entry["tasks"]): entry for entry in baseline or []}
+    results: List[Dict[str, Any]] = []
+    print(f"Almacenamiento: {args.storage}, repeticiones: {args.repeat}, semilla: {args.seed}")
+    print(f"{'Operación':<32} {'Tareas':>9} {'Tiempo':>12} {'Memoria':>12} {'Referencia':>12}")
+    for size in sizes:
+        for entry in run_size(size, args):
+            results.append(entry)
+            old = reference.get((entry["operation"], size))
+            change = (f"{entry['seconds'] / old['seconds'] - 1:+.0%}"
+                      if old and old["seconds"] else "")
+            print(f"{entry['operation']:<32} {size:>9} {entry['seconds'] * 1000:>9.2f} ms "
+                  f"{entry['peak_bytes'] / 2**20:>8.1f} MiB {change:>12}")
+
+    if args.output:
+        write_results(args.output, results, args)
+    status = 0
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for (operation, size), problems in regressions.items():
+            print(f"Regresión en {operation} con {size} tareas: {', '.join(problems)}")
+        status = 1 if regressions else 0
+        if not regressions:
+            print("Sin regresiones respecto a la referencia.")
+    if args.baseline and args.update_baseline:
+        write_results(args.baseline, results, args)
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Mide la memoria ocupada por las tareas cargadas en memoria.
+
+Uso: python -m benchmarks.task_memory [--tasks N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.storage import Storage
+from src.models.task import Task, Priority
+
+class DictTask:  # pylint: disable=too-few-public-methods
+    """Tarea equivalente a `Task` sin `__slots__`, usada como referencia."""
+
+    def __init__(self, task: Task) -> None:
+        for attribute in Task.__slots__:
+            setattr(self, attribute, getattr(task, attribute))
+
+def copy_task(task: Task) -> Task:
+    """Crea una copia de la tarea compartiendo los valores de sus atributos."""
+    copy = Task.__new__(Task)
+    for attribute in Task.__slots__:
+        setattr(copy, attribute, getattr(task, attribute))
+    return copy
+
+def measure(build: Callable[[], List[object]]) -> int:
+    """
+    Mide los bytes que siguen reservados tras construir una lista de objetos.
+
+    Args:
+        build: Función que construye los objetos
+
+    Returns:
+        int: Bytes reservados por los objetos construidos
+    """
+    tracemalloc.start()
+    objects = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current
+
+def main() -> None:
+    """Ejecuta la medición y muestra los resultados."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100_000, help="Número de tareas")
+    args = parser.parse_args()
+
+    now = datetime.now()
+    priorities = list(Priority)
+    tasks = [Task(f"Tarea {i}", "Descripción", now + timedelta(days=i % 30),
+                  priorities[i % 3], f"Categoría {i % 12}") for i in range(args.tasks)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        storage = Storage(os.path.join(directory, "tasks.json"))
+        storage.save_tasks(tasks)
+        loaded = measure(storage.load_tasks)
+    slotted = measure(lambda: [copy_task(t) for t in tasks])
+    with_dict = measure(lambda: [DictTask(t) for t in tasks])
+
+    print(f"Tareas: {args.tasks}")
+    print(f"Task con __slots__: {slotted / args.tasks:.0f} bytes/tarea")
+    print(f"Task con __dict__:  {with_dict / args.tasks:.0f} bytes/tarea")
+    print(f"Storage.load_tasks: {loaded / args.tasks:.0f} bytes/tarea")
+
+if __name__ == "__main__":
+    main()
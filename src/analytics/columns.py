@@ -0,0 +1,92 @@
+"""Columnar representation of task fields used by the analytics backends."""
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+from src.models.task import Task, Priority
+
+PRIORITY_CODES: Dict[Priority, int] = {Priority.BAJA: 1, Priority.MEDIA: 2, Priority.ALTA: 3}
+DAY = 86400.0
+# Histogram bin edges, in days. The last bin is open-ended.
+STALENESS_BINS: Tuple[float, ...] = (0, 1, 3, 7, 30, float('inf'))
+OVERDUE_BINS: Tuple[float, ...] = (0, 1, 3, 7, 30, float('inf'))
+PERCENTILES: Tuple[int, ...] = (25, 50, 75, 90)
+_EPOCH = datetime(1970, 1, 1)
+
+def to_seconds(moment: datetime) -> float:
+    """
+    Converts a naive datetime to seconds since the epoch without timezone lookups.
+
+    Args:
+        moment (datetime): The datetime to convert.
+
+    Returns:
+        float: Seconds since 1970-01-01.
+    """
+    return (moment - _EPOCH).total_seconds()
+
+class TaskColumns:
+    """
+    Stores the analysed fields of many tasks as typed, contiguous columns.
+
+    Each column is an `array.array`, so it uses a few bytes per task and NumPy
+    can wrap it without copying. Row `i` of every column belongs to the same task.
+    Categories are stored as codes into `categories`.
+    """
+
+    def __init__(self) -> None:
+        """Initializes empty columns."""
+        self.deadline = array('d')
+        self.last_update = array('d')
+        self.progress = array('B')
+        self.priority = array('b')
+        self.category = array('i')
+        self.completed = array('b')
+        self.categories: List[str] = []
+        self._category_codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of tasks."""
+        return len(self.deadline)
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task]) -> "TaskColumns":
+        """
+        Builds the columns from a collection of tasks.
+
+        Args:
+            tasks (Iterable[Task]): The tasks to analyse.
+
+        Returns:
+            TaskColumns: The columns, in the order of `tasks`.
+        """
+        columns = cls()
+        for task in tasks:
+            columns.append(to_seconds(task.deadline), to_seconds(task.last_update), task.progress,
+                           PRIORITY_CODES[task.priority], task.category, task.completed)
+        return columns
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def append(self, deadline: float, last_update: float, progress: int, priority: int,
+               category: str, completed: bool) -> None:
+        """
+        Adds a row.
+
+        Args:
+            deadline (float): Deadline, in seconds since the epoch.
+            last_update (float): Last update, in seconds since the epoch.
+            progress (int): Progress percentage.
+            priority (int): Priority code, see `PRIORITY_CODES`.
+            category (str): Category name.
+            completed (bool): Whether the task is completed.
+        """
+        code = self._category_codes.get(category)
+        if code is None:
+            code = self._category_codes[category] = len(self.categories)
+            self.categories.append(category)
+        self.deadline.append(deadline)
+        self.last_update.append(last_update)
+        self.progress.append(progress)
+        self.priority.append(priority)
+        self.category.append(code)
+        self.completed.append(completed)
@@ -0,0 +1,117 @@
+"""NumPy implementation of the task analytics.
+
+Importing this module requires NumPy; use `src.analytics.report`, which falls
+back to the pure-Python backend when it is not installed.
+"""
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from src.analytics.columns import (TaskColumns, DAY, STALENESS_BINS, OVERDUE_BINS, PERCENTILES,
+                                   PRIORITY_CODES)
+
+_MAX_PRIORITY = max(PRIORITY_CODES.values())
+
+def _column(values: Any) -> np.ndarray:
+    """Wraps an `array.array` column without copying it."""
+    if not len(values):  # pylint: disable=use-implicit-booleaness-not-len
+        return np.zeros(0, dtype=values.typecode)
+    return np.frombuffer(values, dtype=values.typecode)
+
+def _histogram(edges: Tuple[float, ...], values: np.ndarray) -> List[int]:
+    """Counts values per bin, clamping values below the first edge."""
+    bins = len(edges) - 1
+    index = np.clip(np.searchsorted(edges, values, side='right') - 1, 0, bins - 1)
+    return np.bincount(index, minlength=bins).tolist()
+
+def summarize(columns: TaskColumns, now: float) -> Dict[str, Any]:
+    """
+    Computes the analytics summary with vectorized passes over the columns.
+
+    Args:
+        columns (TaskColumns): The tasks to analyse.
+        now (float): Reference time, in seconds since the epoch.
+
+    Returns:
+        Dict[str, Any]: See `src.analytics.report.analyze`.
+    """
+    deadline = _column(columns.deadline)
+    last_update = _column(columns.last_update)
+    progress = _column(columns.progress)
+    category = _column(columns.category)
+    completed = _column(columns.completed).astype(bool)
+    categories = len(columns.categories)
+
+    totals = np.bincount(category, minlength=categories)
+    done = np.bincount(category[completed], minlength=categories)
+    pending = ~completed
+    staleness = _histogram(STALENESS_BINS, (now - last_update[pending]) / DAY)
+    overdue_deadline = deadline[pending & (deadline < now)]
+    overdue = _histogram(OVERDUE_BINS, (now - overdue_deadline) / DAY)
+
+    # Sorting by (category, progress) leaves each category as a sorted slice, so the
+    # percentiles of every category are interpolated at once.
+    ordered = progress[np.lexsort((progress, category))].astype(np.float64)
+    starts = np.concatenate(([0], np.cumsum(totals)[:-1]))
+    percentiles = {}
+    for q in PERCENTILES:
+        position = q / 100 * (totals - 1)
+        low = np.floor(position).astype(np.int64)
+        high = np.minimum(low + 1, totals - 1)
+        low_values = ordered[starts + low]
+        percentiles[q] = low_values + (ordered[starts + high] - low_values) * (position - low)
+
+    by_category: Dict[str, Dict[str, Any]] = {}
+    for code, name in enumerate(columns.categories):
+        by_category[name] = {
+            'total': int(totals[code]),
+            'completion_rate': float(done[code] / totals[code]),
+            'progress_percentiles': {q: float(percentiles[q][code]) for q in PERCENTILES},
+        }
+    return {
+        'tasks': len(columns),
+        'completion_rate': float(completed.mean()) if len(columns) else 0.0,
+        'categories': by_category,
+        'overdue_histogram': overdue,
+        'staleness_histogram': staleness,
+    }
+
+def risk_scores(columns: TaskColumns, now: float) -> np.ndarray:
+    """
+    Computes the deadline-risk score of every task.
+
+    Args:
+        columns (TaskColumns): The tasks to analyse.
+        now (float): Reference time, in seconds since the epoch.
+
+    Returns:
+        np.ndarray: One score per row, see `src.analytics.report.deadline_risk`.
+    """
+    remaining = (100 - _column(columns.progress).astype(np.float64)) / 100
+    weight = _column(columns.priority) / _MAX_PRIORITY
+    days_left = np.maximum((_column(columns.deadline) - now) / DAY, 0.0)
+    scores = remaining * weight / (1 + days_left)
+    scores[_column(columns.completed).astype(bool)] = 0.0
+    return scores
+
+def highest(scores: np.ndarray, count: int) -> List[Tuple[int, float]]:
+    """
+    Returns the rows with the highest scores.
+
+    Args:
+        scores (np.ndarray): One score per row.
+        count (int): Number of rows to return.
+
+    Returns:
+        List[Tuple[int, float]]: (row, score) pairs, highest score first.
+    """
+    count = min(count, len(scores))
+    if count <= 0:
+        return []
+    threshold = np.partition(scores, len(scores) - count)[len(scores) - count]
+    above = np.flatnonzero(scores > threshold)
+    # Ties are broken by row, like heapq.nlargest in the pure-Python backend.
+    tied = np.flatnonzero(scores == threshold)[:count - len(above)]
+    rows = np.concatenate((above, tied))
+    rows = rows[np.lexsort((rows, -scores[rows]))]
+    return [(int(row), float(scores[row])) for row in rows]
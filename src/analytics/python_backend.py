@@ -0,0 +1,99 @@
+"""Pure-Python implementation of the task analytics."""
+import heapq
+from bisect import bisect_right
+from math import floor
+from typing import Any, Dict, List, Sequence, Tuple
+
+from src.analytics.columns import (TaskColumns, DAY, STALENESS_BINS, OVERDUE_BINS, PERCENTILES,
+                                   PRIORITY_CODES)
+
+_MAX_PRIORITY = max(PRIORITY_CODES.values())
+
+def _bin(edges: Sequence[float], value: float) -> int:
+    """Returns the histogram bin of a value, clamping values below the first edge."""
+    return min(max(bisect_right(edges, value) - 1, 0), len(edges) - 2)
+
+def _percentile(values: Sequence[int], q: float) -> float:
+    """Linearly interpolated percentile of sorted values, as computed by NumPy."""
+    position = q / 100 * (len(values) - 1)
+    low = floor(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+def summarize(columns: TaskColumns, now: float) -> Dict[str, Any]:
+    """
+    Computes the analytics summary in a single pass over the columns.
+
+    Args:
+        columns (TaskColumns): The tasks to analyse.
+        now (float): Reference time, in seconds since the epoch.
+
+    Returns:
+        Dict[str, Any]: See `src.analytics.report.analyze`.
+    """
+    categories = len(columns.categories)
+    totals = [0] * categories
+    completed = [0] * categories
+    progress: List[List[int]] = [[] for _ in range(categories)]
+    staleness = [0] * (len(STALENESS_BINS) - 1)
+    overdue = [0] * (len(OVERDUE_BINS) - 1)
+
+    for deadline, last_update, task_progress, code, done in zip(
+            columns.deadline, columns.last_update, columns.progress, columns.category,
+            columns.completed):
+        totals[code] += 1
+        progress[code].append(task_progress)
+        if done:
+            completed[code] += 1
+            continue
+        staleness[_bin(STALENESS_BINS, (now - last_update) / DAY)] += 1
+        if deadline < now:
+            overdue[_bin(OVERDUE_BINS, (now - deadline) / DAY)] += 1
+
+    by_category: Dict[str, Dict[str, Any]] = {}
+    for code, name in enumerate(columns.categories):
+        values = sorted(progress[code])
+        by_category[name] = {
+            'total': totals[code],
+            'completion_rate': completed[code] / totals[code],
+            'progress_percentiles': {q: _percentile(values, q) for q in PERCENTILES},
+        }
+    return {
+        'tasks': len(columns),
+        'completion_rate': sum(completed) / len(columns) if len(columns) else 0.0,
+        'categories': by_category,
+        'overdue_histogram': overdue,
+        'staleness_histogram': staleness,
+    }
+
+def risk_scores(columns: TaskColumns, now: float) -> List[float]:
+    """
+    Computes the deadline-risk score of every task.
+
+    Args:
+        columns (TaskColumns): The tasks to analyse.
+        now (float): Reference time, in seconds since the epoch.
+
+    Returns:
+        List[float]: One score per row, see `src.analytics.report.deadline_risk`.
+    """
+    return [
+        0.0 if done else
+        (100 - task_progress) / 100 * (priority / _MAX_PRIORITY)
+        / (1 + max((deadline - now) / DAY, 0.0))
+        for deadline, task_progress, priority, done in zip(
+            columns.deadline, columns.progress, columns.priority, columns.completed)
+    ]
+
+def highest(scores: Sequence[float], count: int) -> List[Tuple[int, float]]:
+    """
+    Returns the rows with the highest scores.
+
+    Args:
+        scores (Sequence[float]): One score per row.
+        count (int): Number of rows to return.
+
+    Returns:
+        List[Tuple[int, float]]: (row, score) pairs, highest score first.
+    """
+    return heapq.nlargest(count, enumerate(scores), key=lambda item: item[1])
@@ -0,0 +1,91 @@
+"""Entry points of the task analytics.
+
+The computations run on NumPy when it is installed and fall back to a
+pure-Python implementation otherwise; both return the same results.
+"""
+from datetime import datetime
+from types import ModuleType
+from typing import Any, Dict, Iterable, Optional, Sequence, Union
+
+from src.analytics import python_backend
+from src.analytics.columns import TaskColumns, to_seconds
+from src.models.task import Task
+
+try:
+    from src.analytics import numpy_backend
+except ImportError:
+    numpy_backend = None  # type: ignore[assignment]
+
+HAS_NUMPY = numpy_backend is not None
+
+def _backend(use_numpy: Optional[bool]) -> ModuleType:
+    """
+    Selects the backend to use.
+
+    Args:
+        use_numpy (Optional[bool]): True or False to force a backend; None uses NumPy
+            when it is available.
+
+    Raises:
+        RuntimeError: If NumPy is requested but not installed.
+    """
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+    if use_numpy and numpy_backend is None:
+        raise RuntimeError("NumPy no está instalado; instálelo con 'pip install numpy'")
+    return numpy_backend if use_numpy else python_backend
+
+def _columns(tasks: Union[TaskColumns, Iterable[Task]]) -> TaskColumns:
+    """Returns the columns of the given tasks, building them if needed."""
+    return tasks if isinstance(tasks, TaskColumns) else TaskColumns.from_tasks(tasks)
+
+def analyze(tasks: Union[TaskColumns, Iterable[Task]], now: Optional[datetime] = None,
+            top_risk: int = 10, use_numpy: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Computes completion, overdue, staleness, progress and risk analytics.
+
+    Args:
+        tasks (Union[TaskColumns, Iterable[Task]]): The tasks to analyse.
+        now (Optional[datetime]): Reference time. Defaults to the current time.
+        top_risk (int): Number of highest-risk tasks to report.
+        use_numpy (Optional[bool]): Backend selection, see `deadline_risk`.
+
+    Returns:
+        Dict[str, Any]: A dictionary with:
+            - 'tasks': number of tasks.
+            - 'completion_rate': fraction of completed tasks.
+            - 'categories': for each category, its 'total', 'completion_rate' and
+              'progress_percentiles' (percentile -> progress).
+            - 'overdue_histogram': pending tasks past their deadline, per bin of days
+              overdue (`OVERDUE_BINS`).
+            - 'staleness_histogram': pending tasks per bin of days since their last
+              update (`STALENESS_BINS`).
+            - 'highest_risk': (row, score) pairs of the riskiest tasks, see `deadline_risk`.
+    """
+    backend = _backend(use_numpy)
+    columns = _columns(tasks)
+    seconds = to_seconds(now if now is not None else datetime.now())
+    report = backend.summarize(columns, seconds)
+    report['highest_risk'] = backend.highest(backend.risk_scores(columns, seconds), top_risk)
+    return report
+
+def deadline_risk(tasks: Union[TaskColumns, Iterable[Task]], now: Optional[datetime] = None,
+                  use_numpy: Optional[bool] = None) -> Sequence[float]:
+    """
+    Scores how likely each task is to miss its deadline.
+
+    The score is the remaining work weighted by priority and divided by one plus
+    the days left, so it ranges from 0 (completed, or no work left) to 1 (high
+    priority, no progress, deadline reached). Completed tasks score 0.
+
+    Args:
+        tasks (Union[TaskColumns, Iterable[Task]]): The tasks to score.
+        now (Optional[datetime]): Reference time. Defaults to the current time.
+        use_numpy (Optional[bool]): True or False to force a backend; None uses NumPy
+            when it is available.
+
+    Returns:
+        Sequence[float]: One score per task, in order. A NumPy array with the NumPy backend.
+    """
+    seconds = to_seconds(now if now is not None else datetime.now())
+    return _backend(use_numpy).risk_scores(_columns(tasks), seconds)
@@ -0,0 +1,457 @@
+"""Local HTTP/JSON API over ProcrastinationManager, built on asyncio streams."""
+import argparse
+import asyncio
+import json
+import secrets
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from src.core.manager import ProcrastinationManager
+from src.data.backends import BACKENDS, create_storage
+from src.data.storage import StorageConflictError, task_to_dict
+from src.models.task import Priority, Task
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+# Most writes queued at once that are applied together with a single storage write.
+MAX_WRITE_BATCH = 64
+_REASONS = {200: "OK", 201: "Created", 204: "No Content", 304: "Not Modified",
+            400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error"}
+_MAX_BODY = 1024 * 1024
+
+class ApiError(Exception):
+    """An error that is returned to the client with the given HTTP status."""
+
+    def __init__(self, status: int, message: str) -> None:
+        """
+        Initializes the error.
+
+        Args:
+            status (int): HTTP status code.
+            message (str): Description sent to the client.
+        """
+        super().__init__(message)
+        self.status = status
+
+class Response:  # pylint: disable=too-few-public-methods
+    """An HTTP response produced by a route."""
+
+    def __init__(self, status: int, body: Any = None, etag: Optional[str] = None) -> None:
+        """
+        Initializes the response.
+
+        Args:
+            status (int): HTTP status code.
+            body (Any): Value serialized as JSON, or None for an empty body.
+            etag (Optional[str]): Entity tag of the body, if it can be cached.
+        """
+        self.status = status
+        self.body = body
+        self.etag = etag
+
+def _parse_bool(value: str) -> bool:
+    """Parses a boolean query parameter."""
+    if value.lower() in ("1", "true", "yes"):
+        return True
+    if value.lower() in ("0", "false", "no"):
+        return False
+    raise ApiError(400, f"Valor booleano inválido: {value}")
+
+def _parse_int(query: Dict[str, str], name: str, default: int, maximum: int) -> int:
+    """Parses a non-negative integer query parameter."""
+    try:
+        value = int(query.get(name, default))
+    except ValueError as exc:
+        raise ApiError(400, f"'{name}' debe ser un número entero") from exc
+    if value < 0:
+        raise ApiError(400, f"'{name}' no puede ser negativo")
+    return min(value, maximum)
+
+class ApiServer:
+    """
+    Serves task CRUD, filters, statistics and procrastination checks over HTTP.
+
+    Reads run on a thread pool and may proceed concurrently. Writes go through
+    a single queue drained by one writer: every write waiting in the queue is
+    applied inside one `ProcrastinationManager.batch`, so concurrent clients
+    share storage writes instead of contending for them. Task listings are
+    paginated and carry an ETag derived from `ProcrastinationManager.version`
+    and a per-server nonce (the version restarts with every process), so a
+    conditional GET with an unchanged version is answered with 304 without
+    touching the tasks.
+    """
+
+    def __init__(self, manager: ProcrastinationManager, host: str = "127.0.0.1",
+                 port: int = 8000) -> None:
+        """
+        Initializes the server without starting it.
+
+        Args:
+            manager (ProcrastinationManager): The manager to expose.
+            host (str): Address to listen on.
+            port (int): Port to listen on; 0 picks a free port.
+        """
+        self.manager = manager
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writes: Optional["asyncio.Queue[Tuple[Callable[[], Any], asyncio.Future]]"] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="api-writer")
+        self._etag_nonce = secrets.token_hex(4)
+
+    async def start(self) -> None:
+        """Starts listening and the writer task. `port` is updated with the bound port."""
+        self._writes = asyncio.Queue()
+        self._writer = asyncio.create_task(self._write_loop())
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stops accepting connections and the writer task."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+        self._write_executor.shutdown(wait=True)
+
+    async def serve_forever(self) -> None:
+        """Starts the server and runs until cancelled."""
+        await self.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.stop()
+
+    # Writer
+
+    async def _write(self, operation: Callable[[], Any]) -> Any:
+        """
+        Queues a manager mutation and waits for its result.
+
+        Args:
+            operation (Callable[[], Any]): The mutation; runs on the writer thread.
+
+        Returns:
+            Any: The value returned by the operation.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._writes.put((operation, future))
+        return await future
+
+    async def _write_loop(self) -> None:
+        """Applies queued writes, grouping those already waiting into one batch."""
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self._writes.get()]
+            while len(pending) < MAX_WRITE_BATCH and not self._writes.empty():
+                pending.append(self._writes.get_nowait())
+            outcomes = await loop.run_in_executor(self._write_executor, self._apply_writes,
+                                                  [operation for operation, _ in pending])
+            for (_, future), (result, error) in zip(pending, outcomes):
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+
+    def _apply_writes(self, operations: List[Callable[[], Any]]
+                      ) -> List[Tuple[Any, Optional[BaseException]]]:
+        """
+        Runs queued mutations inside a single manager batch.
+
+        Args:
+            operations (List[Callable[[], Any]]): The mutations, in arrival order.
+
+        Returns:
+            List[Tuple[Any, Optional[BaseException]]]: Result or error of each operation.
+        """
+        outcomes: List[Tuple[Any, Optional[BaseException]]] = []
+        try:
+            with self.manager.batch():
+                for operation in operations:
+                    try:
+                        outcomes.append((operation(), None))
+                    except Exception as error:  # pylint: disable=broad-exception-caught
+                        outcomes.append((None, error))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # The batch was not saved: every operation is reported as failed.
+            outcomes = [(None, error) for _ in operations]
+        return outcomes
+
+    # HTTP
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """Serves the requests of one client connection, keeping it alive between requests."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._send(writer, Response(400, {"error": "Petición mal formada"}),
+                                     keep_alive=False)
+                    break
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    await self._send(writer, Response(400, {"error": "Content-Length no válido"}),
+                                     keep_alive=False)
+                    break
+                if length > _MAX_BODY:
+                    await self._send(writer, Response(413, {"error": "Cuerpo demasiado grande"}),
+                                     keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and version != "HTTP/1.0")
+                response = await self._dispatch(method, target, headers, body)
+                await self._send(writer, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, response: Response, keep_alive: bool) -> None:
+        """Writes a response to the client."""
+        payload = b"" if response.body is None else json.dumps(response.body).encode('utf-8')
+        lines = [f"HTTP/1.1 {response.status} {_REASONS.get(response.status, '')}",
+                 f"Content-Length: {len(payload)}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        if payload:
+            lines.append("Content-Type: application/json; charset=utf-8")
+        if response.etag is not None:
+            lines.append(f"ETag: {response.etag}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + payload)
+        await writer.drain()
+
+    async def _dispatch(self, method: str, target: str, headers: Dict[str, str],
+                        body: bytes) -> Response:
+        """
+        Routes a request and converts errors into responses.
+
+        Args:
+            method (str): HTTP method.
+            target (str): Request target, including the query string.
+            headers (Dict[str, str]): Request headers, with lower-case names.
+            body (bytes): Request body.
+
+        Returns:
+            Response: The response to send.
+        """
+        try:
+            return await self._route(method, target, headers, body)
+        except ApiError as error:
+            return Response(error.status, {"error": str(error)})
+        except StorageConflictError as error:
+            return Response(409, {"error": str(error)})
+        except ValueError as error:
+            return Response(400, {"error": str(error)})
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return Response(500, {"error": str(error)})
+
+    async def _route(self, method: str, target: str, headers: Dict[str, str],
+                     body: bytes) -> Response:
+        """
+        Routes a request to the handler of its resource.
+
+        Args:
+            method (str): HTTP method.
+            target (str): Request target, including the query string.
+            headers (Dict[str, str]): Request headers, with lower-case names.
+            body (bytes): Request body.
+
+        Returns:
+            Response: The response to send.
+
+        Raises:
+            ApiError: If the resource does not exist or does not accept the method.
+        """
+        url = urlsplit(target)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part]
+        if parts and parts[0] == "tasks" and len(parts) <= 2:
+            task_id = parts[1] if len(parts) == 2 else None
+            return await self._route_tasks(method, task_id, query, headers, body)
+        if parts == ["stats"] and method == "GET":
+            return Response(200, await self._read(self.manager.get_category_stats))
+        if parts == ["procrastination"] and method == "GET":
+            stale = await self._read(self.manager.check_procrastination)
+            return Response(200, [task_to_dict(task) for task in stale])
+        raise ApiError(404, "Recurso no encontrado")
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    async def _route_tasks(self, method: str, task_id: Optional[str], query: Dict[str, str],
+                           headers: Dict[str, str], body: bytes) -> Response:
+        """
+        Routes a request for the task collection or for one task.
+
+        Args:
+            method (str): HTTP method.
+            task_id (Optional[str]): The requested task, or None for the collection.
+            query (Dict[str, str]): Query parameters.
+            headers (Dict[str, str]): Request headers, with lower-case names.
+            body (bytes): Request body.
+
+        Returns:
+            Response: The response to send.
+
+        Raises:
+            ApiError: If the method is not allowed on the resource.
+        """
+        if task_id is None:
+            if method == "GET":
+                return await self._list_tasks(query, headers)
+            if method == "POST":
+                return await self._create_task(self._json(body))
+        elif method == "GET":
+            return await self._get_task(task_id, headers)
+        elif method == "PATCH":
+            return await self._update_task(task_id, self._json(body))
+        elif method == "DELETE":
+            return await self._delete_task(task_id)
+        raise ApiError(405, f"Método {method} no permitido")
+
+    @staticmethod
+    def _json(body: bytes) -> Dict[str, Any]:
+        """Parses a JSON object request body."""
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError as exc:
+            raise ApiError(400, "El cuerpo no es JSON válido") from exc
+        if not isinstance(data, dict):
+            raise ApiError(400, "El cuerpo debe ser un objeto JSON")
+        return data
+
+    @staticmethod
+    async def _read(operation: Callable[[], Any]) -> Any:
+        """Runs a manager query on the thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(None, operation)
+
+    def _etag(self, version: int) -> str:
+        """Builds the entity tag for a manager version of this server instance."""
+        return f'W/"{self._etag_nonce}-{version}"'
+
+    # Routes
+
+    async def _list_tasks(self, query: Dict[str, str], headers: Dict[str, str]) -> Response:
+        """GET /tasks: filtered, paginated task listing."""
+        # Read the version before the tasks: a concurrent write then yields a newer body
+        # under an older tag, which only causes a refetch, never a stale cache hit.
+        etag = self._etag(self.manager.version)
+        if headers.get("if-none-match") == etag:
+            return Response(304, etag=etag)
+        offset = _parse_int(query, "offset", 0, sys.maxsize)
+        limit = _parse_int(query, "limit", DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+        completed = _parse_bool(query["completed"]) if "completed" in query else None
+        priority = None
+        if "priority" in query:
+            try:
+                priority = Priority[query["priority"].upper()]
+            except KeyError as exc:
+                raise ApiError(400, f"Prioridad inválida: {query['priority']}") from exc
+        category = query.get("category")
+        sort = _parse_bool(query.get("sort_by_priority", "true"))
+
+        def select() -> List[Task]:
+            if category is not None:
+                tasks = self.manager.get_category_tasks(category)
+            else:
+                tasks = self.manager.get_tasks(sort_by_priority=sort)
+            return [task for task in tasks
+                    if (priority is None or task.priority == priority)
+                    and (completed is None or task.completed == completed)]
+
+        tasks = await self._read(select)
+        page = tasks[offset:offset + limit]
+        next_offset = offset + limit if offset + limit < len(tasks) else None
+        return Response(200, {"items": [task_to_dict(task) for task in page],
+                              "total": len(tasks), "offset": offset, "limit": limit,
+                              "next_offset": next_offset}, etag=etag)
+
+    async def _get_task(self, task_id: str, headers: Dict[str, str]) -> Response:
+        """GET /tasks/{id}."""
+        etag = self._etag(self.manager.version)
+        if headers.get("if-none-match") == etag:
+            return Response(304, etag=etag)
+        task = await self._read(lambda: self.manager.get_task(task_id))
+        if task is None:
+            raise ApiError(404, f"No existe una tarea con id {task_id}")
+        return Response(200, task_to_dict(task), etag=etag)
+
+    async def _create_task(self, data: Dict[str, Any]) -> Response:
+        """POST /tasks: validated like a single-entry batch import."""
+        tasks = await self._write(lambda: self.manager.add_tasks([data]))
+        return Response(201, task_to_dict(tasks[0]))
+
+    def _require_task(self, task_id: str) -> None:
+        """Raises a 404 error if the task does not exist."""
+        if self.manager.get_task(task_id) is None:
+            raise ApiError(404, f"No existe una tarea con id {task_id}")
+
+    async def _update_task(self, task_id: str, data: Dict[str, Any]) -> Response:
+        """PATCH /tasks/{id}: changes the given editable fields."""
+        def update() -> List[Task]:
+            self._require_task(task_id)
+            return self.manager.update_tasks({task_id: data})
+
+        tasks = await self._write(update)
+        return Response(200, task_to_dict(tasks[0]))
+
+    async def _delete_task(self, task_id: str) -> Response:
+        """DELETE /tasks/{id}."""
+        def delete() -> None:
+            self._require_task(task_id)
+            self.manager.delete_tasks([task_id])
+
+        await self._write(delete)
+        return Response(204)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs the API server until interrupted."""
+    parser = argparse.ArgumentParser(description="API HTTP del Gestor de Procrastinación")
+    parser.add_argument("--storage", choices=sorted(BACKENDS), default="json",
+                        help="Formato de almacenamiento de las tareas")
+    parser.add_argument("--file",
+                        help="Archivo de tareas (por defecto tasks.json, o el propio de --storage)")
+    parser.add_argument("--host", default="127.0.0.1", help="Dirección de escucha")
+    parser.add_argument("--port", type=int, default=8000, help="Puerto de escucha")
+    args = parser.parse_args(argv)
+
+    manager = ProcrastinationManager(create_storage(args.storage, args.file))
+    server = ApiServer(manager, args.host, args.port)
+    print(f"Escuchando en http://{args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        manager.flush()
+
+if __name__ == "__main__":
+    main()
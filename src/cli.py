@@ -0,0 +1,104 @@
+"""Non-interactive command line interface for bulk task import, export and conversion."""
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+# Añadir el directorio raíz del proyecto al sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.manager import ProcrastinationManager
+from src.data.backends import BACKENDS, create_storage
+from src.data.storage import Storage, task_to_dict
+from src.data.task_io import FORMATS, read_records, write_records
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command line parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser with the import, export and convert commands.
+    """
+    parser = argparse.ArgumentParser(description="Importa y exporta tareas del Gestor de Procrastinación") # pylint: disable=line-too-long
+    parser.add_argument("--storage", choices=sorted(BACKENDS), default="json",
+                        help="Formato de almacenamiento de las tareas")
+    parser.add_argument("--file",
+                        help="Archivo de tareas (por defecto tasks.json, o el propio de --storage)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="Importa tareas desde un archivo")
+    import_parser.add_argument("path", help="Archivo CSV, JSON o NDJSON")
+    import_parser.add_argument("--format", choices=FORMATS, help="Formato del archivo")
+    import_parser.add_argument("--allow-past", action="store_true",
+                               help="Acepta tareas con fecha límite pasada")
+
+    export_parser = commands.add_parser("export", help="Exporta las tareas a un archivo")
+    export_parser.add_argument("path", help="Archivo CSV, JSON o NDJSON")
+    export_parser.add_argument("--format", choices=FORMATS, help="Formato del archivo")
+
+    convert_parser = commands.add_parser("convert",
+                                         help="Copia las tareas a otro formato de almacenamiento")
+    convert_parser.add_argument("path", help="Archivo de destino; se reemplaza su contenido")
+    convert_parser.add_argument("--to", choices=sorted(BACKENDS), required=True,
+                                help="Formato de almacenamiento de destino")
+    return parser
+
+def _convert(source: Storage, backend: str, path: str) -> int:
+    """
+    Copies every task of a storage to a file of another storage backend.
+
+    The tasks are copied as stored, without going through the manager, so no
+    validation or history is involved and the conversion works both ways.
+
+    Args:
+        source (Storage): The storage to read.
+        backend (str): Name of the target backend (a key of `BACKENDS`).
+        path (str): Target file; its previous contents are replaced.
+
+    Returns:
+        int: The process exit code.
+    """
+    if os.path.abspath(path) == os.path.abspath(source.filename):
+        print("Error: el archivo de destino es el mismo que el de origen", file=sys.stderr)
+        return 1
+    try:
+        tasks = source.load_tasks()
+        create_storage(backend, path).save_tasks(tasks)
+    except (OSError, ValueError) as err:
+        print(f"Error: {err}", file=sys.stderr)
+        return 1
+    print(f"{len(tasks)} tareas convertidas a {path}")
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the import, export or convert command.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The process exit code.
+    """
+    args = _build_parser().parse_args(argv)
+    storage = create_storage(args.storage, args.file)
+    if args.command == "convert":
+        return _convert(storage, args.to, args.path)
+    manager = ProcrastinationManager(storage)
+
+    try:
+        if args.command == "import":
+            tasks = manager.add_tasks(read_records(args.path, args.format),
+                                      allow_past=args.allow_past)
+            print(f"{len(tasks)} tareas importadas desde {args.path}")
+        else:
+            count = write_records(args.path, (task_to_dict(task) for task in manager.tasks),
+                                  args.format)
+            print(f"{count} tareas exportadas a {args.path}")
+    except (OSError, ValueError) as err:
+        print(f"Error: {err}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
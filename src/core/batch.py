@@ -0,0 +1,190 @@
+"""Parses and validates the entries of the manager's batch operations."""
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple, TypeVar
+
+from src.models.task import Task, Priority
+
+_T = TypeVar("_T")
+
+EDITABLE_FIELDS: Tuple[str, ...] = ("name", "description", "deadline", "priority", "category",
+                                    "progress", "completed")
+"""Task fields that can be changed through a batch update."""
+
+def validate_all(items: Iterable[_T], check: Callable[[_T], None]) -> List[_T]:
+    """
+    Validates every item of a batch before any of them is applied.
+
+    Args:
+        items (Iterable[_T]): The batch items.
+        check (Callable[[_T], None]): Raises ValueError or KeyError for an invalid item.
+
+    Returns:
+        List[_T]: The items, once all of them are valid.
+
+    Raises:
+        ValueError: Listing the position and reason of every invalid item.
+    """
+    items = list(items)
+    errors: List[str] = []
+    for position, item in enumerate(items, 1):
+        try:
+            check(item)
+        except (ValueError, KeyError, TypeError) as exc:
+            errors.append(f"Elemento {position}: {exc}")
+    if errors:
+        raise ValueError("\n".join(errors))
+    return items
+
+def parse_deadline(value: Any) -> datetime:
+    """
+    Converts a batch deadline value to a datetime.
+
+    Args:
+        value (Any): A naive datetime, or a "YYYY-MM-DD" or ISO-8601 string without
+            a UTC offset.
+
+    Returns:
+        datetime: The deadline, in naive local time like every other task date.
+
+    Raises:
+        ValueError: If the value is not a valid date or carries a time zone.
+    """
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromisoformat(str(value))
+        except ValueError as exc:
+            raise ValueError("Formato de fecha inválido. Use YYYY-MM-DD.") from exc
+    if value.tzinfo is not None:
+        raise ValueError(f"La fecha no puede incluir zona horaria: {value.isoformat()}")
+    return value
+
+def parse_priority(value: Any, choices: Mapping[str, Priority]) -> Priority:
+    """
+    Converts a batch priority value to a Priority.
+
+    Args:
+        value (Any): A Priority, a menu choice or a priority name.
+        choices (Mapping[str, Priority]): Priorities keyed by menu choice ("1"-"3").
+
+    Returns:
+        Priority: The priority.
+
+    Raises:
+        ValueError: If the value is not a valid priority.
+    """
+    if isinstance(value, Priority):
+        return value
+    if str(value) in choices:
+        return choices[str(value)]
+    try:
+        return Priority[str(value).upper()]
+    except KeyError as exc:
+        raise ValueError(f"Prioridad inválida: {value}") from exc
+
+def parse_progress(value: Any) -> int:
+    """
+    Converts a batch progress value to an integer percentage.
+
+    Args:
+        value (Any): The progress value.
+
+    Returns:
+        int: The progress, between 0 and 100.
+
+    Raises:
+        ValueError: If the value is not an integer between 0 and 100.
+    """
+    progress = int(value)
+    if not 0 <= progress <= 100:
+        raise ValueError("El progreso debe estar entre 0 y 100")
+    return progress
+
+def parse_text(value: Any) -> str:
+    """
+    Checks a batch name, description or category value.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        str: The value.
+
+    Raises:
+        ValueError: If the value is not a non-empty string.
+    """
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"Se esperaba un texto no vacío: {value!r}")
+    return value
+
+def parse_completed(value: Any) -> bool:
+    """
+    Checks a batch completion value.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        bool: The value.
+
+    Raises:
+        ValueError: If the value is not a boolean.
+    """
+    if not isinstance(value, bool):
+        raise ValueError(f"'completed' debe ser true o false: {value!r}")
+    return value
+
+def build_task(entry: Any, allow_past: bool, priority_choices: Mapping[str, Priority]) -> Task:
+    """
+    Builds a task from a batch entry.
+
+    Args:
+        entry (Any): Task fields; "name" and "deadline" are required.
+        allow_past (bool): If True, deadlines in the past are accepted.
+        priority_choices (Mapping[str, Priority]): Priorities keyed by menu choice.
+
+    Returns:
+        Task: The new task.
+
+    Raises:
+        ValueError: If the entry is not a mapping or a field is missing or invalid.
+    """
+    if not isinstance(entry, Mapping):
+        raise ValueError(f"Se esperaba un objeto con los campos de la tarea: {entry!r}")
+    if not entry.get("name") or not entry.get("deadline"):
+        raise ValueError("Los campos 'name' y 'deadline' son obligatorios")
+    description = parse_text(entry["description"]) if "description" in entry else ""
+    category = parse_text(entry["category"]) if "category" in entry else "General"
+    task = Task(parse_text(entry["name"]), description, parse_deadline(entry["deadline"]),
+                parse_priority(entry.get("priority", Priority.MEDIA), priority_choices),
+                category, is_loading=allow_past, task_id=entry.get("id") or None)
+    task.progress = parse_progress(entry.get("progress", 0))
+    if entry.get("last_update"):
+        task.last_update = parse_deadline(entry["last_update"])
+    task.completed = parse_completed(entry.get("completed", False))
+    return task
+
+def parse_changes(values: Any, priority_choices: Mapping[str, Priority]) -> Dict[str, Any]:
+    """
+    Parses the new field values of one task of a batch update.
+
+    Args:
+        values (Any): New values keyed by field name (see EDITABLE_FIELDS).
+        priority_choices (Mapping[str, Priority]): Priorities keyed by menu choice.
+
+    Returns:
+        Dict[str, Any]: The parsed values, ready to be set on the task.
+
+    Raises:
+        ValueError: If the values are not a mapping, name a field that cannot be
+            edited or hold an invalid value.
+    """
+    if not isinstance(values, Mapping):
+        raise ValueError(f"Se esperaba un objeto con los campos a cambiar: {values!r}")
+    unknown = set(values) - set(EDITABLE_FIELDS)
+    if unknown:
+        raise ValueError(f"Campos no editables: {', '.join(sorted(unknown))}")
+    parsers: Dict[str, Callable[[Any], Any]] = {
+        "name": parse_text, "description": parse_text, "deadline": parse_deadline,
+        "priority": lambda value: parse_priority(value, priority_choices),
+        "category": parse_text, "progress": parse_progress, "completed": parse_completed}
+    return {field: parsers[field](value) for field, value in values.items()}
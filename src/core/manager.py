@@ -1,33 +1,479 @@
 """Manages tasks and categories for the Procrastination Manager application."""
+import atexit
+import functools
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict
+import threading
+import weakref
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from itertools import product
+from typing import (Any, Callable, Iterable, Iterator, List, Dict, Mapping, Optional, Tuple,
+                    TypeVar)
 
 from src.models.task import Task, Priority
-from src.data.storage import Storage
+from src.data.storage import Storage, StorageConflictError
+from src.data.archive import TaskArchive
 from src.data.category_manager import CategoryManager
+from src.data.progress_log import ProgressLog
+from src.core.staleness import StalenessTracker
+from src.core.stats import CategoryStats
+from src.core.search import SearchIndex
+from src.core.batch import EDITABLE_FIELDS, build_task, parse_changes, validate_all
+from src.core import metrics
 
 # Añadir el directorio raíz del proyecto al sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+def _synchronized(method: _F) -> _F:
+    """
+    Runs a manager method while holding the manager lock, once the tasks are loaded.
+
+    If the tasks could not be loaded, every call raises the load error, so a
+    manager whose load failed never reads or overwrites the stored tasks.
+
+    When metrics are enabled, each call is measured as the operation
+    "manager.<method name>", including the time spent waiting for the lock.
+    """
+    name = f"manager.{method.__name__}"
+
+    @functools.wraps(method)
+    def wrapper(self: "ProcrastinationManager", *args: Any, **kwargs: Any) -> Any:
+        # pylint: disable-next=protected-access
+        if not self._loaded.is_set() or self._load_error is not None:
+            self.wait_until_loaded()
+        if metrics.REGISTRY.enabled:
+            with metrics.REGISTRY.measure(name), self._lock: # pylint: disable=protected-access
+                return method(self, *args, **kwargs)
+        with self._lock: # pylint: disable=protected-access
+            return method(self, *args, **kwargs)
+    return wrapper # type: ignore[return-value]
+
+def _flush_at_exit(manager_ref: "weakref.ReferenceType[ProcrastinationManager]") -> None:
+    """Flushes pending writes of a manager that is still alive at interpreter exit."""
+    manager = manager_ref()
+    if manager is not None and manager.load_error is None:
+        manager.flush()
+
 class ProcrastinationManager:
     """
     Manages the creation, retrieval, updating, and deletion of tasks.
     Also handles category management and procrastination checks.
     """
     PRIORITY_MAP: Dict[str, Priority] = {"1": Priority.BAJA, "2": Priority.MEDIA, "3": Priority.ALTA}
+    EDITABLE_FIELDS: Tuple[str, ...] = EDITABLE_FIELDS
+    # Order in which the (completed, priority) buckets are listed by get_tasks.
+    _SORTED_BUCKETS: List[Tuple[bool, Priority]] = sorted(
+        product((False, True), Priority), key=lambda key: (key[0], key[1].value), reverse=True)
+
+    def __init__(self, storage: Optional[Storage] = None,
+                 write_delay: Optional[float] = None,
+                 progress_log: Optional[ProgressLog] = None,
+                 search_index: Optional[SearchIndex] = None,
+                 category_manager: Optional[CategoryManager] = None,
+                 background_load: bool = False,
+                 archive: Optional[TaskArchive] = None) -> None:
+        """
+        Initializes the ProcrastinationManager with storage and category manager.
+
+        Args:
+            storage (Optional[Storage]): Storage backend to use. Defaults to a JSON `Storage`.
+            write_delay (Optional[float]): Enables write-behind mode. Changes made within this
+                many seconds are coalesced and written by a background timer, and pending
+                changes are flushed at interpreter exit. None writes every change immediately.
+            progress_log (Optional[ProgressLog]): Where progress changes are recorded.
+                None disables the progress history.
+            search_index (Optional[SearchIndex]): Full-text index used by `search_tasks`.
+                Defaults to an index kept in memory only.
+            category_manager (Optional[CategoryManager]): Category registry. Defaults to
+                one kept in memory only.
+            background_load (bool): If True, tasks are loaded by a background thread and
+                the constructor returns at once. Methods that need the tasks wait for the
+                load to finish; the categories of `category_manager` and their saved task
+                counts are available immediately.
+            archive (Optional[TaskArchive]): Where `archive_completed` moves completed tasks.
+                None keeps every task in storage.
+        """
+        self.storage = storage if storage is not None else Storage()
+        self.write_delay = write_delay
+        self.progress_log = progress_log
+        self._listeners: List[Callable[[], None]] = []
+        self._version = 0
+        self._lock = threading.RLock()
+        self._pending_changed: Dict[str, Task] = {}
+        self._pending_deleted: Dict[str, Task] = {}
+        self._batch_depth = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        if write_delay is not None:
+            atexit.register(_flush_at_exit, weakref.ref(self))
+        self._tasks: Dict[str, Task] = {}
+        self._by_category: Dict[str, Dict[str, Task]] = {}
+        self._by_status: Dict[Tuple[bool, Priority], Dict[str, Task]] = {
+            key: {} for key in self._SORTED_BUCKETS}
+        self.category_manager = (category_manager if category_manager is not None
+                                 else CategoryManager())
+        self._procrastination = StalenessTracker(timedelta(seconds=5))
+        self._stats = CategoryStats()
+        self.search_index = search_index if search_index is not None else SearchIndex()
+        self.archive = archive
+        self._loaded = threading.Event()
+        self._load_error: Optional[Exception] = None
+
+        self._loader: Optional[threading.Thread] = None
+        if background_load:
+            self._loader = threading.Thread(target=self._load, name="task-loader", daemon=True)
+            self._loader.start()
+        else:
+            self._load()
+            self.wait_until_loaded()
+
+    @metrics.timed("manager.load")
+    def _load(self) -> None:
+        """Loads the tasks from storage and builds the indexes."""
+        # No lock is taken: everything that reads the indexes waits for `_loaded` first.
+        try:
+            tasks = list(self.storage.load_tasks())
+            self.search_index.load(tasks)
+            for task in tasks:
+                self._tasks[task.id] = task
+                self._index(task)
+            # The saved counts were already available while loading; this fixes them
+            # if the tasks changed since they were saved.
+            self.category_manager.set_counts({category: len(category_tasks) for category,
+                                              category_tasks in self._by_category.items()})
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # Re-raised by wait_until_loaded in the threads that need the tasks.
+            self._load_error = error
+        finally:
+            self._loaded.set()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the tasks have been loaded from storage."""
+        return self._loaded.is_set()
+
+    @property
+    def load_error(self) -> Optional[Exception]:
+        """The error raised while loading the tasks, or None if the load succeeded or is running."""
+        return self._load_error
+
+    def wait_until_loaded(self) -> None:
+        """
+        Blocks until the tasks have been loaded from storage.
+
+        Raises:
+            Exception: The error raised while loading the tasks, if any, on every call
+                made after the load failed.
+        """
+        self._loaded.wait()
+        if self._load_error is not None:
+            raise self._load_error
+
+    def _persist(self, changed: Iterable[Task] = (), deleted: Iterable[Task] = ()) -> None:
+        """
+        Records changed and deleted tasks and writes them to storage.
+
+        In write-behind mode, or inside a `batch`, the changes are only queued.
+
+        Args:
+            changed (Iterable[Task]): Tasks created or modified.
+            deleted (Iterable[Task]): Tasks deleted.
+        """
+        for task in deleted:
+            self._pending_changed.pop(task.id, None)
+            self._pending_deleted[task.id] = task
+        for task in changed:
+            self._pending_changed[task.id] = task
+        self._notify_listeners()
+
+        if self._batch_depth:
+            return
+        if self.write_delay is None:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.write_delay, self._flush_from_timer)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_from_timer(self) -> None:
+        """Flushes the pending changes once the write-behind window elapses."""
+        with self._lock:
+            self._flush_timer = None
+            if not self._batch_depth:
+                self.flush()
+
+    @_synchronized
+    def flush(self) -> None:
+        """
+        Writes every pending change to storage in a single call.
+
+        If another process changed the storage in the meantime, its changes are
+        merged and loaded into the manager.
+
+        Raises:
+            StorageConflictError: If another process changed or deleted one of the
+                pending tasks. The pending changes are discarded and the manager is
+                reloaded from storage.
+            Exception: The load error, if the tasks could not be loaded; nothing is
+                written, so the stored tasks are left untouched.
+        """
+        if self._load_error is not None:
+            raise self._load_error
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending_changed and not self._pending_deleted:
+            return
+        try:
+            merged = self.storage.save_changes(self._tasks.values(),
+                                               changed=list(self._pending_changed.values()),
+                                               deleted=list(self._pending_deleted.values()))
+        except StorageConflictError:
+            self._pending_changed.clear()
+            self._pending_deleted.clear()
+            self._reload()
+            raise
+        self._pending_changed.clear()
+        self._pending_deleted.clear()
+        if merged:
+            self._reload()
+        self.category_manager.flush()
+
+    @_synchronized
+    def refresh(self) -> bool:
+        """
+        Writes pending changes and picks up changes made by other processes.
+
+        Returns:
+            bool: True if the tasks were reloaded from storage.
+
+        Raises:
+            StorageConflictError: See `flush`.
+        """
+        if self.dirty:
+            self.flush()
+        if not self.storage.has_external_changes():
+            return False
+        self._reload()
+        return True
+
+    def _reload(self) -> None:
+        """
+        Replaces the in-memory tasks with the ones in storage.
+
+        Tasks that still exist keep their identity, so references held by
+        callers see the stored values.
+        """
+        tasks: Dict[str, Task] = {}
+        for loaded in self.storage.load_tasks():
+            task = self._tasks.pop(loaded.id, None)
+            if task is None:
+                task = loaded
+            else:
+                self._unindex(task)
+                for field in Task.__slots__:
+                    setattr(task, field, getattr(loaded, field))
+            tasks[task.id] = task
+            self._index(task)
+            self._ensure_category(task.category)
+        for task in self._tasks.values():
+            self._unindex(task)
+            self.search_index.forget(task)
+        self._tasks = tasks
+        self.category_manager.flush()
+        self._notify_listeners()
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Registers a callback invoked after the tasks change.
+
+        Listeners run on the thread that made the change, while the manager lock
+        is held, so they must return quickly and must not wait for other threads
+        that use the manager.
+
+        Args:
+            listener (Callable[[], None]): The callback.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Unregisters a callback added with `add_listener`.
 
-    def __init__(self) -> None:
-        """Initializes the ProcrastinationManager with storage and category manager."""
-        self.storage = Storage()
-        self.tasks: List[Task] = self.storage.load_tasks()
-        self.category_manager = CategoryManager()
-        self.procrastination_threshold: timedelta = timedelta(seconds=5) # pylint: disable=line-too-long
+        Args:
+            listener (Callable[[], None]): The callback.
+        """
+        self._listeners.remove(listener)
+
+    @property
+    def version(self) -> int:
+        """Counter that increases every time the tasks change, usable as a cache validator."""
+        return self._version
+
+    def _notify_listeners(self) -> None:
+        """Bumps the version and invokes every registered listener."""
+        self._version += 1
+        for listener in list(self._listeners):
+            listener()
+
+    @property
+    def dirty(self) -> bool:
+        """Whether there are changes that have not been written to storage yet."""
+        return bool(self._pending_changed or self._pending_deleted)
+
+    @contextmanager
+    def batch(self) -> Iterator["ProcrastinationManager"]:
+        """
+        Groups every change made inside the block into a single storage write.
+
+        Other threads cannot modify the manager while the block runs. The
+        changes are written when the outermost block exits, also if it exits
+        with an exception, since they are already applied in memory.
+
+        Yields:
+            ProcrastinationManager: This manager.
+        """
+        self.wait_until_loaded()
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+
+    def _record_progress(self, tasks: Iterable[Task]) -> None:
+        """
+        Records the current progress of tasks in the progress history, if enabled.
+
+        Args:
+            tasks (Iterable[Task]): Tasks whose progress was set or changed.
+        """
+        if self.progress_log is not None:
+            self.progress_log.record_many(tasks)
+
+    @_synchronized
+    def get_progress_history(self, task: Task,
+                             since: Optional[datetime] = None) -> List[Tuple[datetime, int]]:
+        """
+        Returns the recorded progress changes of a task.
+
+        Args:
+            task (Task): The task.
+            since (Optional[datetime]): Only changes at or after this time.
 
-        for task in self.tasks:
-            if task.category not in self.category_manager.get_categories():
-                self.category_manager.add_category(task.category)
+        Returns:
+            List[Tuple[datetime, int]]: (time, progress) pairs in chronological order;
+                empty if the progress history is disabled.
+        """
+        if self.progress_log is None:
+            return []
+        return self.progress_log.history(task.id, since=since)
+
+    @_synchronized
+    def get_progress_velocity(self, task: Task, days: int = 7) -> float:
+        """
+        Returns the average progress per day of a task over the last days.
+
+        Args:
+            task (Task): The task.
+            days (int): Length of the period, in days.
+
+        Returns:
+            float: Percentage points per day; 0 if the progress history is disabled.
+        """
+        if self.progress_log is None:
+            return 0.0
+        return self.progress_log.velocity(task.id, days)
+
+    @_synchronized
+    def get_daily_activity(self, days: int = 7) -> Dict[str, Dict[date, int]]:
+        """
+        Returns how many progress changes were recorded per category and day.
+
+        Args:
+            days (int): Length of the period, in days, including today.
+
+        Returns:
+            Dict[str, Dict[date, int]]: Changes per day for each active category; empty if
+                the progress history is disabled.
+        """
+        if self.progress_log is None:
+            return {}
+        return self.progress_log.daily_activity(days)
+
+    @property
+    def procrastination_threshold(self) -> timedelta:
+        """Time without updates after which a pending task is considered procrastinated."""
+        return self._procrastination.threshold
+
+    @procrastination_threshold.setter
+    def procrastination_threshold(self, value: timedelta) -> None:
+        """Changes the procrastination threshold."""
+        self.wait_until_loaded()
+        with self._lock:
+            self._procrastination.threshold = value
+            self._notify_listeners()
+
+    def _index(self, task: Task) -> None:
+        """
+        Adds a task to the category, status, staleness and search indexes and to the
+        statistics and category counts.
+
+        Args:
+            task (Task): The task to index.
+        """
+        category_tasks = self._by_category.setdefault(task.category, {})
+        category_tasks[task.id] = task
+        if self._loaded.is_set():
+            self.category_manager.set_count(task.category, len(category_tasks))
+        self._by_status[(task.completed, task.priority)][task.id] = task
+        self._procrastination.track(task)
+        self._stats.add(task)
+        self.search_index.add(task)
+
+    def _unindex(self, task: Task) -> None:
+        """
+        Removes a task from the category, status, staleness and search indexes and from
+        the statistics and category counts.
+
+        Must be called before changing the indexed fields of the task.
+
+        Args:
+            task (Task): The task to remove.
+        """
+        category_tasks = self._by_category[task.category]
+        del category_tasks[task.id]
+        if not category_tasks:
+            del self._by_category[task.category]
+        if self._loaded.is_set():
+            self.category_manager.set_count(task.category, len(category_tasks))
+        del self._by_status[(task.completed, task.priority)][task.id]
+        self._procrastination.untrack(task)
+        self._stats.remove(task)
+        self.search_index.remove(task)
+
+    @property
+    @_synchronized
+    def tasks(self) -> List[Task]:
+        """List of all tasks, in insertion order."""
+        return list(self._tasks.values())
+
+    @_synchronized
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """
+        Retrieves a task by its identifier.
+
+        Args:
+            task_id (str): The identifier of the task.
+
+        Returns:
+            Optional[Task]: The task, or None if there is no task with that identifier.
+        """
+        return self._tasks.get(task_id)
 
     def _validate_deadline(self, deadline_str: str) -> datetime:
         """
@@ -48,6 +494,7 @@ class ProcrastinationManager:
             raise ValueError("Formato de fecha inválido. Use YYYY-MM-DD.") from exc # pylint: disable=line-too-long
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
+    @_synchronized
     def add_task(self, name: str, description: str, deadline_str: str,
                  priority_choice: str, category: str) -> None:
         """
@@ -61,29 +508,35 @@ class ProcrastinationManager:
             category (str): The category of the task.
         """
         deadline = self._validate_deadline(deadline_str)
-
-        if category not in self.category_manager.get_categories():
-            self.category_manager.add_category(category)
+        self._ensure_category(category)
 
         priority = self.PRIORITY_MAP.get(priority_choice, Priority.MEDIA)
 
         task = Task(name, description, deadline, priority, category)
-        self.tasks.append(task)
-        self.storage.save_tasks(self.tasks)
+        self._tasks[task.id] = task
+        self._index(task)
+        self._record_progress([task])
+        self._persist(changed=[task])
 
+    @_synchronized
     def get_tasks(self, sort_by_priority: bool = True) -> List[Task]:
         """
         Retrieves a list of tasks, optionally sorted by priority.
 
+        Sorted listings are assembled from the status buckets, so no sort is
+        performed; within a bucket tasks keep the order in which they entered it.
+
         Args:
             sort_by_priority (bool): If True, tasks are sorted by completion status and priority.
 
         Returns:
             List[Task]: A list of tasks.
         """
-        return sorted(self.tasks, key=lambda x: (x.completed, x.priority.value), # pylint: disable=line-too-long
-                      reverse=True) if sort_by_priority else self.tasks
+        if not sort_by_priority:
+            return self.tasks
+        return [task for key in self._SORTED_BUCKETS for task in self._by_status[key].values()]
 
+    @_synchronized
     def get_priority_tasks(self, priority: Priority) -> List[Task]:
         """
         Retrieves tasks filtered by a specific priority.
@@ -94,8 +547,9 @@ class ProcrastinationManager:
         Returns:
             List[Task]: A list of tasks with the specified priority that are not completed.
         """
-        return [task for task in self.tasks if task.priority == priority and not task.completed]
+        return list(self._by_status[(False, priority)].values())
 
+    @_synchronized
     def get_category_tasks(self, category: str) -> List[Task]:
         """
         Retrieves tasks filtered by a specific category.
@@ -106,23 +560,91 @@ class ProcrastinationManager:
         Returns:
             List[Task]: A list of tasks belonging to the specified category.
         """
-        return [t for t in self.tasks if t.category == category]
+        return list(self._by_category.get(category, {}).values())
+
+    @_synchronized
+    def find_tasks(self, text: str, tasks: Optional[Iterable[Task]] = None) -> List[Task]:
+        """
+        Finds tasks whose name, description or category match every word of a text.
+
+        Matching follows `search_tasks`, but the tasks keep the given order instead
+        of being ranked.
+
+        Args:
+            text (str): The words to look for. An empty text matches every task.
+            tasks (Optional[Iterable[Task]]): Tasks to search, in the order to return them.
+                Defaults to all tasks in insertion order.
+
+        Returns:
+            List[Task]: The matching tasks.
+        """
+        tasks = list(self._tasks.values() if tasks is None else tasks)
+        if not text.strip():
+            return tasks
+        index = self.search_index
+        if any(task.id not in self._tasks for task in tasks):
+            # Tasks outside the manager, such as archived ones, are not in its index.
+            index = SearchIndex()
+            index.load(tasks)
+        matches = set(index.search(text))
+        return [task for task in tasks if task.id in matches]
+
+    @_synchronized
+    def search_tasks(self, query: str, limit: Optional[int] = None) -> List[Task]:
+        """
+        Searches tasks by name, description and category.
+
+        Matching ignores case and accents, accepts word prefixes ("prog" finds
+        "programar") and tolerates one typo in words of four or more letters.
+
+        Args:
+            query (str): The words to look for; every word must match.
+            limit (Optional[int]): Maximum number of results.
 
+        Returns:
+            List[Task]: The matching tasks, best matches first.
+        """
+        return [self._tasks[task_id] for task_id in self.search_index.search(query, limit)]
+
+    @_synchronized
     def check_procrastination(self) -> List[Task]:
         """
         Checks for tasks that are considered procrastinated.
 
+        Only the tasks whose threshold expired since the previous check are
+        examined; the rest of the pending tasks are not visited.
+
         Returns:
             List[Task]: A list of procrastinated tasks.
         """
-        now = datetime.now()
-        procrastinated_tasks: List[Task] = []
-        for task in self.tasks:
-            if not task.completed and (not task.last_update or
-                                       (now - task.last_update) > self.procrastination_threshold):
-                procrastinated_tasks.append(task)
-        return procrastinated_tasks
+        return self._procrastination.stale()
 
+    @_synchronized
+    def next_procrastination_expiry(self) -> Optional[datetime]:
+        """
+        Returns when the next pending task will be considered procrastinated.
+
+        Returns:
+            Optional[datetime]: The earliest upcoming expiry, or None if no pending task
+                can become procrastinated.
+        """
+        return self._procrastination.next_expiry()
+
+    @_synchronized
+    def get_category_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns task statistics per category.
+
+        The counters are maintained as tasks change, so this does not walk the
+        task list.
+
+        Returns:
+            Dict[str, Dict[str, int]]: For each category with tasks, its total,
+                completed, pending, high priority and procrastinated counts.
+        """
+        return self._stats.get()
+
+    @_synchronized
     def update_task_progress(self, task: Task, new_progress: int) -> None:
         """
         Updates the progress of a given task.
@@ -131,9 +653,15 @@ class ProcrastinationManager:
             task (Task): The task to update.
             new_progress (int): The new progress percentage.
         """
-        task.update_progress(new_progress)
-        self.storage.save_tasks(self.tasks)
+        self._unindex(task)
+        try:
+            task.update_progress(new_progress)
+        finally:
+            self._index(task)
+        self._record_progress([task])
+        self._persist(changed=[task])
 
+    @_synchronized
     def complete_task(self, task: Task) -> None:
         """
         Marks a task as completed.
@@ -141,11 +669,15 @@ class ProcrastinationManager:
         Args:
             task (Task): The task to mark as completed.
         """
+        self._unindex(task)
         task.completed = True
         task.last_update = datetime.now()
-        self.storage.save_tasks(self.tasks)
+        self._index(task)
+        self._record_progress([task])
+        self._persist(changed=[task])
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
+    @_synchronized
     def edit_task(self, task: Task, new_name: str, new_description: str, new_deadline_str: str,
                   new_priority_choice: str, new_category: str) -> None:
         """
@@ -160,21 +692,22 @@ class ProcrastinationManager:
             new_category (str): The new category for the task.
         """
         new_deadline = self._validate_deadline(new_deadline_str)
-
-        if new_category not in self.category_manager.get_categories():
-            self.category_manager.add_category(new_category)
+        self._ensure_category(new_category)
 
         new_priority = self.PRIORITY_MAP.get(new_priority_choice, task.priority)
 
+        self._unindex(task)
         task.name = new_name
         task.description = new_description
         task.deadline = new_deadline
         task.priority = new_priority
         task.category = new_category
         task.last_update = datetime.now()
+        self._index(task)
 
-        self.storage.save_tasks(self.tasks)
+        self._persist(changed=[task])
 
+    @_synchronized
     def delete_task(self, task: Task) -> None:
         """
         Deletes a task from the manager.
@@ -182,5 +715,172 @@ class ProcrastinationManager:
         Args:
             task (Task): The task to delete.
         """
-        self.tasks.remove(task)
-        self.storage.save_tasks(self.tasks)
+        del self._tasks[task.id]
+        self._unindex(task)
+        self.search_index.forget(task)
+        self._persist(deleted=[task])
+
+    @_synchronized
+    def archive_completed(self, older_than: timedelta = timedelta(0)) -> List[Task]:
+        """
+        Moves completed tasks from storage to the archive.
+
+        Archived tasks leave every listing, statistic and search of the manager,
+        and are no longer loaded or written with the active tasks. They are
+        written to the archive before they are removed from storage, so an
+        interruption can at worst leave a task in both.
+
+        Args:
+            older_than (timedelta): Only tasks completed at least this long ago are moved.
+
+        Returns:
+            List[Task]: The archived tasks.
+
+        Raises:
+            ValueError: If the manager has no archive.
+        """
+        if self.archive is None:
+            raise ValueError("No hay un archivo histórico configurado")
+        cutoff = datetime.now() - older_than
+        archived = [task for priority in Priority
+                    for task in self._by_status[(True, priority)].values()
+                    if task.last_update <= cutoff]
+        if not archived:
+            return []
+        self.archive.add(archived)
+        for task in archived:
+            del self._tasks[task.id]
+            self._unindex(task)
+            self.search_index.forget(task)
+        self._persist(deleted=archived)
+        return archived
+
+    def get_archived_tasks(self, since: Optional[datetime] = None,
+                           until: Optional[datetime] = None) -> List[Task]:
+        """
+        Loads archived tasks, reading only the archive segments of the interval.
+
+        Args:
+            since (Optional[datetime]): If given, only tasks completed from this moment.
+            until (Optional[datetime]): If given, only tasks completed up to this moment.
+
+        Returns:
+            List[Task]: The archived tasks, oldest month first; empty if there is no archive.
+        """
+        if self.archive is None:
+            return []
+        return self.archive.load(since, until)
+
+    def _ensure_category(self, category: str) -> None:
+        """
+        Registers a category if it does not exist yet.
+
+        Args:
+            category (str): The category name.
+        """
+        if not self.category_manager.has_category(category):
+            self.category_manager.add_category(category)
+
+    @_synchronized
+    def add_tasks(self, entries: Iterable[Mapping[str, Any]],
+                  allow_past: bool = False) -> List[Task]:
+        """
+        Adds several tasks and persists them with a single write.
+
+        Every entry is validated before any task is added, so an invalid entry
+        leaves the manager unchanged.
+
+        Args:
+            entries (Iterable[Mapping[str, Any]]): Task fields: "name", "deadline" and optionally
+                "description", "priority", "category", "progress", "completed",
+                "last_update" and "id".
+            allow_past (bool): If True, deadlines in the past are accepted.
+
+        Returns:
+            List[Task]: The added tasks.
+
+        Raises:
+            ValueError: If any entry is invalid.
+        """
+        tasks: List[Task] = []
+        seen_ids = set()
+
+        def build(entry: Mapping[str, Any]) -> None:
+            task = build_task(entry, allow_past, self.PRIORITY_MAP)
+            if task.id in self._tasks:
+                raise ValueError(f"Ya existe una tarea con id {task.id}")
+            if task.id in seen_ids:
+                raise ValueError(f"Id repetido en el lote: {task.id}")
+            seen_ids.add(task.id)
+            tasks.append(task)
+
+        validate_all(entries, build)
+        for task in tasks:
+            self._ensure_category(task.category)
+            self._tasks[task.id] = task
+            self._index(task)
+        self._record_progress(tasks)
+        self._persist(changed=tasks)
+        return tasks
+
+    @_synchronized
+    def update_tasks(self, changes: Mapping[str, Mapping[str, Any]]) -> List[Task]:
+        """
+        Updates several tasks and persists them with a single write.
+
+        Every change is validated before any task is modified.
+
+        Args:
+            changes (Mapping[str, Mapping[str, Any]]): New field values (see EDITABLE_FIELDS)
+                keyed by task identifier.
+
+        Returns:
+            List[Task]: The updated tasks.
+
+        Raises:
+            ValueError: If a task does not exist or a value is invalid.
+        """
+        parsed: List[Tuple[Task, Dict[str, Any]]] = []
+
+        def parse(task_id: str) -> None:
+            if task_id not in self._tasks:
+                raise ValueError(f"No existe una tarea con id {task_id}")
+            parsed.append((self._tasks[task_id],
+                           parse_changes(changes[task_id], self.PRIORITY_MAP)))
+
+        validate_all(changes, parse)
+        now = datetime.now()
+        for task, values in parsed:
+            self._unindex(task)
+            for field, value in values.items():
+                setattr(task, field, value)
+            task.last_update = now
+            self._ensure_category(task.category)
+            self._index(task)
+        updated = [task for task, _ in parsed]
+        self._record_progress(task for task, values in parsed
+                              if "progress" in values or "completed" in values)
+        self._persist(changed=updated)
+        return updated
+
+    @_synchronized
+    def delete_tasks(self, task_ids: Iterable[str]) -> None:
+        """
+        Deletes several tasks and persists the deletion with a single write.
+
+        Args:
+            task_ids (Iterable[str]): Identifiers of the tasks to delete.
+
+        Raises:
+            ValueError: If any identifier does not exist; no task is deleted then.
+        """
+        def check(task_id: str) -> None:
+            if task_id not in self._tasks:
+                raise ValueError(f"No existe una tarea con id {task_id}")
+
+        ids = list(dict.fromkeys(validate_all(task_ids, check)))
+        deleted = [self._tasks.pop(task_id) for task_id in ids]
+        for task in deleted:
+            self._unindex(task)
+            self.search_index.forget(task)
+        self._persist(deleted=deleted)
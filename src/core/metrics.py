@@ -0,0 +1,287 @@
+"""Lightweight instrumentation of storage operations and manager methods."""
+import functools
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+BUCKETS: Tuple[float, ...] = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                              0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds, in seconds, of the latency histogram buckets (plus an implicit +Inf)."""
+UNATTRIBUTED = "other"
+"""Operation that receives the bytes counted outside any measured operation."""
+PREFIX = "procrastination"
+"""Prefix of the exported metric names."""
+
+class OperationStats:
+    """Counters of one operation."""
+
+    __slots__ = ('count', 'errors', 'seconds', 'buckets', 'bytes_read', 'bytes_written')
+
+    def __init__(self) -> None:
+        """Initializes the counters at zero."""
+        self.count = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.buckets: List[int] = [0] * (len(BUCKETS) + 1)
+        """Calls per latency bucket; the last one counts calls slower than every bound."""
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def copy(self) -> "OperationStats":
+        """Returns an independent copy of the counters."""
+        copy = OperationStats()
+        copy.count, copy.errors, copy.seconds = self.count, self.errors, self.seconds
+        copy.buckets = list(self.buckets)
+        copy.bytes_read, copy.bytes_written = self.bytes_read, self.bytes_written
+        return copy
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Estimates a latency quantile from the histogram.
+
+        Args:
+            fraction (float): The quantile, between 0 and 1 (0.95 for the 95th percentile).
+
+        Returns:
+            float: Upper bound of the bucket holding the quantile, in seconds; infinity if
+                it falls beyond the last bound, and 0 if nothing was measured.
+        """
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bound, calls in zip(BUCKETS, self.buckets):
+            seen += calls
+            if seen >= target:
+                return bound
+        return float('inf')
+
+class MetricsRegistry:
+    """
+    Collects call counts, latency histograms and bytes transferred per operation.
+
+    A disabled registry records nothing, and the `timed` wrappers only check
+    the `enabled` flag before calling the wrapped function, so instrumented
+    code costs a single attribute lookup per call until metrics are enabled.
+
+    Bytes are attributed to the innermost operation being measured in the
+    calling thread, so a storage backend reports them with `add_bytes` without
+    knowing which public method is running.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        Initializes an empty registry.
+
+        Args:
+            enabled (bool): Whether measurements are recorded from the start.
+        """
+        self.enabled = enabled
+        self._operations: Dict[str, OperationStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self) -> None:
+        """Starts recording measurements."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stops recording measurements; the counters collected so far are kept."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Discards every counter."""
+        with self._lock:
+            self._operations = {}
+
+    def _stats(self, name: str) -> OperationStats:
+        """Returns the counters of an operation, creating them. Requires the lock."""
+        stats = self._operations.get(name)
+        if stats is None:
+            stats = self._operations[name] = OperationStats()
+        return stats
+
+    def _active(self) -> List[str]:
+        """Returns the stack of operations being measured in the calling thread."""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """
+        Measures a block of code as one call of an operation.
+
+        A block that raises is counted as an error, and its duration is still
+        recorded.
+
+        Args:
+            name (str): Name of the operation, such as "storage.load_tasks".
+        """
+        if not self.enabled:
+            yield
+            return
+        stack = self._active()
+        stack.append(name)
+        failed = True
+        start = time.perf_counter()
+        try:
+            yield
+            failed = False
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            self.observe(name, elapsed, failed)
+
+    def observe(self, name: str, seconds: float, failed: bool = False) -> None:
+        """
+        Records one call of an operation.
+
+        Args:
+            name (str): Name of the operation.
+            seconds (float): How long the call took.
+            failed (bool): Whether the call raised an exception.
+        """
+        with self._lock:
+            stats = self._stats(name)
+            stats.count += 1
+            stats.errors += failed
+            stats.seconds += seconds
+            stats.buckets[bisect_left(BUCKETS, seconds)] += 1
+
+    def add_bytes(self, read: int = 0, written: int = 0) -> None:
+        """
+        Adds bytes read or written to the operation being measured in this thread.
+
+        Args:
+            read (int): Bytes read.
+            written (int): Bytes written.
+        """
+        if not self.enabled:
+            return
+        stack = self._active()
+        with self._lock:
+            stats = self._stats(stack[-1] if stack else UNATTRIBUTED)
+            stats.bytes_read += read
+            stats.bytes_written += written
+
+    def snapshot(self) -> Dict[str, OperationStats]:
+        """
+        Returns a consistent copy of every counter.
+
+        Returns:
+            Dict[str, OperationStats]: The counters of each operation, by name, sorted.
+        """
+        with self._lock:
+            return {name: self._operations[name].copy() for name in sorted(self._operations)}
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        Returns the counters as JSON-serializable data.
+
+        Returns:
+            Dict[str, Any]: Whether the registry is enabled and, for each operation, its
+                calls, errors, total seconds, calls per bucket (keyed by upper bound) and
+                bytes read and written.
+        """
+        bounds = [str(bound) for bound in BUCKETS] + ["+Inf"]
+        return {"enabled": self.enabled,
+                "operations": {name: {"count": stats.count, "errors": stats.errors,
+                                      "seconds": stats.seconds,
+                                      "buckets": dict(zip(bounds, stats.buckets)),
+                                      "bytes_read": stats.bytes_read,
+                                      "bytes_written": stats.bytes_written}
+                               for name, stats in self.snapshot().items()}}
+
+    def to_prometheus(self) -> str:
+        """
+        Returns the counters in the Prometheus text exposition format.
+
+        Returns:
+            str: A latency histogram and error, bytes read and bytes written counters,
+                labelled by operation.
+        """
+        operations = self.snapshot()
+        lines = [f"# HELP {PREFIX}_operation_seconds Duration of each operation.",
+                 f"# TYPE {PREFIX}_operation_seconds histogram"]
+        for name, stats in operations.items():
+            label = f'operation="{name}"'
+            cumulative = 0
+            for bound, calls in zip(BUCKETS + (float('inf'),), stats.buckets):
+                cumulative += calls
+                upper = "+Inf" if bound == float('inf') else repr(bound)
+                lines.append(f'{PREFIX}_operation_seconds_bucket{{{label},le="{upper}"}} '
+                             f'{cumulative}')
+            lines.append(f"{PREFIX}_operation_seconds_sum{{{label}}} {stats.seconds!r}")
+            lines.append(f"{PREFIX}_operation_seconds_count{{{label}}} {stats.count}")
+        for metric, help_text, attribute in (
+                ("operation_errors_total", "Calls that raised an exception.", "errors"),
+                ("bytes_read_total", "Bytes read from storage.", "bytes_read"),
+                ("bytes_written_total", "Bytes written to storage.", "bytes_written")):
+            lines.append(f"# HELP {PREFIX}_{metric} {help_text}")
+            lines.append(f"# TYPE {PREFIX}_{metric} counter")
+            for name, stats in operations.items():
+                lines.append(f'{PREFIX}_{metric}{{operation="{name}"}} '
+                             f'{getattr(stats, attribute)}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, filename: str) -> None:
+        """
+        Writes the counters to a file, replacing it atomically.
+
+        Files ending in ".json" get the JSON dump; any other name gets the
+        Prometheus text format, suitable for a node exporter textfile collector.
+
+        Args:
+            filename (str): The file to write.
+        """
+        # Imported here because the storage module itself is instrumented.
+        from src.data.storage import atomic_open # pylint: disable=import-outside-toplevel
+        with atomic_open(filename, fsync=False) as file:
+            if filename.endswith(".json"):
+                json.dump(self.to_json(), file, indent=2)
+            else:
+                file.write(self.to_prometheus())
+
+REGISTRY = MetricsRegistry()
+"""Registry used by the `timed` decorators of the application; disabled until enabled."""
+
+def timed(name: str, registry: Optional[MetricsRegistry] = None) -> Callable[[_F], _F]:
+    """
+    Decorates a function so that each call is measured as an operation.
+
+    Args:
+        name (str): Name of the operation.
+        registry (Optional[MetricsRegistry]): Where calls are recorded. Defaults to
+            `REGISTRY`.
+
+    Returns:
+        Callable[[_F], _F]: The decorator.
+    """
+    target = registry if registry is not None else REGISTRY
+
+    def decorate(function: _F) -> _F:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not target.enabled:
+                return function(*args, **kwargs)
+            with target.measure(name):
+                return function(*args, **kwargs)
+        return wrapper # type: ignore[return-value]
+    return decorate
+
+def add_bytes(read: int = 0, written: int = 0) -> None:
+    """
+    Adds bytes read or written to the operation being measured by `REGISTRY`.
+
+    Args:
+        read (int): Bytes read.
+        written (int): Bytes written.
+    """
+    REGISTRY.add_bytes(read, written)
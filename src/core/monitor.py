@@ -0,0 +1,197 @@
+"""Background service that raises procrastination alerts as soon as they are due."""
+import json
+import sys
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, TextIO, TYPE_CHECKING
+
+from src.models.task import Task, Priority
+
+if TYPE_CHECKING:
+    from src.core.manager import ProcrastinationManager
+
+class Notifier(ABC):
+    """Receives procrastination alerts. Subclasses implement `notify`."""
+
+    @abstractmethod
+    def notify(self, tasks: List[Task]) -> None:
+        """
+        Delivers an alert for tasks that just became procrastinated.
+
+        Args:
+            tasks (List[Task]): The newly procrastinated tasks.
+        """
+
+class ConsoleNotifier(Notifier):
+    """Prints alerts to a text stream."""
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """
+        Initializes the notifier.
+
+        Args:
+            stream (Optional[TextIO]): Where alerts are written. Defaults to standard output.
+        """
+        self.stream = stream
+
+    def notify(self, tasks: List[Task]) -> None:
+        """Prints one line per task."""
+        stream = self.stream if self.stream is not None else sys.stdout
+        for task in tasks:
+            urgent = " ¡requiere atención inmediata!" if task.priority == Priority.ALTA else ""
+            print(f"\n¡Alerta de procrastinación! - {task.name} ({task.priority.name}){urgent}",
+                  file=stream, flush=True)
+
+class LogFileNotifier(Notifier):
+    """Appends alerts to a log file."""
+
+    def __init__(self, filename: str) -> None:
+        """
+        Initializes the notifier.
+
+        Args:
+            filename (str): The log file.
+        """
+        self.filename = filename
+
+    def notify(self, tasks: List[Task]) -> None:
+        """Appends one timestamped line per task."""
+        now = datetime.now().isoformat(timespec='seconds')
+        with open(self.filename, 'a', encoding='utf-8') as file:
+            for task in tasks:
+                file.write(f"{now} procrastination id={task.id} priority={task.priority.name} "
+                           f"category={task.category} name={task.name}\n")
+
+class WebhookNotifier(Notifier):
+    """Posts alerts as JSON to an HTTP endpoint, such as a local webhook receiver."""
+
+    def __init__(self, url: str, timeout: float = 5.0) -> None:
+        """
+        Initializes the notifier.
+
+        Args:
+            url (str): Endpoint that receives the POST requests.
+            timeout (float): Request timeout, in seconds.
+        """
+        self.url = url
+        self.timeout = timeout
+
+    def notify(self, tasks: List[Task]) -> None:
+        """Sends a single request listing every task."""
+        # Imported here because urllib pulls in http, email and ssl, which only
+        # this notifier needs.
+        import urllib.request  # pylint: disable=import-outside-toplevel
+        payload = {"event": "procrastination",
+                   "tasks": [{"id": task.id, "name": task.name, "category": task.category,
+                              "priority": task.priority.name,
+                              "last_update": task.last_update.isoformat()} for task in tasks]}
+        request = urllib.request.Request(self.url, data=json.dumps(payload).encode('utf-8'),
+                                         headers={"Content-Type": "application/json"},
+                                         method="POST")
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+class ProcrastinationMonitor:
+    """
+    Watches a manager from a background thread and alerts when tasks become procrastinated.
+
+    The thread sleeps until the earliest procrastination expiry reported by the
+    manager and is woken early whenever tasks change. With no pending expiry it
+    waits without a timeout, so an idle monitor does not wake up at all. Each
+    task is alerted once per procrastination episode.
+    """
+
+    def __init__(self, manager: "ProcrastinationManager",
+                 notifiers: Iterable[Notifier] = ()) -> None:
+        """
+        Initializes a stopped monitor.
+
+        Args:
+            manager (ProcrastinationManager): The manager to watch.
+            notifiers (Iterable[Notifier]): Where alerts are delivered.
+        """
+        self.manager = manager
+        self.notifiers = list(notifiers)
+        self.errors: List[Exception] = []
+        self._condition = threading.Condition()
+        self._changed = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        # Last update of each alerted task, which identifies its procrastination episode.
+        self._alerted: Dict[str, datetime] = {}
+
+    def start(self) -> None:
+        """Starts the monitor thread and subscribes to manager changes."""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self.manager.add_listener(self.wake)
+        self._thread = threading.Thread(target=self._run, name="procrastination-monitor",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the monitor thread and waits for it to finish."""
+        thread = self._thread
+        if thread is None:
+            return
+        self.manager.remove_listener(self.wake)
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        thread.join()
+        self._thread = None
+
+    def wake(self) -> None:
+        """Makes the monitor re-examine the manager, for example after tasks changed."""
+        with self._condition:
+            self._changed = True
+            self._condition.notify()
+
+    def check(self) -> List[Task]:
+        """
+        Alerts the tasks that became procrastinated since the previous check.
+
+        Returns:
+            List[Task]: The tasks that were alerted.
+        """
+        stale = self.manager.check_procrastination()
+        new = [task for task in stale if self._alerted.get(task.id) != task.last_update]
+        self._alerted = {task.id: task.last_update for task in stale}
+        if new:
+            for notifier in self.notifiers:
+                try:
+                    notifier.notify(new)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    # A failing notifier must not stop the monitor or the other notifiers.
+                    self.errors.append(error)
+        return new
+
+    def _run(self) -> None:
+        """Monitor thread: alerts due tasks, then sleeps until the next expiry or change."""
+        while True:
+            with self._condition:
+                if self._stopping:
+                    return
+                self._changed = False
+            # The manager is queried without holding the condition, because manager
+            # listeners call `wake` while holding the manager lock.
+            try:
+                self.check()
+                expiry = self.manager.next_procrastination_expiry()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                if error is not self.manager.load_error:
+                    raise
+                # A manager whose load failed raises its load error on every query,
+                # so there is nothing left to watch.
+                self.errors.append(error)
+                print(f"Monitor de procrastinación detenido: {error}", file=sys.stderr)
+                return
+            with self._condition:
+                if self._stopping or self._changed:
+                    continue
+                if expiry is None:
+                    self._condition.wait()
+                else:
+                    self._condition.wait(max((expiry - datetime.now()).total_seconds(), 0.0))
@@ -0,0 +1,348 @@
+"""Inverted index for accent-insensitive search over task text."""
+import json
+import re
+import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+from heapq import nsmallest
+from datetime import datetime
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.models.task import Task
+from src.data.storage import atomic_open
+
+_WORD = re.compile(r"\w+")
+# Words as written, including combining accents that follow a letter in decomposed text.
+_RAW_WORD = re.compile(r"[\w\u0300-\u036f]+")
+# Score of each kind of term match; a task's score is the sum over the query terms.
+_EXACT, _PREFIX, _FUZZY = 3, 2, 1
+
+def normalize(text: str) -> str:
+    """
+    Lower-cases a text and removes its accents, so that "Canción" matches "cancion".
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        str: The normalized text.
+    """
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+@lru_cache(maxsize=1 << 16)
+def _normalize_word(word: str) -> Tuple[str, ...]:
+    """Normalizes a single word, which may split in several (e.g. "1½" gives "1", "1", "2")."""
+    return tuple(_WORD.findall(normalize(word)))
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits a text into normalized words.
+
+    Words are normalized one at a time through a cache, because task texts
+    repeat a small vocabulary and normalization is the most expensive step.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        List[str]: The words, in order.
+    """
+    return [token for word in _RAW_WORD.findall(text) for token in _normalize_word(word)]
+
+def _deletions(token: str) -> Set[str]:
+    """Returns the strings obtained by deleting one character of a token."""
+    return {token[:i] + token[i + 1:] for i in range(len(token))}
+
+def _within_one_edit(first: str, second: str) -> bool:
+    """
+    Checks whether two strings differ by at most one insertion, deletion, substitution
+    or swap of adjacent characters.
+    """
+    if len(first) > len(second):
+        first, second = second, first
+    if len(second) - len(first) > 1:
+        return False
+    start = 0
+    while start < len(first) and first[start] == second[start]:
+        start += 1
+    if len(first) < len(second):
+        return first[start:] == second[start + 1:]
+    # Same length: a single substitution, or two adjacent characters swapped.
+    return (first[start + 1:] == second[start + 1:]
+            or (first[start:start + 2] == second[start + 1:start + 2] + second[start:start + 1]
+                and first[start + 2:] == second[start + 2:]))
+
+class SearchIndex:
+    """
+    Inverted index over the name, description and category of tasks.
+
+    Text is normalized with `normalize`, so matching ignores case and accents.
+    Each query word matches index words that are equal to it, start with it,
+    or (for words of four or more letters with no other match) differ from it
+    by one edit. Fuzzy candidates come from a deletion index, built on the
+    first fuzzy lookup, so they are found without comparing against the whole
+    vocabulary.
+
+    The index does not keep a copy of the text: `remove` tokenizes the task
+    again, so it must be called before the indexed fields of the task change.
+
+    If a filename is given, `save` writes the postings there and `load` reuses
+    them for the tasks whose last update did not change since.
+    """
+
+    MIN_FUZZY_LENGTH = 4
+
+    def __init__(self, filename: Optional[str] = None) -> None:
+        """
+        Initializes an empty index.
+
+        Args:
+            filename (Optional[str]): File where the index is persisted, or None to keep it
+                in memory only.
+        """
+        self.filename = filename
+        self._postings: Dict[str, Set[str]] = {}
+        self._deletes: Optional[Dict[str, Set[str]]] = None
+        self._stamps: Dict[str, datetime] = {}
+        self._order: Dict[str, int] = {}
+        self._counter = count()
+        # Sorted words for prefix lookups. New words are sorted in on the next search
+        # and removed words stay listed (and are skipped) until there are many of them.
+        self._vocabulary: List[str] = []
+        self._new_words: List[str] = []
+        self._removed_words: Set[str] = set()
+
+    def __len__(self) -> int:
+        """Returns the number of indexed tasks."""
+        return len(self._stamps)
+
+    def load(self, tasks: Iterable[Task]) -> None:
+        """
+        Indexes tasks, reusing the saved index for those that did not change.
+
+        The saved postings of tasks that changed or no longer exist are discarded;
+        a missing or unreadable file just means every task is tokenized.
+
+        Args:
+            tasks (Iterable[Task]): The tasks, in the order used to break ties.
+        """
+        tasks = list(tasks)
+        saved = self._read()
+        if saved is not None:
+            stamps, postings = saved
+            current = {task.id for task in tasks if stamps.get(task.id) == task.last_update}
+            outdated = stamps.keys() - current
+            for word, ids in postings.items():
+                ids.difference_update(outdated)
+                if ids:
+                    self._add_word(word, ids)
+            self._stamps.update((task_id, stamps[task_id]) for task_id in current)
+        for task in tasks:
+            self.add(task)
+
+    def _read(self) -> Optional[Tuple[Dict[str, datetime], Dict[str, Set[str]]]]:
+        """Reads the saved stamps and postings, or returns None if there are none."""
+        if self.filename is None:
+            return None
+        try:
+            with open(self.filename, encoding='utf-8') as file:
+                data = json.load(file)
+            ids = [task_id for task_id, _ in data["tasks"]]
+            stamps = {task_id: datetime.fromisoformat(stamp) for task_id, stamp in data["tasks"]}
+            return stamps, {word: {ids[number] for number in numbers}
+                            for word, numbers in data["postings"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, IndexError):
+            return None
+
+    def save(self) -> None:
+        """
+        Writes the index to its file, if one was given.
+
+        Postings refer to tasks by their position in the task list, which keeps
+        the file a fraction of the size it would have with identifiers.
+        """
+        if self.filename is None:
+            return
+        numbers = {task_id: number for number, task_id in enumerate(self._stamps)}
+        data = {"tasks": [[task_id, stamp.isoformat()] for task_id, stamp in self._stamps.items()],
+                "postings": {word: [numbers[task_id] for task_id in ids]
+                             for word, ids in self._postings.items()}}
+        with atomic_open(self.filename, fsync=False) as file:
+            json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
+
+    @staticmethod
+    def _tokens(task: Task) -> Set[str]:
+        """Returns the distinct words of the indexed fields of a task."""
+        return set(tokenize(f"{task.name} {task.description} {task.category}"))
+
+    def _add_word(self, word: str, ids: Set[str]) -> None:
+        """Registers a word that was not indexed, with the tasks that contain it."""
+        self._postings[word] = ids
+        if word in self._removed_words:
+            self._removed_words.discard(word)
+        else:
+            self._new_words.append(word)
+        if self._deletes is not None:
+            for variant in _deletions(word):
+                self._deletes.setdefault(variant, set()).add(word)
+
+    def _remove_word(self, word: str) -> None:
+        """Unregisters a word that no task contains any more."""
+        del self._postings[word]
+        self._removed_words.add(word)
+        if self._deletes is not None:
+            for variant in _deletions(word):
+                words = self._deletes[variant]
+                words.discard(word)
+                if not words:
+                    del self._deletes[variant]
+
+    def add(self, task: Task) -> None:
+        """
+        Indexes a task.
+
+        A task already indexed with the same last update is assumed unchanged
+        and left as is.
+
+        Args:
+            task (Task): The task.
+
+        Raises:
+            ValueError: If the task is indexed with another last update; it must be
+                removed before its fields change.
+        """
+        if self._stamps.get(task.id) == task.last_update:
+            self._order.setdefault(task.id, next(self._counter))
+            return
+        if task.id in self._stamps:
+            raise ValueError(f"La tarea {task.id} ya está indexada con otro contenido")
+        self._stamps[task.id] = task.last_update
+        self._order.setdefault(task.id, next(self._counter))
+        for word in self._tokens(task):
+            postings = self._postings.get(word)
+            if postings is None:
+                self._add_word(word, {task.id})
+            else:
+                postings.add(task.id)
+
+    def remove(self, task: Task) -> None:
+        """
+        Removes a task from the index, keeping its position among equal matches.
+
+        Args:
+            task (Task): The task, with the fields it had when it was indexed.
+        """
+        if self._stamps.pop(task.id, None) is None:
+            return
+        for word in self._tokens(task):
+            postings = self._postings.get(word)
+            if postings is not None:
+                postings.discard(task.id)
+                if not postings:
+                    self._remove_word(word)
+
+    def forget(self, task: Task) -> None:
+        """
+        Removes a task and its position among equal matches, after it was deleted.
+
+        Args:
+            task (Task): The task, with the fields it had when it was indexed.
+        """
+        self.remove(task)
+        self._order.pop(task.id, None)
+
+    def _sorted_vocabulary(self) -> List[str]:
+        """Returns the sorted word list, adding the new words and purging removed ones."""
+        if self._new_words:
+            # Both parts are sorted runs, which `sort` merges in linear time.
+            self._new_words.sort()
+            self._vocabulary += self._new_words
+            self._vocabulary.sort()
+            self._new_words = []
+        if len(self._removed_words) > len(self._vocabulary) // 4:
+            self._vocabulary = [word for word in self._vocabulary
+                                if word not in self._removed_words]
+            self._removed_words.clear()
+        return self._vocabulary
+
+    def _prefix_matches(self, term: str) -> List[str]:
+        """Returns the indexed words that start with a term (including the term itself)."""
+        vocabulary = self._sorted_vocabulary()
+        matches = []
+        for position in range(bisect_left(vocabulary, term), len(vocabulary)):
+            word = vocabulary[position]
+            if not word.startswith(term):
+                break
+            if word in self._postings:
+                matches.append(word)
+        return matches
+
+    def _fuzzy_matches(self, term: str) -> Set[str]:
+        """Returns the indexed words within one edit of a term."""
+        if self._deletes is None:
+            self._deletes = {}
+            for word in self._postings:
+                for variant in _deletions(word):
+                    self._deletes.setdefault(variant, set()).add(word)
+        candidates: Set[str] = set(self._deletes.get(term, ()))
+        for variant in _deletions(term) | {term}:
+            if variant in self._postings:
+                candidates.add(variant)
+            candidates.update(self._deletes.get(variant, ()))
+        return {word for word in candidates if _within_one_edit(term, word)}
+
+    def _term_matches(self, term: str, fuzzy: bool) -> Tuple[Set[str], Set[str], bool]:
+        """
+        Finds the tasks matching one query term.
+
+        Returns:
+            Tuple[Set[str], Set[str], bool]: The matching tasks, those matching the term
+                exactly, and whether the matches are fuzzy.
+        """
+        words = self._prefix_matches(term)
+        if words or not fuzzy or len(term) < self.MIN_FUZZY_LENGTH:
+            matches = set().union(*(self._postings[word] for word in words))
+            return matches, self._postings.get(term, set()), False
+        matches = set().union(*(self._postings[word] for word in self._fuzzy_matches(term)))
+        return matches, set(), True
+
+    def search(self, query: str, limit: Optional[int] = None, fuzzy: bool = True) -> List[str]:
+        """
+        Finds the tasks that match every word of a query.
+
+        Args:
+            query (str): The words to look for.
+            limit (Optional[int]): Maximum number of results.
+            fuzzy (bool): If True, words without exact or prefix matches also match
+                words one edit away.
+
+        Returns:
+            List[str]: Identifiers of the matching tasks, best matches first and, among
+                equal matches, in the order the tasks were indexed. An empty query
+                returns no results.
+        """
+        terms = [self._term_matches(term, fuzzy) for term in dict.fromkeys(tokenize(query))]
+        if not terms:
+            return []
+        # Intersect the smallest sets first, so the candidates shrink as fast as possible.
+        terms.sort(key=lambda term: len(term[0]))
+        candidates = terms[0][0].intersection(*(matches for matches, _, _ in terms[1:]))
+
+        def rank(task_id: str) -> Tuple[int, int]:
+            score = 0
+            for _, exact, is_fuzzy in terms:
+                score += _FUZZY if is_fuzzy else _EXACT if task_id in exact else _PREFIX
+            return -score, self._order[task_id]
+
+        if limit is not None:
+            # Tasks matching exactly every term that some task matches exactly rank
+            # first; if there are enough of them, the rest need not be scored.
+            best = candidates.intersection(*(exact for _, exact, _ in terms if exact))
+            if len(best) >= limit:
+                return nsmallest(limit, best, key=self._order.__getitem__)
+            return nsmallest(limit, candidates, key=rank)
+        return sorted(candidates, key=rank)
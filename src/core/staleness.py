@@ -0,0 +1,150 @@
+"""Tracks when pending tasks cross a staleness threshold."""
+import heapq
+from datetime import datetime, timedelta
+from itertools import count
+from typing import List, Dict, Optional, Tuple
+
+from src.models.task import Task
+
+class StalenessTracker:
+    """
+    Keeps pending tasks in a min-heap keyed on their staleness expiry.
+
+    A task expires once `last_update + threshold` lies in the past. Each call to
+    `stale` only pops the heap entries that expired since the previous call,
+    so its cost depends on how many tasks became stale rather than on how many
+    tasks are tracked. Superseded heap entries are discarded lazily.
+    """
+
+    def __init__(self, threshold: timedelta, inclusive: bool = False) -> None:
+        """
+        Initializes an empty tracker.
+
+        Args:
+            threshold (timedelta): Time without updates after which a task is stale.
+            inclusive (bool): If True, a task is stale as soon as the threshold is reached;
+                otherwise it must be exceeded.
+        """
+        self._threshold = threshold
+        self.inclusive = inclusive
+        self._heap: List[Tuple[datetime, int, Task]] = []
+        self._entries: Dict[str, int] = {}
+        self._stale: Dict[str, Task] = {}
+        self._counter = count()
+
+    @property
+    def threshold(self) -> timedelta:
+        """Time without updates after which a task is stale."""
+        return self._threshold
+
+    @threshold.setter
+    def threshold(self, value: timedelta) -> None:
+        """Changes the threshold and recomputes every expiry."""
+        tasks = [task for _, seq, task in self._heap if self._entries.get(task.id) == seq]
+        tasks.extend(self._stale.values())
+        self._threshold = value
+        self.clear()
+        for task in tasks:
+            self.track(task)
+
+    def clear(self) -> None:
+        """Stops tracking every task."""
+        self._heap = []
+        self._entries = {}
+        self._stale = {}
+
+    def track(self, task: Task) -> None:
+        """
+        Starts tracking a task, or refreshes it after a change.
+
+        Completed tasks are no longer tracked.
+
+        Args:
+            task (Task): The task to track.
+        """
+        self.untrack(task)
+        if task.completed:
+            return
+        seq = next(self._counter)
+        self._entries[task.id] = seq
+        heapq.heappush(self._heap, (task.last_update + self._threshold, seq, task))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def untrack(self, task: Task) -> None:
+        """
+        Stops tracking a task.
+
+        Args:
+            task (Task): The task to forget.
+        """
+        self._entries.pop(task.id, None)
+        self._stale.pop(task.id, None)
+
+    def stale(self, now: Optional[datetime] = None) -> List[Task]:
+        """
+        Returns the tracked tasks that are stale.
+
+        Args:
+            now (Optional[datetime]): Reference time. Defaults to the current time.
+
+        Returns:
+            List[Task]: Stale tasks, in the order in which they became stale.
+        """
+        self.expire(now)
+        return list(self._stale.values())
+
+    def expire(self, now: Optional[datetime] = None) -> List[Task]:
+        """
+        Marks as stale the tasks whose expiry has passed since the previous check.
+
+        Args:
+            now (Optional[datetime]): Reference time. Defaults to the current time.
+
+        Returns:
+            List[Task]: Tasks that became stale in this call.
+        """
+        now = now if now is not None else datetime.now()
+        expired: List[Task] = []
+        while self._heap and self._is_expired(self._heap[0][0], now):
+            _, seq, task = heapq.heappop(self._heap)
+            if self._entries.get(task.id) == seq:
+                del self._entries[task.id]
+                self._stale[task.id] = task
+                expired.append(task)
+        return expired
+
+    def is_stale(self, task: Task) -> bool:
+        """
+        Checks whether a task was found stale by the last check.
+
+        Args:
+            task (Task): The task to check.
+
+        Returns:
+            bool: True if the task is stale.
+        """
+        return task.id in self._stale
+
+    def next_expiry(self) -> Optional[datetime]:
+        """
+        Returns when the next tracked task becomes stale.
+
+        Returns:
+            Optional[datetime]: The earliest pending expiry, or None if nothing is pending.
+        """
+        while self._heap:
+            expiry, seq, task = self._heap[0]
+            if self._entries.get(task.id) == seq:
+                return expiry
+            heapq.heappop(self._heap)
+        return None
+
+    def _is_expired(self, expiry: datetime, now: datetime) -> bool:
+        """Checks whether an expiry lies in the past."""
+        return expiry <= now if self.inclusive else expiry < now
+
+    def _compact(self) -> None:
+        """Drops superseded heap entries."""
+        self._heap = [entry for entry in self._heap if self._entries.get(entry[2].id) == entry[1]]
+        heapq.heapify(self._heap)
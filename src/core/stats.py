@@ -0,0 +1,88 @@
+"""Keeps per-category task statistics up to date as tasks change."""
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from src.models.task import Task, Priority
+from src.core.staleness import StalenessTracker
+
+STAT_FIELDS = ('total', 'completed', 'pending', 'high_priority', 'procrastinated')
+
+class CategoryStats:
+    """
+    Maintains the counters shown on the category statistics screen.
+
+    Counters are adjusted whenever a task is added or removed, so reading them
+    does not walk the task list. A pending task counts as procrastinated once it
+    has gone `threshold` without updates; those transitions come from a
+    `StalenessTracker`, so each read only examines the tasks that crossed the
+    threshold since the previous one.
+    """
+
+    def __init__(self, threshold: timedelta = timedelta(days=1)) -> None:
+        """
+        Initializes empty statistics.
+
+        Args:
+            threshold (timedelta): Time without updates after which a pending task
+                counts as procrastinated.
+        """
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._procrastination = StalenessTracker(threshold, inclusive=True)
+
+    def add(self, task: Task) -> None:
+        """
+        Counts a task.
+
+        Args:
+            task (Task): The task to count.
+        """
+        counters = self._counters.get(task.category)
+        if counters is None:
+            counters = self._counters[task.category] = dict.fromkeys(STAT_FIELDS, 0)
+        counters['total'] += 1
+        counters['completed' if task.completed else 'pending'] += 1
+        if task.priority == Priority.ALTA:
+            counters['high_priority'] += 1
+        self._procrastination.track(task)
+
+    def remove(self, task: Task) -> None:
+        """
+        Stops counting a task.
+
+        Must be called before changing the category, priority, status or last
+        update of the task.
+
+        Args:
+            task (Task): The task to forget.
+        """
+        counters = self._counters[task.category]
+        counters['total'] -= 1
+        counters['completed' if task.completed else 'pending'] -= 1
+        if task.priority == Priority.ALTA:
+            counters['high_priority'] -= 1
+        if self._procrastination.is_stale(task):
+            counters['procrastinated'] -= 1
+        self._procrastination.untrack(task)
+        if not counters['total']:
+            del self._counters[task.category]
+
+    def clear(self) -> None:
+        """Forgets every task."""
+        self._counters = {}
+        self._procrastination.clear()
+
+    def get(self, now: Optional[datetime] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the statistics of every category that has tasks.
+
+        Args:
+            now (Optional[datetime]): Reference time for procrastination. Defaults to
+                the current time.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Counters per category, in the same format as
+                `CategoryManager.get_category_stats`.
+        """
+        for task in self._procrastination.expire(now):
+            self._counters[task.category]['procrastinated'] += 1
+        return {category: dict(counters) for category, counters in self._counters.items()}
@@ -0,0 +1,163 @@
+"""Módulo del archivo histórico de tareas completadas."""
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from src.models.task import Task
+from src.core import metrics
+from src.data.storage import Storage, atomic_open, task_to_dict
+
+class TaskArchive:
+    """
+    Archivo histórico de las tareas completadas, separado de las tareas activas.
+
+    Las tareas se guardan en segmentos NDJSON según el mes en que se
+    completaron (`<directorio>/2026-10.ndjson`), junto a un manifiesto
+    (`manifest.json`) con el número de tareas y las fechas de cada segmento.
+    Archivar solo anexa líneas a los segmentos afectados y consultar lee
+    únicamente los segmentos del intervalo pedido, por lo que las tareas
+    archivadas no se cargan ni se reescriben con las activas.
+
+    El manifiesto solo resume los segmentos; las tareas se leen siempre de
+    los segmentos que haya en el directorio. Si una tarea se archiva dos
+    veces (por ejemplo, si el programa se interrumpió tras archivarla y antes
+    de quitarla de las activas), al leer se conserva su última copia.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, directory: str) -> None:
+        """
+        Inicializa el archivo histórico.
+
+        Args:
+            directory: Directorio de los segmentos; se crea al archivar la primera tarea
+        """
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def segment_name(moment: datetime) -> str:
+        """
+        Obtiene el segmento que corresponde a una fecha de finalización.
+
+        Args:
+            moment: Fecha en que se completó la tarea
+
+        Returns:
+            str: Nombre del segmento (año y mes, como "2026-10")
+        """
+        return moment.strftime("%Y-%m")
+
+    def _segment_filename(self, name: str) -> str:
+        """Ruta del archivo de un segmento."""
+        return os.path.join(self.directory, f"{name}.ndjson")
+
+    def _read_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Lee el manifiesto; si no existe el archivo está vacío."""
+        try:
+            with open(os.path.join(self.directory, self.MANIFEST), encoding='utf-8') as file:
+                return json.load(file)["segments"]
+        except FileNotFoundError:
+            return {}
+
+    def segments(self) -> Dict[str, int]:
+        """
+        Obtiene los segmentos del archivo y cuántas tareas guarda cada uno.
+
+        Returns:
+            Dict[str, int]: Número de tareas de cada segmento, ordenados del más antiguo
+                al más reciente
+        """
+        with self._lock:
+            manifest = self._read_manifest()
+            return {name: manifest[name]["count"] for name in sorted(manifest)}
+
+    def __len__(self) -> int:
+        """Devuelve el número de tareas archivadas, según el manifiesto."""
+        return sum(self.segments().values())
+
+    @metrics.timed("archive.add")
+    def add(self, tasks: Iterable[Task]) -> None:
+        """
+        Archiva tareas anexándolas a sus segmentos.
+
+        Los segmentos se sincronizan con el disco antes de reescribir el
+        manifiesto, de modo que una tarea que figura en el manifiesto siempre
+        está en su segmento.
+
+        Args:
+            tasks: Tareas completadas a archivar
+        """
+        by_segment: Dict[str, List[Task]] = {}
+        for task in tasks:
+            by_segment.setdefault(self.segment_name(task.last_update), []).append(task)
+        if not by_segment:
+            return
+        with self._lock:
+            manifest = self._read_manifest()
+            os.makedirs(self.directory, exist_ok=True)
+            for name, segment_tasks in by_segment.items():
+                payload = "".join(json.dumps(task_to_dict(task), separators=(',', ':')) + "\n"
+                                  for task in segment_tasks)
+                with open(self._segment_filename(name), 'a', encoding='utf-8') as file:
+                    file.write(payload)
+                    file.flush()
+                    os.fsync(file.fileno())
+                metrics.add_bytes(written=len(payload.encode('utf-8')))
+                moments = [task.last_update.isoformat() for task in segment_tasks]
+                entry = manifest.setdefault(name, {"count": 0, "first": min(moments),
+                                                   "last": max(moments)})
+                entry["count"] += len(segment_tasks)
+                entry["first"] = min(entry["first"], *moments)
+                entry["last"] = max(entry["last"], *moments)
+            with atomic_open(os.path.join(self.directory, self.MANIFEST)) as file:
+                json.dump({"segments": manifest}, file, indent=2, sort_keys=True)
+
+    def iter_tasks(self, since: Optional[datetime] = None,
+                   until: Optional[datetime] = None) -> Iterator[Task]:
+        """
+        Recorre las tareas archivadas, leyendo solo los segmentos necesarios.
+
+        Args:
+            since: Si se indica, solo las tareas completadas desde esta fecha
+            until: Si se indica, solo las tareas completadas hasta esta fecha
+
+        Yields:
+            Task: Cada tarea archivada, de la más antigua a la más reciente por segmento
+        """
+        first = self.segment_name(since) if since is not None else None
+        last = self.segment_name(until) if until is not None else None
+        # Los segmentos se buscan en el directorio y no en el manifiesto, para que un
+        # manifiesto desactualizado no oculte ninguna tarea.
+        try:
+            names = sorted(filename[:-len(".ndjson")] for filename in os.listdir(self.directory)
+                           if filename.endswith(".ndjson"))
+        except FileNotFoundError:
+            return
+        for name in names:
+            if (first is not None and name < first) or (last is not None and name > last):
+                continue
+            tasks: Dict[str, Task] = {}
+            for task in Storage(self._segment_filename(name)).iter_tasks():
+                if ((since is None or task.last_update >= since)
+                        and (until is None or task.last_update <= until)):
+                    tasks.pop(task.id, None)
+                    tasks[task.id] = task
+            yield from tasks.values()
+
+    @metrics.timed("archive.load")
+    def load(self, since: Optional[datetime] = None,
+             until: Optional[datetime] = None) -> List[Task]:
+        """
+        Carga las tareas archivadas de un intervalo.
+
+        Args:
+            since: Si se indica, solo las tareas completadas desde esta fecha
+            until: Si se indica, solo las tareas completadas hasta esta fecha
+
+        Returns:
+            List[Task]: Tareas archivadas
+        """
+        return list(self.iter_tasks(since, until))
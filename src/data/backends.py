@@ -0,0 +1,53 @@
+"""Módulo para seleccionar el almacenamiento de tareas por nombre."""
+from importlib import import_module
+from typing import Dict, Optional, Tuple, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.data.storage import Storage
+
+BACKENDS: Dict[str, Tuple[str, str]] = {
+    "json": ("src.data.storage", "Storage"),
+    "journal": ("src.data.journal_storage", "JournalStorage"),
+    "sqlite": ("src.data.sqlite_storage", "SqliteStorage"),
+    "snapshot": ("src.data.snapshot_storage", "SnapshotStorage"),
+    "sharded": ("src.data.sharded_storage", "ShardedStorage"),
+}
+"""Almacenamientos disponibles, por nombre: módulo y clase. Solo se importa el que se usa."""
+
+DEFAULT_FILES: Dict[str, str] = {"sqlite": "tasks.db", "snapshot": "tasks.snap",
+                                 "sharded": "tasks.shards"}
+"""Archivo por defecto de los almacenamientos que no usan `tasks.json`."""
+
+def storage_class(backend: str) -> Type["Storage"]:
+    """
+    Importa la clase de un almacenamiento.
+
+    Args:
+        backend: Nombre del almacenamiento (una clave de `BACKENDS`)
+
+    Returns:
+        Type[Storage]: Clase del almacenamiento
+
+    Raises:
+        ValueError: Si el almacenamiento no existe
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Almacenamiento desconocido: {backend}")
+    module, name = BACKENDS[backend]
+    return getattr(import_module(module), name)
+
+def create_storage(backend: str = "json", filename: Optional[str] = None) -> "Storage":
+    """
+    Crea el almacenamiento indicado.
+
+    Args:
+        backend: Nombre del almacenamiento (una clave de `BACKENDS`)
+        filename: Archivo de tareas; si no se indica se usa el de por defecto
+
+    Returns:
+        Storage: Instancia del almacenamiento
+
+    Raises:
+        ValueError: Si el almacenamiento no existe
+    """
+    return storage_class(backend)(filename or DEFAULT_FILES.get(backend, "tasks.json"))
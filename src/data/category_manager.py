@@ -1,15 +1,95 @@
 """Módulo para la gestión de categorías de tareas."""
-from typing import Set, Dict, Any, List
+import json
+from types import MappingProxyType
+from typing import AbstractSet, Dict, Any, Iterable, List, Mapping, Optional
 from collections import defaultdict
 from datetime import datetime
 from src.models.task import Task, Priority # Importar Task y Priority para type hints
+from src.data.storage import atomic_open
 
 class CategoryManager:
-    """Clase que gestiona las categorías disponibles para las tareas."""
+    """
+    Clase que gestiona las categorías disponibles para las tareas.
 
-    def __init__(self) -> None:
-        """Inicializa el gestor de categorías con una categoría por defecto."""
-        self.categories: Set[str] = {"General"}
+    Además del nombre, cada categoría guarda su fecha de creación y el número
+    de tareas que contiene. El gestor de tareas mantiene ese número al día con
+    `set_count`, de modo que al arrancar se conocen las categorías y su tamaño
+    leyendo solo el archivo de categorías, sin recorrer las tareas.
+    """
+
+    VERSION = 1
+    """Versión del formato del archivo de categorías."""
+
+    def __init__(self, filename: Optional[str] = None) -> None:
+        """
+        Inicializa el gestor de categorías con una categoría por defecto.
+
+        Args:
+            filename: Archivo donde se guardan las categorías para disponer de ellas
+                al arrancar sin leer las tareas. None las mantiene solo en memoria.
+        """
+        self.filename = filename
+        self._counts: Dict[str, int] = {"General": 0}
+        self._created: Dict[str, Optional[str]] = {"General": None}
+        self._counts_view: Mapping[str, int] = MappingProxyType(self._counts)
+        self._categories_view: AbstractSet[str] = self._counts_view.keys()
+        self._dirty = False
+        if filename is not None:
+            self._load()
+
+    def _load(self) -> None:
+        """
+        Añade las categorías guardadas; un archivo ausente o dañado se ignora.
+
+        También admite el formato anterior, una lista de nombres sin datos.
+        """
+        try:
+            with open(self.filename, encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, list):
+            data = {"categories": {str(category): {} for category in data}}
+        if not isinstance(data, dict) or not isinstance(data.get("categories"), dict):
+            return
+        for name, info in data["categories"].items():
+            info = info if isinstance(info, dict) else {}
+            count = info.get("count", 0)
+            self._counts[name] = count if isinstance(count, int) and count >= 0 else 0
+            self._created[name] = info.get("created", self._created.get(name))
+
+    def save(self) -> None:
+        """Guarda las categorías en su archivo, si se indicó uno."""
+        self._dirty = False
+        if self.filename is None:
+            return
+        categories = {name: {"count": self._counts[name], "created": self._created[name]}
+                      for name in sorted(self._counts)}
+        with atomic_open(self.filename, fsync=False) as file:
+            json.dump({"version": self.VERSION, "categories": categories}, file,
+                      ensure_ascii=False)
+
+    def flush(self) -> None:
+        """Guarda las categorías si cambió algún número de tareas desde el último guardado."""
+        if self._dirty:
+            self.save()
+
+    def has_category(self, category_name: str) -> bool:
+        """
+        Comprueba si una categoría existe, sin copiar el conjunto de categorías.
+
+        Args:
+            category_name: Nombre de la categoría
+
+        Returns:
+            bool: True si la categoría existe
+        """
+        return category_name in self._counts
+
+    def _register(self, category_name: str) -> None:
+        """Añade una categoría sin tareas, anotando su fecha de creación."""
+        self._counts[category_name] = 0
+        self._created[category_name] = datetime.now().isoformat(timespec='seconds')
 
     def add_category(self, category_name: str) -> None:
         """
@@ -21,9 +101,23 @@ class CategoryManager:
         Raises:
             ValueError: Si la categoría ya existe
         """
-        if category_name in self.categories:
+        if category_name in self._counts:
             raise ValueError(f"La categoría '{category_name}' ya existe")
-        self.categories.add(category_name)
+        self._register(category_name)
+        self.save()
+
+    def register_categories(self, category_names: Iterable[str]) -> None:
+        """
+        Añade las categorías que aún no existen, guardando una sola vez.
+
+        Args:
+            category_names: Nombres de las categorías
+        """
+        new = set(category_names).difference(self._counts)
+        if new:
+            for category_name in new:
+                self._register(category_name)
+            self.save()
 
     def remove_category(self, category_name: str) -> None:
         """
@@ -37,18 +131,79 @@ class CategoryManager:
         """
         if category_name == "General":
             raise ValueError("No se puede eliminar la categoría General")
-        if category_name not in self.categories:
+        if category_name not in self._counts:
             raise ValueError(f"La categoría '{category_name}' no existe")
-        self.categories.remove(category_name)
+        del self._counts[category_name]
+        del self._created[category_name]
+        self.save()
 
-    def get_categories(self) -> Set[str]:
+    def get_categories(self) -> AbstractSet[str]:
         """
         Obtiene todas las categorías disponibles.
 
         Returns:
-            Set[str]: Conjunto con todas las categorías
+            AbstractSet[str]: Vista de solo lectura de las categorías, que refleja
+                los cambios posteriores; no se copia en cada llamada
+        """
+        return self._categories_view
+
+    def get_counts(self) -> Mapping[str, int]:
+        """
+        Obtiene el número de tareas de cada categoría.
+
+        Returns:
+            Mapping[str, int]: Vista de solo lectura con el número de tareas por categoría
+        """
+        return self._counts_view
+
+    def get_created(self, category_name: str) -> Optional[datetime]:
+        """
+        Obtiene la fecha de creación de una categoría.
+
+        Args:
+            category_name: Nombre de la categoría
+
+        Returns:
+            Optional[datetime]: Fecha de creación, o None si no se conoce (la categoría
+                General y las guardadas con versiones anteriores)
+
+        Raises:
+            KeyError: Si la categoría no existe
+        """
+        created = self._created[category_name]
+        return datetime.fromisoformat(created) if created else None
+
+    def set_count(self, category_name: str, count: int) -> None:
+        """
+        Anota el número de tareas de una categoría, registrándola si no existe.
+
+        El cambio se guarda con el siguiente `flush` o `save`.
+
+        Args:
+            category_name: Nombre de la categoría
+            count: Número de tareas de la categoría
+        """
+        if category_name not in self._counts:
+            self._register(category_name)
+        elif self._counts[category_name] == count:
+            return
+        self._counts[category_name] = count
+        self._dirty = True
+
+    def set_counts(self, counts: Mapping[str, int]) -> None:
+        """
+        Reemplaza el número de tareas de todas las categorías y guarda si cambió.
+
+        Las categorías que no figuran en `counts` se conservan con cero tareas.
+
+        Args:
+            counts: Número de tareas de cada categoría con tareas
         """
-        return self.categories.copy()
+        for category_name in self._counts.keys() - counts.keys():
+            self.set_count(category_name, 0)
+        for category_name, count in counts.items():
+            self.set_count(category_name, count)
+        self.flush()
 
     def get_category_stats(self, tasks: List[Task]) -> Dict[str, Dict[str, Any]]:
         """
@@ -68,6 +223,7 @@ class CategoryManager:
             'procrastinated': 0
         })
 
+        now = datetime.now()
         for task in tasks:
             cat = task.category
             stats[cat]['total'] += 1
@@ -76,7 +232,7 @@ class CategoryManager:
             stats[cat]['high_priority'] += 1 if task.priority == Priority.ALTA else 0
 
             if task.last_update and not task.completed:
-                time_since_progress = datetime.now() - task.last_update
+                time_since_progress = now - task.last_update
                 if time_since_progress.days >= 1:
                     stats[cat]['procrastinated'] += 1
 
@@ -0,0 +1,255 @@
+"""Módulo de almacenamiento basado en un diario de solo anexado."""
+import json
+import os
+import shutil
+import threading
+from typing import List, Dict, Any, Iterable, Collection, Optional
+from src.models.task import Task
+from src.core import metrics
+from src.data.storage import Storage, atomic_open
+
+class JournalStorage(Storage):
+    """
+    Almacenamiento que anexa un registro compacto por cada modificación.
+
+    El archivo principal conserva el formato de `Storage` y actúa como
+    instantánea; las modificaciones posteriores se anexan al diario
+    (`<archivo>.journal`) y se reaplican al cargar. Cuando el diario supera
+    `compact_threshold` bytes se vuelca una nueva instantánea en segundo plano.
+    Los registros del diario identifican cada tarea por su `id`.
+    """
+
+    def __init__(self, filename: str = "tasks.json", compact_threshold: int = 1024 * 1024,
+                 background: bool = True, fsync: bool = True) -> None:
+        """
+        Inicializa el almacenamiento con diario.
+
+        Args:
+            filename: Nombre del archivo de instantánea
+            compact_threshold: Tamaño en bytes del diario que dispara la compactación
+            background: Si es True la instantánea se escribe en un hilo aparte
+            fsync: Si es True cada anexado al diario y cada instantánea se sincronizan
+                con el disco
+        """
+        super().__init__(filename, fsync=fsync)
+        self.journal_filename = f"{filename}.journal"
+        self.compact_threshold = compact_threshold
+        self.background = background
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._journal_size = 0
+        self._lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+
+    @property
+    def _old_journal_filename(self) -> str:
+        """Diario rotado pendiente de integrarse en la instantánea."""
+        return f"{self.journal_filename}.old"
+
+    @property
+    def _snapshot_tmp_filename(self) -> str:
+        """Archivo temporal donde se escribe la nueva instantánea."""
+        return f"{self.filename}.tmp"
+
+    @metrics.timed("storage.load_tasks")
+    def load_tasks(self) -> List[Task]:
+        """
+        Carga las tareas reaplicando el diario sobre la instantánea.
+
+        Returns:
+            List[Task]: Lista de tareas almacenadas
+        """
+        self.wait_for_compaction()
+        with self._lock:
+            self._records = self._recover()
+            return [self._create_task_from_dict(data) for data in self._records.values()]
+
+    def _recover(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Reconstruye el estado a partir de la instantánea y los diarios.
+
+        Los registros son idempotentes, por lo que un diario rotado puede
+        reaplicarse aunque su contenido ya figure en la instantánea.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Registros de tareas indexados por `id`
+        """
+        old_exists = os.path.exists(self._old_journal_filename)
+        if os.path.exists(self._snapshot_tmp_filename):
+            if old_exists:
+                # La compactación se interrumpió antes de terminar la instantánea.
+                os.remove(self._snapshot_tmp_filename)
+            else:
+                # El diario rotado ya se descartó: la instantánea temporal está completa.
+                os.replace(self._snapshot_tmp_filename, self.filename)
+
+        records = self._read_snapshot()
+        if old_exists:
+            metrics.add_bytes(read=self._replay(self._old_journal_filename, records))
+        self._journal_size = self._replay(self.journal_filename, records)
+        metrics.add_bytes(read=self._journal_size)
+        return records
+
+    def _read_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Lee la instantánea indexando cada registro por su `id`.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Registros de tareas indexados por `id`
+        """
+        records: Dict[str, Dict[str, Any]] = {}
+        for task_data in self._iter_records():
+            task_id = task_data.get('id') or self._legacy_task_id(task_data)
+            records[task_id] = dict(task_data, id=task_id)
+        return records
+
+    @staticmethod
+    def _replay(journal_filename: str, records: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Aplica los registros de un diario sobre el estado dado.
+
+        Las líneas incompletas (por ejemplo, tras una interrupción a mitad de
+        escritura) se ignoran.
+
+        Args:
+            journal_filename: Diario a reaplicar
+            records: Estado sobre el que se aplican los cambios
+
+        Returns:
+            int: Tamaño en bytes del diario leído
+        """
+        try:
+            with open(journal_filename, 'rb') as file:
+                content = file.read()
+        except FileNotFoundError:
+            return 0
+
+        for line in content.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry['op'] == 'set':
+                records[entry['task']['id']] = entry['task']
+            else:
+                records.pop(entry['id'], None)
+        return len(content)
+
+    @metrics.timed("storage.save_changes")
+    def save_changes(self, tasks: Collection[Task], changed: Iterable[Task] = (),
+                     deleted: Iterable[Task] = ()) -> bool:
+        """
+        Anexa al diario un registro por cada tarea modificada o eliminada.
+
+        Args:
+            tasks: Colección completa de tareas tras la modificación
+            changed: Tareas creadas o modificadas
+            deleted: Tareas eliminadas
+
+        Returns:
+            bool: Siempre False; el diario no fusiona cambios de otros procesos
+        """
+        with self._lock:
+            lines: List[str] = []
+            for task in deleted:
+                if self._records.pop(task.id, None) is not None:
+                    lines.append(self._encode({'op': 'del', 'id': task.id}))
+            for task in changed:
+                task_dict = self._task_to_dict(task)
+                self._records[task.id] = task_dict
+                lines.append(self._encode({'op': 'set', 'task': task_dict}))
+            if not lines:
+                return False
+
+            payload = "".join(lines).encode('utf-8')
+            with open(self.journal_filename, 'ab') as file:
+                file.write(payload)
+                if self.fsync:
+                    file.flush()
+                    os.fsync(file.fileno())
+            self._journal_size += len(payload)
+            metrics.add_bytes(written=len(payload))
+
+            if self._journal_size >= self.compact_threshold and not self._compacting():
+                self._start_compaction()
+            return False
+
+    @staticmethod
+    def _encode(entry: Dict[str, Any]) -> str:
+        """Serializa un registro del diario en una única línea compacta."""
+        return json.dumps(entry, separators=(',', ':')) + "\n"
+
+    def _compacting(self) -> bool:
+        """Indica si hay una compactación en curso."""
+        return self._compactor is not None and self._compactor.is_alive()
+
+    def _start_compaction(self) -> None:
+        """
+        Rota el diario y escribe la instantánea correspondiente.
+
+        Debe llamarse con el cerrojo adquirido. La rotación es inmediata; la
+        escritura de la instantánea se delega a un hilo si `background` es True.
+        Si una compactación anterior falló y dejó un diario rotado, el diario
+        actual se anexa a él en lugar de sustituirlo, para que sus registros se
+        sigan reaplicando hasta que se escriba la nueva instantánea.
+        """
+        if os.path.exists(self._old_journal_filename):
+            with open(self.journal_filename, 'rb') as source, \
+                    open(self._old_journal_filename, 'ab') as target:
+                shutil.copyfileobj(source, target)
+                target.flush()
+                if self.fsync:
+                    os.fsync(target.fileno())
+            os.remove(self.journal_filename)
+        else:
+            os.replace(self.journal_filename, self._old_journal_filename)
+        self._journal_size = 0
+
+        snapshot = list(self._records.values())
+        if self.background:
+            self._compactor = threading.Thread(target=self._write_snapshot, args=(snapshot,),
+                                               daemon=True)
+            self._compactor.start()
+        else:
+            self._write_snapshot(snapshot)
+
+    @metrics.timed("storage.compact")
+    def _write_snapshot(self, snapshot: List[Dict[str, Any]]) -> None:
+        """
+        Escribe la instantánea y descarta el diario rotado.
+
+        Args:
+            snapshot: Registros de tareas en orden
+        """
+        with open(self._snapshot_tmp_filename, 'w', encoding='utf-8') as file:
+            self._write_records(file, snapshot)
+            metrics.add_bytes(written=file.tell())
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+        os.remove(self._old_journal_filename)
+        os.replace(self._snapshot_tmp_filename, self.filename)
+
+    def wait_for_compaction(self) -> None:
+        """Espera a que termine la compactación en segundo plano, si la hay."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def _save_to_file(self, tasks: Iterable[Task]) -> None:
+        """
+        Reescribe la instantánea completa y vacía el diario.
+
+        Args:
+            tasks: Tareas a guardar
+        """
+        self.wait_for_compaction()
+        with self._lock:
+            self._records = {task.id: self._task_to_dict(task) for task in tasks}
+            with atomic_open(self.filename, self.fsync) as file:
+                self._write_records(file, self._records.values())
+                metrics.add_bytes(written=file.tell())
+            self._journal_size = 0
+            # La instantánea ya contiene todo: ningún diario debe reaplicarse sobre ella.
+            for journal in (self._old_journal_filename, self.journal_filename):
+                if os.path.exists(journal):
+                    os.remove(journal)
@@ -0,0 +1,268 @@
+"""Módulo para el historial de progreso de las tareas."""
+import re
+import struct
+import uuid
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+from src.models.task import Task
+from src.data.storage import lock_file, unlock_file
+
+_EPOCH = datetime(1970, 1, 1)
+# Identificador de la tarea (16 bytes), instante, progreso y código de categoría.
+_RECORD = struct.Struct('<16sdBH')
+
+def _to_seconds(moment: datetime) -> float:
+    """Convierte una fecha sin zona horaria en segundos desde 1970."""
+    return (moment - _EPOCH).total_seconds()
+
+def _from_seconds(seconds: float) -> datetime:
+    """Convierte segundos desde 1970 en una fecha sin zona horaria."""
+    return _EPOCH + timedelta(seconds=seconds)
+
+def _escape_category(category: str) -> str:
+    """Escapa las barras invertidas y los saltos de línea para guardar un nombre por línea."""
+    return category.replace('\\', '\\\\').replace('\n', '\\n')
+
+def _unescape_category(line: str) -> str:
+    """Recupera un nombre de categoría escapado con `_escape_category`."""
+    return re.sub(r'\\(.)', lambda match: '\n' if match.group(1) == 'n' else match.group(1),
+                  line)
+
+def _task_key(task_id: str) -> bytes:
+    """
+    Obtiene la clave de 16 bytes con la que se guarda una tarea.
+
+    Los identificadores que no son UUID en hexadecimal (por ejemplo, los
+    importados de otros sistemas) se reducen con un UUID derivado de su texto.
+    """
+    try:
+        return uuid.UUID(hex=task_id).bytes
+    except ValueError:
+        return uuid.uuid5(uuid.NAMESPACE_OID, task_id).bytes
+
+class ProgressLog:
+    """
+    Registro de solo anexado con cada cambio de progreso de las tareas.
+
+    Cada evento ocupa un registro binario de tamaño fijo en `<archivo>`; los
+    nombres de las categorías se guardan una sola vez, uno por línea y con
+    los saltos de línea escapados, en `<archivo>.categories`. La primera
+    consulta lee el registro una vez y lo indexa por tarea y por instante, de
+    modo que las consultas por rango de fechas solo recorren los eventos de
+    ese rango. Registrar eventos antes de esa primera consulta solo anexa al
+    archivo, sin leerlo.
+    """
+
+    def __init__(self, filename: str = "tasks.progress") -> None:
+        """
+        Abre el historial. Los eventos no se leen hasta la primera consulta.
+
+        Args:
+            filename: Archivo de eventos
+        """
+        self.filename = filename
+        self.categories_filename = f"{filename}.categories"
+        self._categories: List[str] = []
+        self._category_codes: Dict[str, int] = {}
+        # Por tarea: instantes ordenados y progreso correspondiente.
+        self._task_times: Dict[bytes, array] = {}
+        self._task_progress: Dict[bytes, array] = {}
+        # Global: instantes ordenados y código de categoría de cada evento.
+        self._times = array('d')
+        self._event_categories = array('H')
+        self._events_loaded = False
+        self._load_categories()
+
+    def __len__(self) -> int:
+        """Devuelve el número de eventos registrados."""
+        self._load_events()
+        return len(self._times)
+
+    def _load_categories(self) -> None:
+        """Lee las categorías guardadas que aún no se conocen."""
+        try:
+            with open(self.categories_filename, encoding='utf-8', newline='\n') as file:
+                self._read_categories(file)
+        except FileNotFoundError:
+            pass
+
+    def _read_categories(self, file: TextIO) -> None:
+        """
+        Registra las categorías del archivo posteriores a las ya conocidas.
+
+        El código de cada categoría es su número de línea, por lo que las
+        categorías añadidas por otros procesos se leen en el mismo orden.
+        """
+        for number, line in enumerate(file):
+            if number >= len(self._categories) and line.endswith('\n'):
+                self._register_category(_unescape_category(line[:-1]))
+
+    def _load_events(self) -> None:
+        """Lee e indexa los eventos guardados, si aún no se leyeron."""
+        if self._events_loaded:
+            return
+        self._events_loaded = True
+        # Los eventos de otros procesos pueden usar categorías que añadieron después.
+        self._load_categories()
+        try:
+            with open(self.filename, 'rb') as file:
+                content = file.read()
+        except FileNotFoundError:
+            return
+        # Un registro incompleto al final (escritura interrumpida) se descarta.
+        content = content[:len(content) - len(content) % _RECORD.size]
+        for key, seconds, progress, code in _RECORD.iter_unpack(content):
+            self._index(key, seconds, progress, code)
+
+    def _register_category(self, category: str) -> int:
+        """Asigna un código a una categoría nueva en memoria."""
+        code = len(self._categories)
+        self._categories.append(category)
+        self._category_codes[category] = code
+        return code
+
+    def _category_code(self, category: str) -> int:
+        """
+        Obtiene el código de una categoría, guardándola si es nueva.
+
+        Las categorías nuevas se anexan con el archivo bloqueado y tras releer
+        las que hayan añadido otros procesos, para que todos los procesos que
+        comparten el historial den el mismo código a cada categoría.
+        """
+        code = self._category_codes.get(category)
+        if code is None:
+            with open(self.categories_filename, 'a+', encoding='utf-8', newline='\n') as file:
+                lock_file(file)
+                try:
+                    file.seek(0)
+                    self._read_categories(file)
+                    code = self._category_codes.get(category)
+                    if code is None:
+                        file.write(f"{_escape_category(category)}\n")
+                        file.flush()
+                        code = self._register_category(category)
+                finally:
+                    unlock_file(file)
+        return code
+
+    def _index(self, key: bytes, seconds: float, progress: int, code: int) -> None:
+        """Añade un evento a los índices por tarea y por instante."""
+        times = self._task_times.get(key)
+        if times is None:
+            times = self._task_times[key] = array('d')
+            self._task_progress[key] = array('B')
+        position = bisect_right(times, seconds)
+        times.insert(position, seconds)
+        self._task_progress[key].insert(position, progress)
+
+        if not self._times or seconds >= self._times[-1]:
+            self._times.append(seconds)
+            self._event_categories.append(code)
+        else:
+            position = bisect_right(self._times, seconds)
+            self._times.insert(position, seconds)
+            self._event_categories.insert(position, code)
+
+    def record(self, task: Task) -> None:
+        """
+        Registra el progreso actual de una tarea en el instante de su última actualización.
+
+        Args:
+            task: Tarea cuyo progreso se registra
+        """
+        self.record_many([task])
+
+    def record_many(self, tasks: Iterable[Task]) -> None:
+        """
+        Registra el progreso actual de varias tareas con una única escritura.
+
+        Args:
+            tasks: Tareas cuyo progreso se registra
+        """
+        events = [(_task_key(task.id), _to_seconds(task.last_update), task.progress,
+                   self._category_code(task.category)) for task in tasks]
+        if not events:
+            return
+        with open(self.filename, 'ab') as file:
+            file.write(b"".join(_RECORD.pack(*event) for event in events))
+        # Si los eventos aún no se leyeron, estos se leerán del archivo con los demás.
+        if self._events_loaded:
+            for event in events:
+                self._index(*event)
+
+    def history(self, task_id: str, since: Optional[datetime] = None,
+                until: Optional[datetime] = None) -> List[Tuple[datetime, int]]:
+        """
+        Obtiene los eventos de una tarea en un rango de fechas.
+
+        Args:
+            task_id: Identificador de la tarea
+            since: Inicio del rango (incluido); sin límite si es None
+            until: Fin del rango (incluido); sin límite si es None
+
+        Returns:
+            List[Tuple[datetime, int]]: Pares (instante, progreso) en orden cronológico
+        """
+        self._load_events()
+        key = _task_key(task_id)
+        times = self._task_times.get(key, array('d'))
+        progress = self._task_progress.get(key, array('B'))
+        start = bisect_left(times, _to_seconds(since)) if since is not None else 0
+        end = bisect_right(times, _to_seconds(until)) if until is not None else len(times)
+        return [(_from_seconds(times[i]), progress[i]) for i in range(start, end)]
+
+    def velocity(self, task_id: str, days: int = 7, now: Optional[datetime] = None) -> float:
+        """
+        Calcula el avance medio por día de una tarea en los últimos días.
+
+        El avance se mide desde el último evento anterior al periodo (o el
+        primero dentro de él) hasta el último evento del periodo.
+
+        Args:
+            task_id: Identificador de la tarea
+            days: Número de días del periodo
+            now: Fin del periodo; por defecto, el instante actual
+
+        Returns:
+            float: Puntos porcentuales de progreso por día; 0 si no hay eventos
+        """
+        self._load_events()
+        now = now if now is not None else datetime.now()
+        key = _task_key(task_id)
+        times = self._task_times.get(key)
+        if not times:
+            return 0.0
+        progress = self._task_progress[key]
+        start = bisect_right(times, _to_seconds(now - timedelta(days=days)))
+        end = bisect_right(times, _to_seconds(now))
+        if start == end:
+            return 0.0
+        baseline = progress[start - 1] if start > 0 else progress[start]
+        return (progress[end - 1] - baseline) / days
+
+    def daily_activity(self, days: int = 7,
+                       now: Optional[datetime] = None) -> Dict[str, Dict[date, int]]:
+        """
+        Cuenta los eventos de progreso por categoría y día en los últimos días.
+
+        Args:
+            days: Número de días del periodo, incluido el actual
+            now: Fin del periodo; por defecto, el instante actual
+
+        Returns:
+            Dict[str, Dict[date, int]]: Número de eventos por día para cada categoría
+                con actividad
+        """
+        self._load_events()
+        now = now if now is not None else datetime.now()
+        first_day = datetime.combine(now.date() - timedelta(days=days - 1), datetime.min.time())
+        start = bisect_left(self._times, _to_seconds(first_day))
+        end = bisect_right(self._times, _to_seconds(now))
+        activity: Dict[str, Dict[date, int]] = defaultdict(lambda: defaultdict(int))
+        for i in range(start, end):
+            day = _from_seconds(self._times[i]).date()
+            activity[self._categories[self._event_categories[i]]][day] += 1
+        return {category: dict(counts) for category, counts in activity.items()}
@@ -0,0 +1,295 @@
+"""Módulo de almacenamiento de tareas repartido en un archivo por categoría."""
+import hashlib
+import json
+import os
+import re
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from src.models.task import Task
+from src.core import metrics
+from src.data.storage import Storage, StorageConflictError, atomic_open
+
+class ShardedStorage(Storage):
+    """
+    Almacenamiento con un archivo de tareas por categoría.
+
+    El directorio contiene un fragmento por categoría, con el formato de
+    `tasks.json`, y un manifiesto (`manifest.json`) que asocia cada categoría
+    con su fragmento y su número de tareas. Cada guardado lee y reescribe solo
+    los fragmentos de las categorías afectadas, y `load_category` carga una
+    categoría sin leer las demás.
+
+    El cerrojo entre procesos y la detección de cambios funcionan como en
+    `Storage`, tomando el manifiesto como referencia, ya que se reescribe en
+    cada guardado. Los conflictos se detectan con las tareas de los fragmentos
+    afectados. Las tareas se cargan agrupadas por categoría, en el orden en que
+    aparecieron las categorías. No admite copias de seguridad.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, filename: str = "tasks.shards", fsync: bool = True) -> None:
+        """
+        Inicializa el almacenamiento.
+
+        Args:
+            filename: Directorio de los fragmentos; se crea al guardar
+            fsync: Si es True cada guardado se sincroniza con el disco
+        """
+        super().__init__(filename, fsync=fsync)
+        self.ndjson = False
+        self.manifest_filename = os.path.join(filename, self.MANIFEST)
+        self._shard_of: Dict[str, str] = {}
+
+    @staticmethod
+    def _shard_name(category: str) -> str:
+        """Nombre de archivo del fragmento de una categoría, válido en cualquier sistema."""
+        slug = re.sub(r"[^\w-]+", "_", category, flags=re.ASCII)[:32] or "_"
+        return f"{slug}-{hashlib.sha1(category.encode('utf-8')).hexdigest()[:8]}.json"
+
+    def _read_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Lee el manifiesto: fragmento y número de tareas de cada categoría."""
+        try:
+            with open(self.manifest_filename, encoding='utf-8') as file:
+                return json.load(file)["shards"]
+        except FileNotFoundError:
+            return {}
+
+    def _current_fingerprint(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Obtiene la huella del manifiesto, que cambia con cada guardado.
+
+        Returns:
+            Optional[Tuple[int, int, int]]: Inodo, fecha de modificación y tamaño, o None
+                si el manifiesto no existe
+        """
+        try:
+            stat = os.stat(self.manifest_filename)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def shard_filename(self, category: str) -> Optional[str]:
+        """
+        Obtiene el archivo del fragmento de una categoría.
+
+        Args:
+            category: Nombre de la categoría
+
+        Returns:
+            Optional[str]: Ruta del fragmento, o None si la categoría no tiene tareas
+        """
+        entry = self._read_manifest().get(category)
+        return os.path.join(self.filename, entry["file"]) if entry else None
+
+    def load_tasks(self) -> List[Task]:
+        """
+        Carga las tareas de todos los fragmentos.
+
+        Returns:
+            List[Task]: Lista de tareas almacenadas, agrupadas por categoría
+        """
+        tasks = super().load_tasks()
+        self._shard_of = {task.id: task.category for task in tasks}
+        return tasks
+
+    @metrics.timed("storage.load_category")
+    def load_category(self, category: str) -> List[Task]:
+        """
+        Carga las tareas de una categoría leyendo solo su fragmento.
+
+        Args:
+            category: Nombre de la categoría
+
+        Returns:
+            List[Task]: Tareas de la categoría, en orden
+        """
+        with self.lock():
+            filename = self.shard_filename(category)
+            if filename is None:
+                return []
+            return [self._create_task_from_dict(data) for data in super()._iter_records(filename)]
+
+    def _iter_records(self, filename: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre los registros de todos los fragmentos, en el orden del manifiesto.
+
+        Args:
+            filename: No se usa; este almacenamiento no tiene copias de seguridad
+
+        Yields:
+            Dict[str, Any]: Cada registro de tarea
+        """
+        for entry in self._read_manifest().values():
+            yield from super()._iter_records(os.path.join(self.filename, entry["file"]))
+
+    def _read_shards(self, categories: Iterable[str]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Lee los registros de varios fragmentos, indexados por categoría y `id`."""
+        manifest = self._read_manifest()
+        shards: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for category in categories:
+            shards[category] = {}
+            if category in manifest:
+                path = os.path.join(self.filename, manifest[category]["file"])
+                for data in super()._iter_records(path):
+                    task_id = data.get('id') or self._legacy_task_id(data)
+                    shards[category][task_id] = dict(data, id=task_id)
+        return shards
+
+    @metrics.timed("storage.save_task")
+    def save_task(self, task: Task) -> None:
+        """
+        Guarda una nueva tarea reescribiendo solo el fragmento de su categoría.
+
+        Args:
+            task: Tarea a guardar
+        """
+        self._apply([task], [])
+
+    @metrics.timed("storage.update_task")
+    def update_task(self, updated_task: Task) -> None:
+        """
+        Actualiza una tarea existente reescribiendo solo los fragmentos afectados.
+
+        Args:
+            updated_task: Tarea con la información actualizada
+        """
+        self._apply([updated_task], [], only_existing=True)
+
+    @metrics.timed("storage.save_changes")
+    def save_changes(self, tasks: Collection[Task], changed: Iterable[Task] = (),
+                     deleted: Iterable[Task] = ()) -> bool:
+        """
+        Persiste las modificaciones reescribiendo solo los fragmentos afectados.
+
+        Args:
+            tasks: Colección completa de tareas tras la modificación (no se usa)
+            changed: Tareas creadas o modificadas
+            deleted: Tareas eliminadas
+
+        Returns:
+            bool: True si el almacenamiento incluye cambios de otros procesos que
+                `tasks` aún no refleja
+
+        Raises:
+            StorageConflictError: Si otro proceso modificó o eliminó alguna de las
+                tareas afectadas; en ese caso no se guarda nada
+        """
+        return self._apply(list(changed), list(deleted))
+
+    def _apply(self, changed: List[Task], deleted: List[Task], only_existing: bool = False) -> bool:
+        """
+        Aplica cambios sobre los fragmentos de las categorías afectadas.
+
+        Se leen del disco los fragmentos de la categoría actual y de la anterior
+        de cada tarea afectada, se comprueban los conflictos si otro proceso
+        guardó desde la última carga y se reescriben esos fragmentos.
+
+        Args:
+            changed: Tareas creadas o modificadas
+            deleted: Tareas eliminadas
+            only_existing: Si es True, las tareas modificadas que no existen se ignoran
+
+        Returns:
+            bool: True si otro proceso había guardado cambios desde la última carga
+        """
+        with self.lock():
+            external = self.has_external_changes()
+            dirty: Set[str] = {task.category for task in changed}
+            dirty.update(self._shard_of[task.id] for task in changed + deleted
+                         if task.id in self._shard_of)
+            shards = self._read_shards(dirty)
+            location = {task_id: category for category, records in shards.items()
+                        for task_id in records}
+            if only_existing:
+                changed = [task for task in changed if task.id in location]
+            if external:
+                conflicts = {task.id for task in changed + deleted
+                             if self._versions.get(task.id) != self._stored_version(
+                                 shards, location, task.id)}
+                if conflicts:
+                    raise StorageConflictError(conflicts)
+
+            for task in deleted:
+                if task.id in location:
+                    del shards[location[task.id]][task.id]
+            for task in changed:
+                old = location.get(task.id)
+                if old is not None and old != task.category:
+                    del shards[old][task.id]
+                shards[task.category][task.id] = self._task_to_dict(task)
+
+            self._write_shards(shards)
+            for task in deleted:
+                self._versions.pop(task.id, None)
+                self._shard_of.pop(task.id, None)
+            for task in changed:
+                self._versions[task.id] = shards[task.category][task.id]['last_update']
+                self._shard_of[task.id] = task.category
+            self._mark_synced(self._versions)
+            return external
+
+    @staticmethod
+    def _stored_version(shards: Dict[str, Dict[str, Dict[str, Any]]], location: Dict[str, str],
+                        task_id: str) -> Optional[str]:
+        """Última actualización guardada de una tarea, o None si no figura en `shards`."""
+        category = location.get(task_id)
+        return shards[category][task_id].get('last_update') if category is not None else None
+
+    def _write_shards(self, shards: Dict[str, Dict[str, Dict[str, Any]]],
+                      replace_all: bool = False) -> None:
+        """
+        Reescribe fragmentos y actualiza el manifiesto.
+
+        Los fragmentos que quedan vacíos se eliminan. El manifiesto se escribe
+        al final, tras todos los fragmentos.
+
+        Args:
+            shards: Registros de cada categoría a reescribir, indexados por `id`
+            replace_all: Si es True se eliminan también los fragmentos de las
+                categorías que no figuran en `shards`
+        """
+        os.makedirs(self.filename, exist_ok=True)
+        manifest = self._read_manifest()
+        removed = [category for category in manifest
+                   if (category in shards and not shards[category])
+                   or (replace_all and category not in shards)]
+        for category in removed:
+            path = os.path.join(self.filename, manifest.pop(category)["file"])
+            if os.path.exists(path):
+                os.remove(path)
+        for category, records in shards.items():
+            if not records:
+                continue
+            name = manifest.get(category, {}).get("file") or self._shard_name(category)
+            with atomic_open(os.path.join(self.filename, name), self.fsync) as file:
+                self._write_records(file, records.values())
+                metrics.add_bytes(written=file.tell())
+            manifest[category] = {"file": name, "count": len(records)}
+        with atomic_open(self.manifest_filename, self.fsync) as file:
+            json.dump({"version": 1, "shards": manifest}, file, ensure_ascii=False, indent=2)
+
+    def _save_to_file(self, tasks: Iterable[Task]) -> None:
+        """
+        Reescribe todos los fragmentos con las tareas dadas.
+
+        Args:
+            tasks: Tareas a guardar
+        """
+        self._write_file(self._task_to_dict(task) for task in tasks)
+
+    def _write_file(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Reescribe todos los fragmentos a partir de registros de `Storage`.
+
+        Args:
+            records: Registros de tareas a guardar
+        """
+        shards: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for record in records:
+            shards.setdefault(record.get('category', "General"), {})[record['id']] = record
+        with self.lock():
+            self._write_shards(shards, replace_all=True)
+            self._shard_of = {task_id: category for category, shard in shards.items()
+                              for task_id in shard}
+            self._mark_synced({task_id: record['last_update'] for shard in shards.values()
+                               for task_id, record in shard.items()})
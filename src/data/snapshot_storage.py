@@ -0,0 +1,319 @@
+"""Módulo de almacenamiento de tareas en una instantánea binaria compacta."""
+import mmap
+import struct
+import sys
+from datetime import datetime, timedelta
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import uuid
+from src.models.task import Task, Priority
+from src.core import metrics
+from src.data.storage import Storage, atomic_open, task_to_dict
+
+_MAGIC = b"GPSNAP"
+_VERSION = 1
+# Cabecera: firma, versión, número de tareas, número de categorías, posición de
+# la tabla de categorías y posición del bloque de textos.
+_HEADER = struct.Struct('<6sHIIQQ')
+# Registro de tarea: id como UUID binario, fecha límite y última actualización en
+# microsegundos desde el año 1, prioridad, progreso, completada, longitud del id
+# textual (0 si el id es un UUID), categoría, posición de los textos de la tarea
+# y longitudes del nombre y la descripción.
+_RECORD = struct.Struct('<16sqqBBBHIQII')
+_CATEGORY_LENGTH = struct.Struct('<H')
+_MICROSECOND = timedelta(microseconds=1)
+_PRIORITIES: Tuple[Priority, ...] = tuple(Priority)
+_PRIORITY_CODES: Dict[Priority, int] = {priority: code for code, priority in enumerate(_PRIORITIES)}
+
+def _to_micros(moment: datetime) -> int:
+    """Convierte una fecha sin zona horaria en microsegundos desde el año 1."""
+    if moment.tzinfo is not None:
+        raise ValueError("La instantánea binaria no admite fechas con zona horaria")
+    return (moment - datetime.min) // _MICROSECOND
+
+def _from_micros(value: int) -> datetime:
+    """Convierte microsegundos desde el año 1 en una fecha sin zona horaria."""
+    return datetime.min + timedelta(microseconds=value)
+
+def _uuid_bytes(task_id: str) -> Optional[bytes]:
+    """Obtiene los 16 bytes de un id que es un UUID en hexadecimal, o None si no lo es."""
+    if len(task_id) != 32:
+        return None
+    try:
+        value = uuid.UUID(hex=task_id)
+    except ValueError:
+        return None
+    return value.bytes if value.hex == task_id else None
+
+def write_snapshot(file: BinaryIO, tasks: Iterable[Task]) -> int:
+    """
+    Escribe tareas en formato de instantánea binaria.
+
+    Args:
+        file: Archivo abierto en modo binario
+        tasks: Tareas a escribir, en orden
+
+    Returns:
+        int: Número de tareas escritas
+
+    Raises:
+        ValueError: Si una tarea no puede representarse (fecha con zona horaria o
+            texto demasiado largo)
+    """
+    categories: Dict[str, int] = {}
+    records = bytearray()
+    texts = bytearray()
+    count = 0
+    for task in tasks:
+        binary_id = _uuid_bytes(task.id)
+        text_id = b"" if binary_id is not None else task.id.encode('utf-8')
+        name = task.name.encode('utf-8')
+        description = task.description.encode('utf-8')
+        category = categories.setdefault(task.category, len(categories))
+        try:
+            records += _RECORD.pack(binary_id or bytes(16), _to_micros(task.deadline),
+                                    _to_micros(task.last_update), _PRIORITY_CODES[task.priority],
+                                    task.progress, task.completed, len(text_id), category,
+                                    len(texts), len(name), len(description))
+        except struct.error as error:
+            raise ValueError(f"No se puede guardar la tarea {task.id}: {error}") from error
+        texts += text_id
+        texts += name
+        texts += description
+        count += 1
+
+    table = bytearray()
+    for category_name in categories:
+        encoded = category_name.encode('utf-8')
+        try:
+            table += _CATEGORY_LENGTH.pack(len(encoded))
+        except struct.error as error:
+            raise ValueError(f"Nombre de categoría demasiado largo: {category_name[:40]}…") from error
+        table += encoded
+    categories_offset = _HEADER.size + len(records)
+    file.write(_HEADER.pack(_MAGIC, _VERSION, count, len(categories), categories_offset,
+                            categories_offset + len(table)))
+    file.write(records)
+    file.write(table)
+    file.write(texts)
+    return count
+
+class SnapshotView(Sequence[Task]):
+    """
+    Acceso de solo lectura a las tareas de una instantánea proyectada en memoria.
+
+    El archivo se proyecta con `mmap` y cada tarea se construye solo cuando se
+    pide: sus campos fijos están en un registro de tamaño constante, por lo que
+    acceder a la tarea `i` no recorre las anteriores. Debe cerrarse con `close`
+    o usarse como gestor de contexto.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """
+        Abre y valida una instantánea.
+
+        Args:
+            filename: Archivo de la instantánea
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+            ValueError: Si el archivo no es una instantánea válida
+        """
+        with open(filename, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+        except BaseException:
+            self._mmap.close()
+            raise
+
+    def _read_header(self) -> None:
+        """Lee la cabecera y la tabla de categorías."""
+        try:
+            (magic, version, self._count, category_count, self._categories_offset,
+             self._texts_offset) = _HEADER.unpack_from(self._mmap, 0)
+        except struct.error as error:
+            raise ValueError("El archivo no es una instantánea de tareas") from error
+        if magic != _MAGIC:
+            raise ValueError("El archivo no es una instantánea de tareas")
+        if version != _VERSION:
+            raise ValueError(f"Versión de instantánea no admitida: {version}")
+        if (self._categories_offset != _HEADER.size + self._count * _RECORD.size
+                or self._texts_offset > len(self._mmap)):
+            raise ValueError("La instantánea está dañada")
+        self._categories: List[str] = []
+        position = self._categories_offset
+        try:
+            for _ in range(category_count):
+                (length,) = _CATEGORY_LENGTH.unpack_from(self._mmap, position)
+                position += _CATEGORY_LENGTH.size
+                self._categories.append(
+                    sys.intern(self._mmap[position:position + length].decode('utf-8')))
+                position += length
+        except struct.error as error:
+            raise ValueError("La instantánea está dañada") from error
+        if position != self._texts_offset:
+            raise ValueError("La instantánea está dañada")
+
+    @property
+    def size(self) -> int:
+        """Tamaño del archivo en bytes."""
+        return len(self._mmap)
+
+    def close(self) -> None:
+        """Libera la proyección del archivo."""
+        self._mmap.close()
+
+    def __enter__(self) -> "SnapshotView":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Devuelve el número de tareas."""
+        return self._count
+
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Construye la tarea en una posición.
+
+        Args:
+            index: Posición de la tarea (admite índices negativos y rebanadas)
+
+        Returns:
+            Task: La tarea, o una lista de tareas si se pidió una rebanada
+
+        Raises:
+            IndexError: Si la posición no existe
+        """
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Posición de tarea fuera de rango")
+        return self._build(_RECORD.unpack_from(self._mmap, _HEADER.size + index * _RECORD.size))
+
+    def __iter__(self) -> Iterator[Task]:
+        """Recorre las tareas en orden, decodificando los registros por bloques."""
+        records = self._mmap[_HEADER.size:self._categories_offset]
+        for fields in _RECORD.iter_unpack(records):
+            yield self._build(fields)
+
+    def _build(self, fields: Tuple[Any, ...]) -> Task:
+        """Construye una tarea a partir de los campos de su registro."""
+        (binary_id, deadline, last_update, priority, progress, completed, id_length,
+         category, offset, name_length, description_length) = fields
+        start = self._texts_offset + offset
+        end = start + id_length + name_length + description_length
+        if end > len(self._mmap):
+            raise ValueError("La instantánea está dañada")
+        text = self._mmap[start:end]
+        try:
+            task = Task(text[id_length:id_length + name_length].decode('utf-8'),
+                        text[id_length + name_length:].decode('utf-8'),
+                        _from_micros(deadline), _PRIORITIES[priority], self._categories[category],
+                        is_loading=True,
+                        task_id=text[:id_length].decode('utf-8') if id_length else binary_id.hex())
+        except IndexError as error:
+            raise ValueError("La instantánea está dañada") from error
+        task.progress = progress
+        task.last_update = _from_micros(last_update)
+        task.completed = bool(completed)
+        return task
+
+class SnapshotStorage(Storage):
+    """
+    Almacenamiento de tareas en una instantánea binaria compacta.
+
+    Cada tarea ocupa un registro de tamaño fijo con las fechas como enteros y
+    la categoría como índice en una tabla de cadenas; los nombres y
+    descripciones se guardan aparte en UTF-8. Al cargar, el archivo se
+    proyecta en memoria y las tareas se construyen directamente desde los
+    registros, sin analizar texto. `open_view` permite además acceder a
+    tareas sueltas sin construir las demás.
+
+    Conserva el cerrojo entre procesos, la fusión de cambios y las copias de
+    seguridad de `Storage`. Cada guardado reescribe la instantánea completa.
+    """
+
+    def __init__(self, filename: str = "tasks.snap", backups: int = 0,
+                 fsync: bool = True) -> None:
+        """
+        Inicializa el almacenamiento.
+
+        Args:
+            filename: Archivo de la instantánea
+            backups: Número de copias de seguridad rotativas que se conservan
+            fsync: Si es True cada guardado se sincroniza con el disco
+        """
+        super().__init__(filename, backups, fsync)
+        self.ndjson = False
+
+    def open_view(self) -> SnapshotView:
+        """
+        Proyecta la instantánea en memoria para acceder a sus tareas bajo demanda.
+
+        Returns:
+            SnapshotView: Vista de solo lectura; debe cerrarse tras usarla
+
+        Raises:
+            FileNotFoundError: Si la instantánea no existe
+        """
+        return SnapshotView(self.filename)
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """
+        Recorre las tareas de la instantánea construyéndolas a medida que se leen.
+
+        Yields:
+            Task: Cada tarea almacenada, en orden
+        """
+        yield from self._iter_tasks(self.filename)
+
+    @staticmethod
+    def _iter_tasks(filename: str) -> Iterator[Task]:
+        """Recorre las tareas de una instantánea; un archivo inexistente no tiene tareas."""
+        try:
+            view = SnapshotView(filename)
+        except FileNotFoundError:
+            return
+        with view:
+            metrics.add_bytes(read=view.size)
+            yield from view
+
+    def _iter_records(self, filename: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre las tareas de la instantánea como registros de `Storage`.
+
+        Args:
+            filename: Archivo a leer; por defecto el archivo principal
+
+        Yields:
+            Dict[str, Any]: Cada registro de tarea, en orden
+        """
+        for task in self._iter_tasks(filename or self.filename):
+            yield task_to_dict(task)
+
+    def _save_to_file(self, tasks: Iterable[Task]) -> None:
+        """
+        Reescribe la instantánea de forma atómica.
+
+        Args:
+            tasks: Tareas a guardar
+        """
+        tasks = list(tasks)
+        with self.lock():
+            with atomic_open(self.filename, self.fsync, binary=True) as file:
+                write_snapshot(file, tasks)
+                self._rotate_backups()
+            self._mark_synced({task.id: task.last_update.isoformat() for task in tasks})
+
+    def _write_file(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Reescribe la instantánea a partir de registros de `Storage`.
+
+        Args:
+            records: Registros de tareas a guardar
+        """
+        self._save_to_file([self._create_task_from_dict(record) for record in records])
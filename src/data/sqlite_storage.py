@@ -0,0 +1,252 @@
+"""Módulo de almacenamiento de tareas sobre SQLite."""
+import argparse
+import sqlite3
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Collection, Optional, Tuple
+from src.models.task import Task, Priority
+from src.core import metrics
+from src.data.storage import Storage, TASK_FIELDS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    deadline TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    last_update TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT 'General',
+    completed INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_category ON tasks (category);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority, completed);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed);
+CREATE INDEX IF NOT EXISTS idx_tasks_last_update ON tasks (completed, last_update);
+"""
+
+_COLUMNS = TASK_FIELDS
+
+class SqliteStorage(Storage):
+    """
+    Almacenamiento de tareas en una base de datos SQLite.
+
+    Mantiene la interfaz de `Storage` y añade consultas filtradas que se
+    resuelven con los índices de la base de datos sin cargar el resto de tareas.
+    Las filas se identifican por el `id` de la tarea y una misma fila produce
+    siempre el mismo objeto `Task` mientras la fila no cambie.
+    """
+
+    def __init__(self, filename: str = "tasks.db") -> None:
+        """
+        Inicializa la base de datos, creando el esquema si no existe.
+
+        Args:
+            filename: Ruta del archivo de base de datos
+        """
+        super().__init__(filename)
+        self._connection = sqlite3.connect(filename, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._tasks: Dict[str, Tuple[Tuple[Any, ...], Task]] = {}
+        """Última fila leída o escrita de cada tarea, por `id`, y su objeto `Task`."""
+
+    def close(self) -> None:
+        """Cierra la conexión con la base de datos."""
+        self._connection.close()
+
+    @metrics.timed("storage.load_tasks")
+    def load_tasks(self) -> List[Task]:
+        """
+        Carga todas las tareas en orden de inserción.
+
+        Returns:
+            List[Task]: Lista de tareas almacenadas
+        """
+        return self._select("", ())
+
+    @metrics.timed("storage.query_tasks")
+    def query_tasks(self, category: Optional[str] = None, priority: Optional[Priority] = None,
+                    completed: Optional[bool] = None,
+                    updated_before: Optional[datetime] = None) -> List[Task]:
+        """
+        Obtiene las tareas que cumplen todos los filtros indicados.
+
+        Args:
+            category: Categoría de las tareas
+            priority: Prioridad de las tareas
+            completed: Estado de completitud de las tareas
+            updated_before: Solo tareas cuya última actualización es anterior a esta fecha
+
+        Returns:
+            List[Task]: Tareas que cumplen los filtros, en orden de inserción
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+        if category is not None:
+            conditions.append("category = ?")
+            params.append(category)
+        if priority is not None:
+            conditions.append("priority = ?")
+            params.append(priority.name)
+        if completed is not None:
+            conditions.append("completed = ?")
+            params.append(int(completed))
+        if updated_before is not None:
+            conditions.append("last_update < ?")
+            params.append(updated_before.isoformat())
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._select(where, tuple(params))
+
+    def _select(self, where: str, params: Tuple[Any, ...]) -> List[Task]:
+        """
+        Ejecuta una consulta sobre la tabla de tareas.
+
+        Args:
+            where: Cláusula WHERE (vacía para obtener todas las filas)
+            params: Parámetros de la consulta
+
+        Returns:
+            List[Task]: Tareas correspondientes a las filas obtenidas
+        """
+        query = f"SELECT {', '.join(_COLUMNS)} FROM tasks {where} ORDER BY rowid"
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+            tasks = [self._task_for_row(row) for row in rows]
+            if not where:
+                # Olvida las tareas que otra conexión eliminó.
+                self._tasks = {row[0]: self._tasks[row[0]] for row in rows}
+            return tasks
+
+    def _task_for_row(self, row: Tuple[Any, ...]) -> Task:
+        """
+        Obtiene la tarea asociada a una fila, creándola si es necesario.
+
+        Si la fila cambió desde que se leyó o se guardó la tarea (por ejemplo,
+        desde otra conexión), se crea una tarea nueva con los valores actuales
+        en lugar de modificar la que ya tienen quienes la cargaron.
+
+        Args:
+            row: Valores de las columnas de la tarea
+
+        Returns:
+            Task: Tarea correspondiente a la fila
+        """
+        cached = self._tasks.get(row[0])
+        if cached is not None and cached[0] == row:
+            return cached[1]
+        data = dict(zip(_COLUMNS, row))
+        data['completed'] = bool(data['completed'])
+        task = self._create_task_from_dict(data)
+        self._tasks[task.id] = (row, task)
+        return task
+
+    @metrics.timed("storage.save_task")
+    def save_task(self, task: Task) -> None:
+        """
+        Guarda una nueva tarea.
+
+        Args:
+            task: Tarea a guardar
+        """
+        with self._lock, self._connection:
+            self._upsert(task)
+
+    @metrics.timed("storage.update_task")
+    def update_task(self, updated_task: Task) -> None:
+        """
+        Actualiza una tarea existente.
+
+        Args:
+            updated_task: Tarea con la información actualizada
+        """
+        assignments = ', '.join(f"{column} = ?" for column in _COLUMNS[1:])
+        values = self._row_values(updated_task)
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                f"UPDATE tasks SET {assignments} WHERE id = ?", values[1:] + (updated_task.id,))
+            if cursor.rowcount:
+                self._tasks[updated_task.id] = (values, updated_task)
+
+    @metrics.timed("storage.save_changes")
+    def save_changes(self, tasks: Collection[Task], changed: Iterable[Task] = (),
+                     deleted: Iterable[Task] = ()) -> bool:
+        """
+        Aplica en una única transacción las tareas modificadas o eliminadas.
+
+        Args:
+            tasks: Colección completa de tareas tras la modificación
+            changed: Tareas creadas o modificadas
+            deleted: Tareas eliminadas
+
+        Returns:
+            bool: Siempre False; SQLite ya serializa las escrituras concurrentes
+        """
+        with self._lock, self._connection:
+            for task in deleted:
+                self._connection.execute("DELETE FROM tasks WHERE id = ?", (task.id,))
+                self._tasks.pop(task.id, None)
+            for task in changed:
+                self._upsert(task)
+        return False
+
+    def _save_to_file(self, tasks: Iterable[Task]) -> None:
+        """
+        Reemplaza el contenido de la base de datos por las tareas dadas.
+
+        Args:
+            tasks: Tareas a guardar
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM tasks")
+            self._tasks = {}
+            for task in tasks:
+                self._upsert(task)
+
+    def _upsert(self, task: Task) -> None:
+        """Inserta o sobrescribe la fila de una tarea conservando su posición."""
+        assignments = ', '.join(f"{column} = excluded.{column}" for column in _COLUMNS[1:])
+        values = self._row_values(task)
+        self._connection.execute(
+            f"INSERT INTO tasks ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))}) "
+            f"ON CONFLICT(id) DO UPDATE SET {assignments}",
+            values)
+        self._tasks[task.id] = (values, task)
+
+    def _row_values(self, task: Task) -> Tuple[Any, ...]:
+        """Obtiene los valores de las columnas para una tarea."""
+        data = self._task_to_dict(task)
+        data['completed'] = int(data['completed'])
+        return tuple(data[column] for column in _COLUMNS)
+
+def migrate_from_json(json_filename: str, db_filename: str) -> int:
+    """
+    Importa en una base de datos SQLite las tareas de un archivo JSON de `Storage`.
+
+    Args:
+        json_filename: Archivo JSON de origen
+        db_filename: Base de datos de destino
+
+    Returns:
+        int: Número de tareas migradas
+    """
+    tasks = Storage(json_filename).load_tasks()
+    storage = SqliteStorage(db_filename)
+    try:
+        storage.save_tasks(tasks)
+    finally:
+        storage.close()
+    return len(tasks)
+
+def main() -> None:
+    """Punto de entrada de la herramienta de migración."""
+    parser = argparse.ArgumentParser(description="Migra un archivo de tareas JSON a SQLite")
+    parser.add_argument("source", help="Archivo JSON de origen")
+    parser.add_argument("target", help="Base de datos SQLite de destino")
+    args = parser.parse_args()
+    count = migrate_from_json(args.source, args.target)
+    print(f"{count} tareas migradas a {args.target}")
+
+if __name__ == "__main__":
+    main()
@@ -1,54 +1,412 @@
 """Módulo para la persistencia de datos de tareas."""
 import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import (List, Dict, Any, Iterable, Iterator, Collection, Optional, Set, TextIO,
+                    Tuple)
 from src.models.task import Task, Priority
+from src.core import metrics
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None  # type: ignore[assignment]
+
+_READ_CHUNK_SIZE = 64 * 1024
+
+TASK_FIELDS = ('id', 'name', 'description', 'deadline', 'priority', 'progress', 'last_update',
+               'category', 'completed')
+"""Campos de cada registro de tarea, en el orden en que se guardan."""
+
+def task_to_dict(task: Task) -> Dict[str, Any]:
+    """
+    Convierte una tarea en un registro serializable.
+
+    Args:
+        task: Tarea a convertir
+
+    Returns:
+        Dict[str, Any]: Registro con los campos de `TASK_FIELDS`
+    """
+    return {
+        'id': task.id,
+        'name': task.name,
+        'description': task.description,
+        'deadline': task.deadline.isoformat(),
+        'priority': task.priority.name,
+        'progress': task.progress,
+        'last_update': task.last_update.isoformat(),
+        'category': task.category,
+        'completed': task.completed
+    }
+
+def iter_json_array(file: TextIO) -> Iterator[Dict[str, Any]]:
+    """
+    Recorre los elementos de un arreglo JSON leyendo el archivo por bloques.
+
+    Args:
+        file: Archivo abierto en modo texto
+
+    Yields:
+        Dict[str, Any]: Cada elemento del arreglo
+
+    Raises:
+        json.JSONDecodeError: Si el contenido no es un arreglo JSON válido
+    """
+    decoder = json.JSONDecoder()
+    buffer = file.read(_READ_CHUNK_SIZE)
+    pos = len(buffer) - len(buffer.lstrip())
+    if not buffer.startswith('[', pos):
+        raise json.JSONDecodeError("Se esperaba un arreglo JSON", buffer, pos)
+    pos += 1
+    while True:
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+            pos += 1
+        if pos == len(buffer):
+            more = file.read(_READ_CHUNK_SIZE)
+            if not more:
+                raise json.JSONDecodeError("Arreglo JSON sin terminar", buffer, pos)
+            buffer, pos = more, 0
+            continue
+        if buffer[pos] == ']':
+            return
+        try:
+            item, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            more = file.read(_READ_CHUNK_SIZE)
+            if not more:
+                raise
+            buffer, pos = buffer[pos:] + more, 0
+            continue
+        yield item
+
+def _fsync_directory(directory: str) -> None:
+    """
+    Sincroniza un directorio para que un renombrado sobreviva a un corte.
+
+    Args:
+        directory: Directorio a sincronizar
+    """
+    if os.name == 'nt':
+        return
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+@contextmanager
+def atomic_open(path: str, fsync: bool = True, binary: bool = False) -> Iterator[Any]:
+    """
+    Abre un archivo temporal que reemplaza a `path` solo si la escritura termina.
+
+    El contenido se escribe en un temporal del mismo directorio, se sincroniza
+    con el disco y se renombra sobre el original, de modo que una interrupción
+    deja intacto el archivo anterior.
+
+    Args:
+        path: Archivo a reemplazar
+        fsync: Si es True se sincronizan el archivo y el directorio con el disco
+        binary: Si es True el temporal se abre en modo binario
+
+    Yields:
+        TextIO | BinaryIO: Archivo temporal abierto en modo texto o binario
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.",
+                                            suffix=".tmp", dir=directory)
+    try:
+        with (os.fdopen(descriptor, 'wb') if binary
+              else os.fdopen(descriptor, 'w', encoding='utf-8')) as file:
+            yield file
+            file.flush()
+            if fsync:
+                os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if fsync:
+        _fsync_directory(directory)
+
+def lock_file(file: TextIO) -> None:
+    """Adquiere un cerrojo exclusivo de aviso sobre un archivo abierto."""
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+    elif msvcrt is not None:  # pragma: no cover - Windows
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+
+def unlock_file(file: TextIO) -> None:
+    """Libera el cerrojo adquirido con `lock_file`."""
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    elif msvcrt is not None:  # pragma: no cover - Windows
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+class StorageConflictError(Exception):
+    """Se lanza cuando otro proceso modificó las mismas tareas que se intentan guardar."""
+
+    def __init__(self, task_ids: Iterable[str]) -> None:
+        """
+        Inicializa el error.
+
+        Args:
+            task_ids: Identificadores de las tareas en conflicto
+        """
+        self.task_ids = sorted(task_ids)
+        super().__init__("Otro proceso modificó las tareas que intenta guardar "
+                         f"({len(self.task_ids)} en conflicto); se han recargado sus cambios.")
 
 class Storage:
-    """Clase que maneja el almacenamiento persistente de tareas."""
+    """
+    Clase que maneja el almacenamiento persistente de tareas.
+
+    Los archivos con extensión `.ndjson` o `.jsonl` se guardan con una tarea
+    por línea; el resto como un arreglo JSON.
+
+    Varios procesos pueden compartir el archivo: cada lectura y escritura se
+    hace con un cerrojo de aviso sobre `<archivo>.lock`, y `save_changes`
+    fusiona los cambios hechos por otros procesos desde la última carga o
+    rechaza el guardado si ambos modificaron la misma tarea.
+    """
 
-    def __init__(self, filename: str = "tasks.json") -> None:
+    NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+    def __init__(self, filename: str = "tasks.json", backups: int = 0,
+                 fsync: bool = True) -> None:
         """
         Inicializa el sistema de almacenamiento.
 
         Args:
             filename: Nombre del archivo para guardar las tareas
+            backups: Número de copias de seguridad rotativas que se conservan
+            fsync: Si es True cada guardado se sincroniza con el disco
         """
         self.filename = filename
+        self.ndjson = filename.endswith(self.NDJSON_EXTENSIONS)
+        self.backups = backups
+        self.fsync = fsync
+        self.recovered_from: Optional[str] = None
+        """Copia de seguridad usada en la última carga, si el archivo principal estaba dañado."""
+        self.lock_filename = f"{filename}.lock"
+        self._fingerprint: Optional[Tuple[int, int, int]] = None
+        self._synced = False
+        self._versions: Dict[str, str] = {}
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_handle: Optional[TextIO] = None
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Mantiene el cerrojo entre procesos sobre el archivo de tareas.
+
+        El cerrojo es reentrante dentro del mismo objeto.
+        """
+        with self._thread_lock:
+            if not self._lock_depth:
+                handle = open(self.lock_filename, 'a+', encoding='utf-8') # pylint: disable=consider-using-with
+                lock_file(handle)
+                self._lock_handle = handle
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if not self._lock_depth and self._lock_handle is not None:
+                    unlock_file(self._lock_handle)
+                    self._lock_handle.close()
+                    self._lock_handle = None
+
+    def _current_fingerprint(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Obtiene la huella del archivo en disco.
 
+        Returns:
+            Optional[Tuple[int, int, int]]: Inodo, fecha de modificación y tamaño, o None
+                si el archivo no existe
+        """
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def has_external_changes(self) -> bool:
+        """
+        Indica si otro proceso modificó el archivo desde la última carga o guardado.
+
+        Solo consulta los metadatos del archivo, sin leerlo.
+
+        Returns:
+            bool: True si el archivo cambió
+        """
+        return self._synced and self._current_fingerprint() != self._fingerprint
+
+    def backup_filename(self, number: int) -> str:
+        """
+        Obtiene el nombre de una copia de seguridad.
+
+        Args:
+            number: Número de la copia (1 es la más reciente)
+
+        Returns:
+            str: Ruta de la copia de seguridad
+        """
+        return f"{self.filename}.bak{number}"
+
+    @metrics.timed("storage.load_tasks")
     def load_tasks(self) -> List[Task]:
         """
         Carga las tareas desde el archivo.
 
+        Si el archivo principal está dañado se cargan las tareas de la copia
+        de seguridad más reciente que pueda leerse y se anota en `recovered_from`.
+
         Returns:
             List[Task]: Lista de tareas almacenadas
+
+        Raises:
+            ValueError: Si el archivo está dañado y ninguna copia puede leerse
         """
+        with self.lock():
+            fingerprint = self._current_fingerprint()
+            tasks = self._load_with_recovery()
+            self._fingerprint = fingerprint
+            self._synced = True
+            self._versions = {task.id: task.last_update.isoformat() for task in tasks}
+            return tasks
+
+    def _load_with_recovery(self) -> List[Task]:
+        """
+        Carga las tareas del archivo principal o, si está dañado, de una copia.
+
+        Returns:
+            List[Task]: Lista de tareas almacenadas
+        """
+        self.recovered_from = None
         try:
-            with open(self.filename, 'r', encoding='utf-8') as file:
-                data: List[Dict[str, Any]] = json.load(file)
-                tasks: List[Task] = []
-                for task_data in data:
-                    task = self._create_task_from_dict(task_data)
-                    tasks.append(task)
+            return list(self.iter_tasks())
+        except (ValueError, KeyError) as error:
+            for number in range(1, self.backups + 1):
+                backup = self.backup_filename(number)
+                if not os.path.exists(backup):
+                    continue
+                try:
+                    tasks = [self._create_task_from_dict(data)
+                             for data in self._iter_records(backup)]
+                except (ValueError, KeyError):
+                    continue
+                self.recovered_from = backup
                 return tasks
+            raise error
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """
+        Recorre las tareas del archivo construyéndolas a medida que se leen.
+
+        El archivo se lee por bloques, por lo que la memoria necesaria no
+        depende del tamaño del archivo sino de cuántas tareas conserve quien
+        consume el iterador.
+
+        Yields:
+            Task: Cada tarea almacenada, en orden
+        """
+        for data in self._iter_records():
+            yield self._create_task_from_dict(data)
+
+    def _iter_records(self, filename: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre los registros del archivo sin cargarlo completo.
+
+        Args:
+            filename: Archivo a leer; por defecto el archivo principal
+
+        Yields:
+            Dict[str, Any]: Cada registro de tarea, en orden
+        """
+        try:
+            with open(filename or self.filename, 'r', encoding='utf-8') as file:
+                metrics.add_bytes(read=os.fstat(file.fileno()).st_size)
+                if self.ndjson:
+                    records: Iterator[Dict[str, Any]] = (
+                        json.loads(line) for line in file if line.strip())
+                else:
+                    records = iter_json_array(file)
+                yield from self._with_legacy_ids(records)
         except FileNotFoundError:
-            return []
+            pass
+
+    @classmethod
+    def _with_legacy_ids(cls, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Asigna un identificador a los registros anteriores a los identificadores.
+
+        Los registros idénticos se distinguen por el orden en que aparecen en
+        el archivo, para que no se confundan en una sola tarea.
+
+        Args:
+            records: Registros leídos del archivo, en orden
+
+        Yields:
+            Dict[str, Any]: Cada registro, con `id`
+        """
+        seen: Dict[str, int] = {}
+        for data in records:
+            if not data.get('id'):
+                task_id = cls._legacy_task_id(data)
+                occurrence = seen.get(task_id, 0)
+                seen[task_id] = occurrence + 1
+                data = dict(data, id=cls._legacy_task_id(data, occurrence))
+            yield data
 
+    @metrics.timed("storage.save_task")
     def save_task(self, task: Task) -> None:
         """
         Guarda una nueva tarea.
 
+        En formato NDJSON la tarea se anexa al final del archivo.
+
         Args:
             task: Tarea a guardar
         """
-        tasks = self.load_tasks()
-        tasks.append(task)
-        self._save_to_file(tasks)
+        with self.lock():
+            if self.ndjson:
+                external = self.has_external_changes()
+                task_dict = self._task_to_dict(task)
+                with open(self.filename, 'a', encoding='utf-8') as file:
+                    start = file.tell()
+                    self._write_records(file, [task_dict])
+                    metrics.add_bytes(written=file.tell() - start)
+                if not external:
+                    self._fingerprint = self._current_fingerprint()
+                    self._versions[task.id] = task_dict['last_update']
+                return
+            tasks = self.load_tasks()
+            tasks.append(task)
+            self._save_to_file(tasks)
 
     def _create_task_from_dict(self, data: Dict[str, Any]) -> Task:
         """
         Crea una tarea desde un diccionario.
 
+        Los registros anteriores a los identificadores reciben uno derivado de su
+        contenido, de modo que se mantiene estable entre cargas hasta que se
+        vuelva a guardar el archivo.
+
         Args:
             data: Diccionario con datos de la tarea
 
@@ -60,8 +418,9 @@ class Storage:
             data['description'],
             datetime.fromisoformat(data['deadline']),
             Priority[data['priority']],
-            data.get('category', 'General'),
-            is_loading=True  # Pass is_loading=True when creating task from loaded data
+            sys.intern(data.get('category', 'General')),
+            is_loading=True,  # Pass is_loading=True when creating task from loaded data
+            task_id=data.get('id') or self._legacy_task_id(data)
         )
         task.progress = data.get('progress', 0)
         task.last_update = datetime.fromisoformat(data.get('last_update',
@@ -69,6 +428,36 @@ class Storage:
         task.completed = data.get('completed', False)
         return task
 
+    @staticmethod
+    def _legacy_task_id(data: Dict[str, Any], occurrence: int = 0) -> str:
+        """
+        Deriva un identificador determinista para un registro sin identificador.
+
+        Args:
+            data: Diccionario con datos de la tarea
+            occurrence: Cuántos registros idénticos aparecen antes en el archivo
+
+        Returns:
+            str: Identificador derivado del contenido del registro y de su repetición
+        """
+        content = json.dumps(data, sort_keys=True)
+        if occurrence:
+            content = f"{content}#{occurrence}"
+        return uuid.uuid5(uuid.NAMESPACE_OID, content).hex
+
+    def _task_to_dict(self, task: Task) -> Dict[str, Any]:
+        """
+        Convierte una tarea en un diccionario serializable.
+
+        Args:
+            task: Tarea a convertir
+
+        Returns:
+            Dict[str, Any]: Diccionario con los datos de la tarea
+        """
+        return task_to_dict(task)
+
+    @metrics.timed("storage.update_task")
     def update_task(self, updated_task: Task) -> None:
         """
         Actualiza una tarea existente.
@@ -76,13 +465,81 @@ class Storage:
         Args:
             updated_task: Tarea con la información actualizada
         """
-        tasks = self.load_tasks()
-        for i, task in enumerate(tasks):
-            if task.name == updated_task.name:
-                tasks[i] = updated_task
-                break
-        self._save_to_file(tasks)
+        with self.lock():
+            tasks = self.load_tasks()
+            for i, task in enumerate(tasks):
+                if task.id == updated_task.id:
+                    tasks[i] = updated_task
+                    break
+            self._save_to_file(tasks)
+
+    @metrics.timed("storage.save_changes")
+    def save_changes(self, tasks: Collection[Task], changed: Iterable[Task] = (),
+                     deleted: Iterable[Task] = ()) -> bool:
+        """
+        Persiste las modificaciones hechas sobre la lista de tareas.
 
+        La implementación por defecto reescribe el archivo completo; los
+        almacenamientos incrementales solo registran las tareas afectadas. Si
+        otro proceso modificó el archivo desde la última carga, los cambios se
+        aplican sobre el contenido actual del archivo en lugar de sobrescribirlo.
+
+        Args:
+            tasks: Colección completa de tareas tras la modificación
+            changed: Tareas creadas o modificadas
+            deleted: Tareas eliminadas
+
+        Returns:
+            bool: True si el archivo incluye cambios de otros procesos que
+                `tasks` aún no refleja
+
+        Raises:
+            StorageConflictError: Si otro proceso modificó o eliminó alguna de las
+                tareas afectadas; en ese caso no se guarda nada
+        """
+        with self.lock():
+            if not self.has_external_changes():
+                self._save_to_file(tasks)
+                return False
+            self._save_merged(changed, deleted)
+            return True
+
+    def _save_merged(self, changed: Iterable[Task], deleted: Iterable[Task]) -> None:
+        """
+        Aplica los cambios sobre el contenido actual del archivo.
+
+        Debe llamarse con el cerrojo adquirido.
+
+        Args:
+            changed: Tareas creadas o modificadas
+            deleted: Tareas eliminadas
+
+        Raises:
+            StorageConflictError: Si alguna tarea afectada cambió en disco
+        """
+        records: Dict[str, Dict[str, Any]] = {}
+        for data in self._iter_records():
+            task_id = data.get('id') or self._legacy_task_id(data)
+            records[task_id] = dict(data, id=task_id)
+
+        conflicts: Set[str] = set()
+        deleted = list(deleted)
+        changed = list(changed)
+        for task in deleted + changed:
+            known = self._versions.get(task.id)
+            current = records.get(task.id, {}).get('last_update')
+            if known != current:
+                conflicts.add(task.id)
+        if conflicts:
+            raise StorageConflictError(conflicts)
+
+        for task in deleted:
+            records.pop(task.id, None)
+        for task in changed:
+            records[task.id] = self._task_to_dict(task)
+        self._write_file(records.values())
+
+    @metrics.timed("storage.save_tasks")
     def save_tasks(self, tasks: List[Task]) -> None:
         """
         Guarda todas las tareas en el archivo.
@@ -92,26 +549,78 @@ class Storage:
         """
         self._save_to_file(tasks)
 
-    def _save_to_file(self, tasks: List[Task]) -> None:
+    def _save_to_file(self, tasks: Iterable[Task]) -> None:
         """
-        Guarda las tareas en el archivo.
+        Guarda las tareas en el archivo de forma atómica.
 
         Args:
             tasks: Lista de tareas a guardar
         """
-        data: List[Dict[str, Any]] = []
-        for task in tasks:
-            task_dict = {
-                'name': task.name,
-                'description': task.description,
-                'deadline': task.deadline.isoformat(),
-                'priority': task.priority.name,
-                'progress': task.progress,
-                'last_update': task.last_update.isoformat(),
-                'category': task.category,
-                'completed': task.completed
-            }
-            data.append(task_dict)
-
-        with open(self.filename, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=4)
+        self._write_file(self._task_to_dict(task) for task in tasks)
+
+    def _write_file(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Reemplaza de forma atómica el archivo por los registros dados.
+
+        Args:
+            records: Registros de tareas a guardar
+        """
+        versions: Dict[str, str] = {}
+
+        def remember(records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            for record in records:
+                versions[record['id']] = record['last_update']
+                yield record
+
+        with self.lock():
+            with atomic_open(self.filename, self.fsync) as file:
+                self._write_records(file, remember(records))
+                self._rotate_backups()
+            self._mark_synced(versions)
+
+    def _mark_synced(self, versions: Dict[str, str]) -> None:
+        """
+        Anota que el archivo refleja las tareas recién escritas.
+
+        Args:
+            versions: Última actualización (ISO-8601) de cada tarea guardada, por `id`
+        """
+        self._fingerprint = self._current_fingerprint()
+        self._synced = True
+        self._versions = versions
+        if self._fingerprint is not None:
+            metrics.add_bytes(written=self._fingerprint[2])
+
+    def _rotate_backups(self) -> None:
+        """
+        Desplaza las copias de seguridad y conserva el archivo actual como la más reciente.
+
+        Se llama antes de reemplazar el archivo principal, por lo que este sigue
+        existiendo en todo momento.
+        """
+        if not self.backups or not os.path.exists(self.filename):
+            return
+        for number in range(self.backups - 1, 0, -1):
+            if os.path.exists(self.backup_filename(number)):
+                os.replace(self.backup_filename(number), self.backup_filename(number + 1))
+        newest = self.backup_filename(1)
+        if os.path.exists(newest):
+            os.remove(newest)
+        try:
+            os.link(self.filename, newest)
+        except OSError:
+            shutil.copy2(self.filename, newest)
+
+    def _write_records(self, file: TextIO, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Escribe registros de tareas en el formato del archivo.
+
+        Args:
+            file: Archivo abierto en modo texto
+            records: Registros de tareas a escribir
+        """
+        if self.ndjson:
+            for record in records:
+                file.write(json.dumps(record, separators=(',', ':')) + "\n")
+        else:
+            json.dump(list(records), file, indent=4)
@@ -0,0 +1,104 @@
+"""Módulo para importar y exportar tareas en formatos CSV, JSON y NDJSON."""
+import csv
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, Optional
+from src.data.storage import TASK_FIELDS, iter_json_array
+
+FORMATS = ("csv", "json", "ndjson")
+"""Formatos de importación y exportación admitidos."""
+
+_EXTENSIONS = {".csv": "csv", ".json": "json", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    """
+    Determina el formato de un archivo.
+
+    Args:
+        path: Ruta del archivo
+        fmt: Formato explícito; tiene prioridad sobre la extensión
+
+    Returns:
+        str: Uno de `FORMATS`
+
+    Raises:
+        ValueError: Si el formato no se reconoce
+    """
+    if fmt is None:
+        fmt = _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato no reconocido para {path}; use uno de: {', '.join(FORMATS)}")
+    return fmt
+
+def _parse_csv_row(row: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Convierte una fila CSV en un registro de tarea.
+
+    Las columnas vacías se omiten para que se apliquen los valores por defecto.
+
+    Args:
+        row: Fila leída del CSV
+
+    Returns:
+        Dict[str, Any]: Registro de tarea
+    """
+    record: Dict[str, Any] = {key: value for key, value in row.items() if key and value}
+    if 'progress' in record:
+        record['progress'] = int(record['progress'])
+    if 'completed' in record:
+        record['completed'] = record['completed'].strip().lower() in ("true", "1", "si", "sí")
+    return record
+
+def read_records(path: str, fmt: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lee los registros de tareas de un archivo sin cargarlo completo.
+
+    Args:
+        path: Ruta del archivo
+        fmt: Formato del archivo; por defecto se deduce de la extensión
+
+    Yields:
+        Dict[str, Any]: Cada registro de tarea
+    """
+    fmt = detect_format(path, fmt)
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        if fmt == "csv":
+            for row in csv.DictReader(file):
+                yield _parse_csv_row(row)
+        elif fmt == "ndjson":
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from iter_json_array(file)
+
+def write_records(path: str, records: Iterable[Dict[str, Any]], fmt: Optional[str] = None) -> int:
+    """
+    Escribe registros de tareas en un archivo.
+
+    Args:
+        path: Ruta del archivo
+        records: Registros con los campos de `TASK_FIELDS`
+        fmt: Formato del archivo; por defecto se deduce de la extensión
+
+    Returns:
+        int: Número de registros escritos
+    """
+    fmt = detect_format(path, fmt)
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        if fmt == "csv":
+            writer = csv.DictWriter(file, fieldnames=TASK_FIELDS)
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+                count += 1
+        elif fmt == "ndjson":
+            for record in records:
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+        else:
+            data = list(records)
+            json.dump(data, file, indent=4, ensure_ascii=False)
+            count = len(data)
+    return count
@@ -1,18 +1,151 @@
 """Main module for the Procrastination Manager application."""
+import argparse
 import os
 import sys
+import time
+from datetime import timedelta
+from typing import List, Optional, TextIO, Tuple
+
+_STARTED = time.perf_counter()
 
 # Añadir el directorio raíz del proyecto al sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.core.manager import ProcrastinationManager
-from src.ui.console import ConsoleUI
+from src.data.backends import BACKENDS, create_storage
+
+class StartupProfile:
+    """Records how long each startup phase takes, for `--profile-startup`."""
+
+    def __init__(self, started: float) -> None:
+        """
+        Initializes the profile.
+
+        Args:
+            started (float): `time.perf_counter()` value at which the first phase began.
+        """
+        self.phases: List[Tuple[str, float]] = []
+        self._last = started
+
+    def mark(self, phase: str) -> None:
+        """
+        Ends the current phase.
+
+        Args:
+            phase (str): Description of the phase that just ended.
+        """
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
 
-def main() -> None:
+    def report(self, stream: TextIO) -> None:
+        """
+        Prints the duration of every phase and the total.
+
+        Args:
+            stream (TextIO): Where the report is written.
+        """
+        width = max(len(phase) for phase, _ in self.phases) if self.phases else 5
+        for phase, seconds in self.phases:
+            print(f"{phase:<{width}} {seconds * 1000:9.1f} ms", file=stream)
+        total = sum(seconds for _, seconds in self.phases)
+        print(f"{'Total':<{width}} {total * 1000:9.1f} ms", file=stream)
+
+# pylint: disable=import-outside-toplevel,too-many-locals
+def main(argv: Optional[List[str]] = None) -> None:
     """Main function to run the Procrastination Manager application."""
-    manager = ProcrastinationManager()
+    profile = StartupProfile(_STARTED)
+    parser = argparse.ArgumentParser(description="Gestor de Procrastinación")
+    parser.add_argument("--storage", choices=sorted(BACKENDS), default="json",
+                        help="Formato de almacenamiento de las tareas")
+    parser.add_argument("--file",
+                        help="Archivo de tareas (por defecto tasks.json, o el propio de --storage)")
+    parser.add_argument("--write-delay", type=float, metavar="SEGUNDOS",
+                        help="Agrupa los cambios y los guarda en segundo plano tras este intervalo")
+    parser.add_argument("--no-history", action="store_true",
+                        help="No guarda el historial de progreso de las tareas")
+    parser.add_argument("--no-search-cache", action="store_true",
+                        help="No guarda el índice de búsqueda junto al archivo de tareas")
+    parser.add_argument("--archive-after", type=float, default=7, metavar="DÍAS",
+                        help="Al salir archiva las tareas completadas hace más de estos días")
+    parser.add_argument("--no-archive", action="store_true",
+                        help="Mantiene las tareas completadas junto a las pendientes")
+    parser.add_argument("--monitor", action="store_true",
+                        help="Muestra las alertas de procrastinación en cuanto se producen")
+    parser.add_argument("--alert-log", metavar="ARCHIVO",
+                        help="Registra las alertas de procrastinación en este archivo")
+    parser.add_argument("--webhook", metavar="URL",
+                        help="Envía las alertas de procrastinación a esta URL")
+    parser.add_argument("--metrics", action="store_true",
+                        help="Mide las operaciones del gestor y del almacenamiento")
+    parser.add_argument("--metrics-file", metavar="ARCHIVO",
+                        help="Al salir guarda las métricas en este archivo (JSON si termina en "
+                             ".json, formato de Prometheus en otro caso); implica --metrics")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Muestra cuánto tarda cada fase del arranque y termina")
+    args = parser.parse_args(argv)
+    profile.mark("Intérprete y argumentos")
+
+    # The application modules are imported only now, so that --help and argument
+    # errors do not pay for them.
+    from src.core import metrics
+    from src.core.manager import ProcrastinationManager
+    from src.core.search import SearchIndex
+    from src.data.archive import TaskArchive
+    from src.data.category_manager import CategoryManager
+    from src.data.progress_log import ProgressLog
+    profile.mark("Importar el gestor")
+    from src.ui.console import ConsoleUI
+    profile.mark("Importar la interfaz")
+
+    if args.metrics or args.metrics_file:
+        metrics.REGISTRY.enable()
+    storage = create_storage(args.storage, args.file)
+    profile.mark("Crear el almacenamiento")
+    progress_log = None if args.no_history else ProgressLog(f"{storage.filename}.progress")
+    search_index = SearchIndex(None if args.no_search_cache else f"{storage.filename}.search")
+    category_manager = CategoryManager(f"{storage.filename}.categories")
+    archive = None if args.no_archive else TaskArchive(f"{storage.filename}.archive")
+    profile.mark("Abrir el historial y las categorías")
+    # The tasks are loaded in the background while the first menu is drawn.
+    manager = ProcrastinationManager(storage, write_delay=args.write_delay,
+                                     progress_log=progress_log, search_index=search_index,
+                                     category_manager=category_manager, background_load=True,
+                                     archive=archive)
     ui = ConsoleUI(manager)
-    ui.run()
+    profile.mark("Crear el gestor y la interfaz")
+    if args.profile_startup:
+        manager.wait_until_loaded()
+        profile.mark("Cargar las tareas (en segundo plano)")
+        profile.report(sys.stdout)
+        return
+
+    monitor = None
+    if args.monitor or args.alert_log or args.webhook:
+        from src.core.monitor import (ConsoleNotifier, LogFileNotifier, Notifier,
+                                      ProcrastinationMonitor, WebhookNotifier)
+        notifiers: List[Notifier] = []
+        if args.monitor:
+            notifiers.append(ConsoleNotifier())
+        if args.alert_log:
+            notifiers.append(LogFileNotifier(args.alert_log))
+        if args.webhook:
+            notifiers.append(WebhookNotifier(args.webhook))
+        monitor = ProcrastinationMonitor(manager, notifiers)
+        monitor.start()
+
+    try:
+        ui.run()
+    finally:
+        if monitor is not None:
+            monitor.stop()
+        # After a failed load nothing is written, so the unreadable file is kept.
+        if manager.load_error is None:
+            if archive is not None:
+                manager.archive_completed(timedelta(days=args.archive_after))
+            manager.flush()
+            search_index.save()
+        if args.metrics_file:
+            metrics.REGISTRY.write(args.metrics_file)
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,8 @@
 """Módulo para la gestión de tareas individuales."""
+import uuid
 from enum import Enum
 from datetime import datetime, timedelta
+from typing import Optional
 
 class Priority(Enum):
     """Enumeración para los niveles de prioridad de las tareas."""
@@ -11,9 +13,13 @@ class Priority(Enum):
 class Task:
     """Clase que representa una tarea con sus atributos y métodos."""
 
+    __slots__ = ('id', 'name', 'description', 'deadline', 'priority', 'progress', 'last_update',
+                 'category', 'completed')
+
     # pylint: disable=too-many-instance-attributes,too-many-arguments,too-many-positional-arguments
     def __init__(self, name: str, description: str, deadline: datetime,
-                 priority: Priority, category: str = "General", is_loading: bool = False):
+                 priority: Priority, category: str = "General", is_loading: bool = False,
+                 task_id: Optional[str] = None):
         """
         Inicializa una nueva tarea.
 
@@ -24,6 +30,7 @@ class Task:
             priority: Nivel de prioridad
             category: Categoría de la tarea
             is_loading: Indica si la tarea se está cargando desde el almacenamiento.
+            task_id: Identificador de la tarea; se genera uno nuevo si no se indica.
 
         Raises:
             ValueError: Si la fecha límite está en el pasado y no se está cargando la tarea.
@@ -31,6 +38,8 @@ class Task:
         if not is_loading and deadline.date() < datetime.now().date():
             raise ValueError("La fecha límite no puede estar en el pasado")
 
+        self.id: str = task_id if task_id is not None else uuid.uuid4().hex # pylint: disable=invalid-name
+        """Identificador único y estable de la tarea."""
         self.name: str = name
         """Nombre de la tarea."""
         self.description: str = description
@@ -1,9 +1,13 @@
 """Módulo para la interfaz de usuario de consola del Gestor de Procrastinación."""
 import os
-from typing import Dict, Optional
+import sys
+from typing import Dict, List, Optional
 from colorama import Fore, Style
-from src.models.task import Priority
+from src.models.task import Priority, Task
 from src.core.manager import ProcrastinationManager
+from src.core import metrics
+from src.data.storage import StorageConflictError
+from src.ui.pagination import Paginator
 
 class ConsoleUI:
     """
@@ -11,6 +15,13 @@ class ConsoleUI:
     Proporciona métodos para mostrar menús, obtener entradas y mostrar mensajes.
     """
     # pylint: disable=too-few-public-methods
+    PAGE_SIZE = 10
+    PRIORITY_COLORS: Dict[Priority, str] = {
+        Priority.ALTA: Fore.RED,
+        Priority.MEDIA: Fore.YELLOW,
+        Priority.BAJA: Fore.GREEN
+    }
+
     def __init__(self, manager: ProcrastinationManager) -> None:
         """
         Inicializa la interfaz de usuario de consola.
@@ -85,7 +96,17 @@ class ConsoleUI:
         while True:
             self._clear_screen()
             print("\n=== Gestor de Procrastinación ===")
-            self._check_procrastination()
+            if self.manager.load_error is not None:
+                # Sin las tareas no se puede trabajar, y guardar sobrescribiría el archivo.
+                self._print_error(f"No se pudieron cargar las tareas: {self.manager.load_error}")
+                self._print_error("El archivo de tareas no se ha modificado.")
+                return
+            if self.manager.loaded:
+                self._refresh()
+                self._check_procrastination()
+            else:
+                # El menú se muestra sin esperar a que terminen de cargarse las tareas.
+                self._print_warning("Cargando tareas...")
             print("\n1. Añadir tarea")
             print("2. Listar todas las tareas")
             print("3. Listar por prioridad")
@@ -95,35 +116,67 @@ class ConsoleUI:
             print("7. Completar tarea")
             print("8. Editar tarea")
             print("9. Eliminar tarea")
-            print("10. Salir")
+            print("10. Buscar tareas")
+            print("11. Ver métricas")
+            print("12. Ver tareas archivadas")
+            print("13. Salir")
 
             choice = input("\nSeleccione una opción: ")
 
-            if choice == "1":
-                self._add_task()
-            elif choice == "2":
-                self._list_tasks(sort_by_priority=False)
-            elif choice == "3":
-                self._list_by_priority()
-            elif choice == "4":
-                self._list_by_category()
-            elif choice == "5":
-                self._show_category_stats()
-            elif choice == "6":
-                self._update_task_progress()
-            elif choice == "7":
-                self._complete_task()
-            elif choice == "8":
-                self._edit_task()
-            elif choice == "9":
-                self._delete_task()
-            elif choice == "10":
+            if choice == "13":
                 break
-            else:
-                self._print_error("Opción inválida. Por favor, intente de nuevo.")
+            try:
+                self._dispatch(choice)
+            except StorageConflictError as error:
+                self._print_error(str(error))
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                # Si la carga en segundo plano falla, se informa al principio del bucle.
+                if error is not self.manager.load_error:
+                    raise
 
             input("\nPresione Enter para continuar...")
 
+    def _dispatch(self, choice: str) -> None:
+        """
+        Ejecuta la opción del menú elegida por el usuario.
+
+        Args:
+            choice (str): Opción introducida por el usuario.
+        """
+        if choice == "1":
+            self._add_task()
+        elif choice == "2":
+            self._list_tasks(sort_by_priority=False)
+        elif choice == "3":
+            self._list_by_priority()
+        elif choice == "4":
+            self._list_by_category()
+        elif choice == "5":
+            self._show_category_stats()
+        elif choice == "6":
+            self._update_task_progress()
+        elif choice == "7":
+            self._complete_task()
+        elif choice == "8":
+            self._edit_task()
+        elif choice == "9":
+            self._delete_task()
+        elif choice == "10":
+            self._search_tasks()
+        elif choice == "11":
+            self._show_metrics()
+        elif choice == "12":
+            self._list_archived_tasks()
+        else:
+            self._print_error("Opción inválida. Por favor, intente de nuevo.")
+
+    def _refresh(self) -> None:
+        """Carga los cambios que otros procesos hayan guardado en el almacenamiento."""
+        try:
+            self.manager.refresh()
+        except StorageConflictError as error:
+            self._print_error(str(error))
+
     def _check_procrastination(self) -> None:
         """Verifica y muestra las tareas procrastinadas."""
         procrastinated_tasks = self.manager.check_procrastination()
@@ -160,23 +213,136 @@ class ConsoleUI:
         if not tasks:
             self._print_warning("No hay tareas pendientes.")
             return
+        self._browse_tasks(tasks, "Tareas")
+
+    def _list_archived_tasks(self) -> None:
+        """Lista las tareas completadas que se movieron al archivo histórico."""
+        tasks = self.manager.get_archived_tasks()
+        if not tasks:
+            self._print_warning("No hay tareas archivadas.")
+            return
+        self._browse_tasks(tasks, "Tareas archivadas")
+
+    def _search_tasks(self) -> None:
+        """Busca tareas por palabras del nombre, la descripción o la categoría."""
+        query = input("Texto a buscar: ").strip()
+        if not query:
+            self._print_warning("No se ha introducido ningún texto.")
+            return
+        tasks = self.manager.search_tasks(query)
+        if not tasks:
+            self._print_warning(f"No hay tareas que coincidan con «{query}».")
+            return
+        self._browse_tasks(tasks, f"Resultados de «{query}»")
 
-        for i, task in enumerate(tasks, 1):
-            priority_colors: Dict[Priority, str] = {
-                Priority.ALTA: Fore.RED,
-                Priority.MEDIA: Fore.YELLOW,
-                Priority.BAJA: Fore.GREEN
-            }
-            color = priority_colors[task.priority]
-            status = "Completada" if task.completed else "Pendiente"
-            last_progress = (task.last_update.strftime("%Y-%m-%d %H:%M")
-                             if task.last_update else "Sin progreso")
-
-            print(f"{color}{i}. {task.name} [{task.priority.name}]{Style.RESET_ALL}") # pylint: disable=line-too-long
-            print(f"   Descripción: {task.description}")
-            print(f"   Fecha límite: {task.deadline.strftime('%Y-%m-%d')}")
-            print(f"   Estado: {status}")
-            print(f"   Último progreso: {last_progress}")
+    def _format_task(self, number: int, task: Task) -> str:
+        """
+        Da formato a una tarea para mostrarla en un listado.
+
+        Args:
+            number (int): Número de la tarea en el listado.
+            task (Task): Tarea a mostrar.
+
+        Returns:
+            str: Las líneas de la tarea.
+        """
+        color = self.PRIORITY_COLORS[task.priority]
+        status = "Completada" if task.completed else "Pendiente"
+        last_progress = (task.last_update.strftime("%Y-%m-%d %H:%M")
+                         if task.last_update else "Sin progreso")
+        return (f"{color}{number}. {task.name} [{task.priority.name}]{Style.RESET_ALL}\n"
+                f"   Descripción: {task.description}\n"
+                f"   Fecha límite: {task.deadline.strftime('%Y-%m-%d')}\n"
+                f"   Estado: {status}\n"
+                f"   Último progreso: {last_progress}")
+
+    def _browse_tasks(self, tasks: List[Task], title: str,
+                      select: bool = False) -> Optional[Task]:
+        """
+        Muestra un listado de tareas por páginas.
+
+        Solo se da formato a las tareas de la página visible y cada pantalla
+        se escribe de una sola vez. Comandos: `s`/`a` página siguiente/anterior,
+        `p N` ir a la página N, `/texto` buscar (una `/` sola quita la búsqueda),
+        un número selecciona esa tarea o, si no se está seleccionando, muestra
+        su página. Enter vacío termina.
+
+        Args:
+            tasks (List[Task]): Tareas a mostrar.
+            title (str): Título del listado.
+            select (bool): Si es True, el número introducido selecciona una tarea.
+
+        Returns:
+            Optional[Task]: La tarea seleccionada, o None si no se seleccionó ninguna.
+        """
+        paginator = Paginator(tasks, self.PAGE_SIZE)
+        search = ""
+        message = ""
+        while True:
+            self._write_screen(self._render_page(paginator, title, search, message, select))
+            message = ""
+            command = input("Número de la tarea o comando: " if select else "Comando: ").strip()
+            if not command:
+                return None
+            try:
+                if command.startswith("/"):
+                    search = command[1:].strip()
+                    paginator = Paginator(self.manager.find_tasks(search, tasks), self.PAGE_SIZE)
+                elif command.lower() == "s":
+                    if not paginator.next():
+                        message = "Ya está en la última página."
+                elif command.lower() == "a":
+                    if not paginator.previous():
+                        message = "Ya está en la primera página."
+                elif command.lower().startswith("p ") and command[2:].strip().isdigit():
+                    paginator.go_to(int(command[2:]))
+                elif not command.isdigit():
+                    message = f"{Fore.RED}Error: Comando no reconocido: {command}{Style.RESET_ALL}"
+                elif select:
+                    return paginator.get(int(command))
+                else:
+                    paginator.show(int(command))
+            except ValueError as error:
+                message = f"{Fore.RED}Error: {error}{Style.RESET_ALL}"
+
+    def _render_page(self, paginator: Paginator, title: str, search: str, message: str,
+                     select: bool) -> str:
+        """
+        Compone el texto de una página del listado.
+
+        Args:
+            paginator (Paginator): Listado paginado.
+            title (str): Título del listado.
+            search (str): Búsqueda activa.
+            message (str): Mensaje a mostrar bajo el listado.
+            select (bool): Si el listado sirve para seleccionar una tarea.
+
+        Returns:
+            str: La pantalla completa.
+        """
+        heading = f"\n=== {title}"
+        if search:
+            heading += f" (búsqueda: '{search}')"
+        lines = [heading + " ==="]
+        page_items = paginator.page_items()
+        if page_items:
+            lines.extend(self._format_task(number, task) for number, task in page_items)
+        else:
+            lines.append(f"{Fore.YELLOW}No hay tareas que coincidan.{Style.RESET_ALL}")
+        lines.append(f"\nPágina {paginator.page}/{paginator.page_count} "
+                     f"({len(paginator)} tareas)")
+        action = "número: seleccionar" if select else "número: ir a la tarea"
+        lines.append(f"[s] siguiente  [a] anterior  [p N] ir a página  [/texto] buscar  "
+                     f"[{action}]  [Enter] volver")
+        if message:
+            lines.append(message)
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _write_screen(text: str) -> None:
+        """Escribe una pantalla completa con una única escritura."""
+        sys.stdout.write(text)
+        sys.stdout.flush()
 
     def _list_by_priority(self) -> None:
         """Lista tareas filtradas por prioridad."""
@@ -188,32 +354,31 @@ class ConsoleUI:
         priority_choice = input("Seleccione una opción: ")
 
         if priority_choice in self.manager.PRIORITY_MAP:
-            filtered_tasks = self.manager.get_priority_tasks(
-                self.manager.PRIORITY_MAP[priority_choice])
+            priority = self.manager.PRIORITY_MAP[priority_choice]
+            filtered_tasks = self.manager.get_priority_tasks(priority)
             if not filtered_tasks:
                 self._print_warning("\nNo hay tareas con esta prioridad.")
             else:
-                for task in filtered_tasks:
-                    print(f"\n-> {task.name} - {task.description}")
+                self._browse_tasks(filtered_tasks, f"Prioridad {priority.name}")
         else:
             self._list_tasks(sort_by_priority=True)
 
     def _list_by_category(self) -> None:
         """Lista tareas filtradas por categoría."""
         categories = list(self.manager.category_manager.get_categories())
+        counts = self.manager.category_manager.get_counts()
         print("\nCategorías disponibles:")
         for i, cat in enumerate(categories, 1):
-            print(f"{i}. {cat}")
+            print(f"{i}. {cat} ({counts.get(cat, 0)} tareas)")
         try:
             cat_choice = int(input("\nSeleccione una categoría: ")) - 1
             if 0 <= cat_choice < len(categories):
                 category = categories[cat_choice]
                 filtered_tasks = self.manager.get_category_tasks(category)
                 if not filtered_tasks:
-                    self._print_warning(f"\nNo hay tareas en esta categoría.")
+                    self._print_warning("\nNo hay tareas en esta categoría.")
                 else:
-                    for task in filtered_tasks:
-                        print(f"\n-> {task.name} - {task.description}")
+                    self._browse_tasks(filtered_tasks, f"Categoría {category}")
             else:
                 self._print_error("Selección inválida")
         except ValueError:
@@ -221,7 +386,7 @@ class ConsoleUI:
 
     def _show_category_stats(self) -> None:
         """Muestra estadísticas de tareas por categoría."""
-        stats = self.manager.category_manager.get_category_stats(self.manager.tasks)
+        stats = self.manager.get_category_stats()
         print("\n=== Estadísticas por Categoría ===")
         if not stats:
             self._print_warning("No hay categorías para mostrar estadísticas.")
@@ -235,6 +400,50 @@ class ConsoleUI:
             print(f"  Alta prioridad: {data['high_priority']}")
             print(f"  Procrastinadas: {data['procrastinated']}")
 
+    def _show_metrics(self) -> None:
+        """Muestra los contadores de las operaciones medidas desde el arranque."""
+        print("\n=== Métricas ===")
+        if not metrics.REGISTRY.enabled:
+            self._print_warning("Métricas desactivadas; inicie el programa con --metrics.")
+            return
+        operations = metrics.REGISTRY.snapshot()
+        if not operations:
+            self._print_warning("Todavía no se ha medido ninguna operación.")
+            return
+
+        width = max(len(name) for name in operations)
+        print(f"{'Operación':<{width}} {'Llamadas':>9} {'Errores':>8} {'Media':>10} "
+              f"{'p95':>10} {'Leído':>10} {'Escrito':>10}")
+        for name, stats in operations.items():
+            mean = f"{stats.seconds / stats.count * 1000:.2f} ms" if stats.count else "-"
+            p95 = stats.quantile(0.95)
+            p95_text = ("-" if not stats.count else f"> {metrics.BUCKETS[-1]:g} s"
+                        if p95 == float('inf') else f"≤ {p95 * 1000:g} ms")
+            print(f"{Fore.CYAN}{name:<{width}}{Style.RESET_ALL} {stats.count:>9} "
+                  f"{stats.errors:>8} {mean:>10} {p95_text:>10} "
+                  f"{self._format_bytes(stats.bytes_read):>10} "
+                  f"{self._format_bytes(stats.bytes_written):>10}")
+
+    @staticmethod
+    def _format_bytes(count: int) -> str:
+        """
+        Formatea una cantidad de bytes con la unidad más adecuada.
+
+        Args:
+            count (int): Número de bytes.
+
+        Returns:
+            str: La cantidad con su unidad, o "-" si es cero.
+        """
+        if not count:
+            return "-"
+        size = float(count)
+        for unit in ("B", "KiB", "MiB"):
+            if size < 1024:
+                return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} GiB"
+
     def _update_task_progress(self) -> None:
         """Permite al usuario registrar el progreso de una tarea."""
         tasks = self.manager.get_tasks(sort_by_priority=False)
@@ -242,18 +451,14 @@ class ConsoleUI:
             self._print_warning("No hay tareas para actualizar.")
             return
 
-        print("\nTareas disponibles:")
-        self._list_tasks(sort_by_priority=False)
+        task = self._browse_tasks(tasks, "Seleccione la tarea", select=True)
+        if task is None:
+            return
 
         try:
-            task_num = int(input("\nSeleccione el número de la tarea: ")) - 1
-            if 0 <= task_num < len(tasks):
-                task = tasks[task_num]
-                new_progress = int(input(f"Ingrese el nuevo progreso para '{task.name}' (0-100): "))
-                self.manager.update_task_progress(task, new_progress)
-                self._print_success("¡Progreso registrado con éxito!")
-            else:
-                self._print_error("Número de tarea inválido")
+            new_progress = int(input(f"Ingrese el nuevo progreso para '{task.name}' (0-100): "))
+            self.manager.update_task_progress(task, new_progress)
+            self._print_success("¡Progreso registrado con éxito!")
         except ValueError:
             self._print_error("Por favor ingrese un número válido")
 
@@ -264,20 +469,12 @@ class ConsoleUI:
             self._print_warning("No hay tareas pendientes para completar.")
             return
 
-        print("\nTareas pendientes:")
-        for i, task in enumerate(pending_tasks, 1):
-            print(f"{i}. {task.name} ({task.category}) - {task.priority.name}")
-
-        try:
-            task_num = int(input("\nSeleccione el número de la tarea a completar: ")) - 1
-            if 0 <= task_num < len(pending_tasks):
-                task_to_complete = pending_tasks[task_num]
-                self.manager.complete_task(task_to_complete)
-                self._print_success(f"¡Tarea '{task_to_complete.name}' marcada como completada!")
-            else:
-                self._print_error("Número de tarea inválido")
-        except ValueError:
-            self._print_error("Por favor ingrese un número válido")
+        task_to_complete = self._browse_tasks(pending_tasks, "Seleccione la tarea a completar",
+                                              select=True)
+        if task_to_complete is None:
+            return
+        self.manager.complete_task(task_to_complete)
+        self._print_success(f"¡Tarea '{task_to_complete.name}' marcada como completada!")
 
     def _edit_task(self) -> None:
         """Permite al usuario editar una tarea existente."""
@@ -286,27 +483,22 @@ class ConsoleUI:
             self._print_warning("No hay tareas para editar.")
             return
 
-        print("\nSeleccione la tarea a editar:")
-        self._list_tasks(sort_by_priority=False)
+        task = self._browse_tasks(tasks, "Seleccione la tarea a editar", select=True)
+        if task is None:
+            return
 
         try:
-            task_num = int(input("\nNúmero de la tarea: ")) - 1
-            if 0 <= task_num < len(tasks):
-                task = tasks[task_num]
+            new_name = input(f"Nuevo nombre [{task.name}]: ") or task.name
+            new_description = input(f"Nueva descripción [{task.description}]: ") or task.description
+            new_deadline_str = (input(f"Nueva fecha límite (YYYY-MM-DD) [{task.deadline.strftime('%Y-%m-%d')}]: ") # pylint: disable=line-too-long
+                                or task.deadline.strftime('%Y-%m-%d'))
 
-                new_name = input(f"Nuevo nombre [{task.name}]: ") or task.name
-                new_description = input(f"Nueva descripción [{task.description}]: ") or task.description
-                new_deadline_str = (input(f"Nueva fecha límite (YYYY-MM-DD) [{task.deadline.strftime('%Y-%m-%d')}]: ") # pylint: disable=line-too-long
-                                    or task.deadline.strftime('%Y-%m-%d'))
+            new_priority_choice = self._get_priority_choice(task.priority)
+            new_category = self._get_category_choice(task.category)
 
-                new_priority_choice = self._get_priority_choice(task.priority)
-                new_category = self._get_category_choice(task.category)
-
-                self.manager.edit_task(task, new_name, new_description, new_deadline_str,
-                                       new_priority_choice, new_category)
-                self._print_success("¡Tarea editada con éxito!")
-            else:
-                self._print_error("Número de tarea inválido")
+            self.manager.edit_task(task, new_name, new_description, new_deadline_str,
+                                   new_priority_choice, new_category)
+            self._print_success("¡Tarea editada con éxito!")
         except ValueError as err:
             self._print_error(str(err))
 
@@ -317,20 +509,12 @@ class ConsoleUI:
             self._print_warning("No hay tareas para eliminar.")
             return
 
-        print("\nSeleccione la tarea a eliminar:")
-        self._list_tasks(sort_by_priority=False)
-
-        try:
-            task_num = int(input("\nNúmero de la tarea: ")) - 1
-            if 0 <= task_num < len(tasks):
-                task_to_delete = tasks[task_num]
-                confirm = input(f"¿Está seguro de que desea eliminar la tarea '{task_to_delete.name}'? (s/n): ").lower() # pylint: disable=line-too-long
-                if confirm == 's':
-                    self.manager.delete_task(task_to_delete)
-                    self._print_success("¡Tarea eliminada con éxito!")
-                else:
-                    self._print_warning("Operación cancelada.")
-            else:
-                self._print_error("Número de tarea inválido")
-        except ValueError:
-            self._print_error("Por favor ingrese un número válido")
+        task_to_delete = self._browse_tasks(tasks, "Seleccione la tarea a eliminar", select=True)
+        if task_to_delete is None:
+            return
+        confirm = input(f"¿Está seguro de que desea eliminar la tarea '{task_to_delete.name}'? (s/n): ").lower() # pylint: disable=line-too-long
+        if confirm == 's':
+            self.manager.delete_task(task_to_delete)
+            self._print_success("¡Tarea eliminada con éxito!")
+        else:
+            self._print_warning("Operación cancelada.")
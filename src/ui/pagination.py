@@ -0,0 +1,118 @@
+"""Módulo para dividir listados largos en páginas."""
+from typing import Generic, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class Paginator(Generic[T]):
+    """
+    Recorre una secuencia por páginas de tamaño fijo.
+
+    Solo se accede a los elementos de la página visible, por lo que el coste
+    de mostrar una página no depende del tamaño de la secuencia. Los números
+    de elemento empiezan en 1 y son globales a toda la secuencia.
+    """
+
+    def __init__(self, items: Sequence[T], page_size: int = 10) -> None:
+        """
+        Inicializa el paginador en la primera página.
+
+        Args:
+            items: Elementos a recorrer
+            page_size: Número de elementos por página
+
+        Raises:
+            ValueError: Si el tamaño de página no es positivo
+        """
+        if page_size <= 0:
+            raise ValueError("El tamaño de página debe ser positivo")
+        self.items = items
+        self.page_size = page_size
+        self.page = 1
+
+    def __len__(self) -> int:
+        """Devuelve el número total de elementos."""
+        return len(self.items)
+
+    @property
+    def page_count(self) -> int:
+        """Número de páginas (al menos una, aunque no haya elementos)."""
+        return max(1, -(-len(self.items) // self.page_size))
+
+    def page_items(self) -> List[Tuple[int, T]]:
+        """
+        Obtiene los elementos de la página actual.
+
+        Returns:
+            List[Tuple[int, T]]: Pares (número, elemento) de la página
+        """
+        start = (self.page - 1) * self.page_size
+        end = min(start + self.page_size, len(self.items))
+        return [(number + 1, self.items[number]) for number in range(start, end)]
+
+    def go_to(self, page: int) -> None:
+        """
+        Cambia a una página.
+
+        Args:
+            page: Número de página
+
+        Raises:
+            ValueError: Si la página no existe
+        """
+        if not 1 <= page <= self.page_count:
+            raise ValueError(f"La página debe estar entre 1 y {self.page_count}")
+        self.page = page
+
+    def next(self) -> bool:
+        """
+        Avanza a la página siguiente.
+
+        Returns:
+            bool: False si ya estaba en la última página
+        """
+        if self.page >= self.page_count:
+            return False
+        self.page += 1
+        return True
+
+    def previous(self) -> bool:
+        """
+        Retrocede a la página anterior.
+
+        Returns:
+            bool: False si ya estaba en la primera página
+        """
+        if self.page <= 1:
+            return False
+        self.page -= 1
+        return True
+
+    def get(self, number: int) -> T:
+        """
+        Obtiene un elemento por su número.
+
+        Args:
+            number: Número del elemento (desde 1)
+
+        Returns:
+            T: El elemento
+
+        Raises:
+            ValueError: Si el número no corresponde a ningún elemento
+        """
+        if not 1 <= number <= len(self.items):
+            raise ValueError(f"El número debe estar entre 1 y {len(self.items)}")
+        return self.items[number - 1]
+
+    def show(self, number: int) -> None:
+        """
+        Cambia a la página que contiene un elemento.
+
+        Args:
+            number: Número del elemento (desde 1)
+
+        Raises:
+            ValueError: Si el número no corresponde a ningún elemento
+        """
+        self.get(number)
+        self.page = (number - 1) // self.page_size + 1
@@ -0,0 +1,67 @@
+import unittest
+from datetime import datetime, timedelta
+from src.analytics.columns import TaskColumns
+from src.analytics.report import HAS_NUMPY, analyze, deadline_risk
+from src.models.task import Task, Priority
+
+class TestAnalytics(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime(2025, 6, 1, 12, 0)
+        self.tasks = [
+            self._task("A", "Trabajo", Priority.ALTA, deadline_days=-2, updated_days=4, progress=0),
+            self._task("B", "Trabajo", Priority.BAJA, deadline_days=10, updated_days=0.5,
+                       progress=40),
+            self._task("C", "Casa", Priority.MEDIA, deadline_days=-40, updated_days=2,
+                       progress=100, completed=True),
+            self._task("D", "Trabajo", Priority.MEDIA, deadline_days=1, updated_days=10,
+                       progress=80),
+        ]
+
+    def _task(self, name, category, priority, deadline_days, updated_days, progress,
+              completed=False):
+        task = Task(name, "Desc", self.now + timedelta(days=deadline_days), priority, category,
+                    is_loading=True)
+        task.last_update = self.now - timedelta(days=updated_days)
+        task.progress = progress
+        task.completed = completed
+        return task
+
+    def test_resumen_python(self):
+        informe = analyze(self.tasks, self.now, top_risk=2, use_numpy=False)
+        self.assertEqual(informe['tasks'], 4)
+        self.assertEqual(informe['completion_rate'], 0.25)
+        self.assertEqual(informe['categories']['Casa']['completion_rate'], 1.0)
+        self.assertEqual(informe['categories']['Trabajo']['total'], 3)
+        self.assertEqual(informe['categories']['Trabajo']['progress_percentiles'][50], 40)
+        self.assertEqual(informe['categories']['Trabajo']['progress_percentiles'][25], 20)
+        self.assertEqual(informe['overdue_histogram'], [0, 1, 0, 0, 0])
+        self.assertEqual(informe['staleness_histogram'], [1, 0, 1, 1, 0])
+        self.assertEqual([fila for fila, _ in informe['highest_risk']], [0, 3])
+        self.assertEqual(informe['highest_risk'][0][1], 1.0)
+
+    def test_riesgo_de_tarea_completada_es_cero(self):
+        riesgos = deadline_risk(self.tasks, self.now, use_numpy=False)
+        self.assertEqual(riesgos[2], 0.0)
+        self.assertAlmostEqual(riesgos[3], 0.2 * 2 / 3 / 2)
+
+    def test_sin_tareas(self):
+        informe = analyze(TaskColumns(), self.now, use_numpy=False)
+        self.assertEqual(informe['completion_rate'], 0.0)
+        self.assertEqual(informe['highest_risk'], [])
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy no está instalado")
+    def test_numpy_coincide_con_python(self):
+        python = analyze(self.tasks, self.now, use_numpy=False)
+        vectorizado = analyze(self.tasks, self.now, use_numpy=True)
+        self.assertEqual(vectorizado, python)
+        for esperado, obtenido in zip(deadline_risk(self.tasks, self.now, use_numpy=False),
+                                      deadline_risk(self.tasks, self.now, use_numpy=True)):
+            self.assertAlmostEqual(esperado, obtenido)
+
+    @unittest.skipIf(HAS_NUMPY, "NumPy está instalado")
+    def test_numpy_no_disponible(self):
+        with self.assertRaises(RuntimeError):
+            analyze(self.tasks, self.now, use_numpy=True)
+
+if __name__ == '__main__':
+    unittest.main()
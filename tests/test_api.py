@@ -0,0 +1,114 @@
+import unittest
+import asyncio
+import json
+import os
+from src.api.server import ApiServer
+from src.core.manager import ProcrastinationManager
+from src.data.storage import Storage
+
+class TestApiServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.test_file = "test_api_tasks.json"
+        self.manager = ProcrastinationManager(Storage(self.test_file))
+        self.server = ApiServer(self.manager, port=0)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+        for filename in (self.test_file, self.test_file + ".lock"):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    async def _request(self, method, path, body=None, headers=None):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        data = json.dumps(body).encode() if body is not None else b""
+        extra = "".join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+        writer.write(f"{method} {path} HTTP/1.1\r\nConnection: close\r\n"
+                     f"Content-Length: {len(data)}\r\n{extra}\r\n".encode() + data)
+        raw = await reader.read()
+        writer.close()
+        head, _, payload = raw.partition(b"\r\n\r\n")
+        lines = head.decode().split("\r\n")
+        response_headers = dict(line.split(": ", 1) for line in lines[1:])
+        return (int(lines[0].split()[1]), response_headers,
+                json.loads(payload) if payload else None)
+
+    async def _create(self, name, **fields):
+        status, _, body = await self._request(
+            "POST", "/tasks", dict({"name": name, "deadline": "2099-01-01"}, **fields))
+        self.assertEqual(status, 201)
+        return body
+
+    async def test_crud(self):
+        tarea = await self._create("Informe", priority="3", category="Trabajo")
+        status, _, body = await self._request("GET", f"/tasks/{tarea['id']}")
+        self.assertEqual((status, body["priority"]), (200, "ALTA"))
+
+        status, _, body = await self._request("PATCH", f"/tasks/{tarea['id']}", {"progress": 40})
+        self.assertEqual((status, body["progress"]), (200, 40))
+        self.assertEqual(Storage(self.test_file).load_tasks()[0].progress, 40)
+
+        status, _, _ = await self._request("DELETE", f"/tasks/{tarea['id']}")
+        self.assertEqual(status, 204)
+        status, _, _ = await self._request("GET", f"/tasks/{tarea['id']}")
+        self.assertEqual(status, 404)
+
+    async def test_errores_de_validacion(self):
+        status, _, body = await self._request("POST", "/tasks", {"name": "Sin fecha"})
+        self.assertEqual(status, 400)
+        self.assertIn("deadline", body["error"])
+        status, _, _ = await self._request("PATCH", "/tasks/inexistente", {"progress": 1})
+        self.assertEqual(status, 404)
+        status, _, _ = await self._request("PUT", "/tasks")
+        self.assertEqual(status, 405)
+        for longitud in ("abc", "-1"):
+            status, _, body = await self._request("POST", "/tasks",
+                                                  headers={"Content-Length": longitud})
+            self.assertEqual(status, 400)
+            self.assertIn("Content-Length", body["error"])
+        status, _, _ = await self._request("GET", "/tasks/1/extra")
+        self.assertEqual(status, 404)
+
+    async def test_paginacion_y_filtros(self):
+        for numero in range(5):
+            await self._create(f"T{numero}", category="Casa" if numero % 2 else "General")
+        status, _, body = await self._request("GET", "/tasks?limit=2&offset=2")
+        self.assertEqual([t["name"] for t in body["items"]], ["T2", "T3"])
+        self.assertEqual((body["total"], body["next_offset"]), (5, 4))
+        _, _, body = await self._request("GET", "/tasks?category=Casa")
+        self.assertEqual([t["name"] for t in body["items"]], ["T1", "T3"])
+        self.assertIsNone(body["next_offset"])
+
+    async def test_get_condicional(self):
+        await self._create("A")
+        _, cabeceras, _ = await self._request("GET", "/tasks")
+        etag = cabeceras["ETag"]
+        status, _, body = await self._request("GET", "/tasks", headers={"If-None-Match": etag})
+        self.assertEqual((status, body), (304, None))
+        await self._create("B")
+        status, cabeceras, _ = await self._request("GET", "/tasks",
+                                                   headers={"If-None-Match": etag})
+        self.assertEqual(status, 200)
+        self.assertNotEqual(cabeceras["ETag"], etag)
+
+    async def test_etag_cambia_al_reiniciar(self):
+        await self._create("A")
+        _, cabeceras, _ = await self._request("GET", "/tasks")
+        await self.server.stop()
+        self.manager = ProcrastinationManager(Storage(self.test_file))
+        self.server = ApiServer(self.manager, port=0)
+        await self.server.start()
+        await self._create("B")
+        self.assertEqual(self.manager.version, 1)
+        status, _, _ = await self._request("GET", "/tasks",
+                                           headers={"If-None-Match": cabeceras["ETag"]})
+        self.assertEqual(status, 200)
+
+    async def test_escrituras_concurrentes(self):
+        await asyncio.gather(*(self._create(f"T{numero}") for numero in range(20)))
+        self.assertEqual(len(Storage(self.test_file).load_tasks()), 20)
+        _, _, estadisticas = await self._request("GET", "/stats")
+        self.assertEqual(estadisticas["General"]["total"], 20)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import os
+import shutil
+from datetime import datetime, timedelta
+from src.core.manager import ProcrastinationManager
+from src.data.archive import TaskArchive
+from src.data.storage import Storage, task_to_dict
+from src.models.task import Task, Priority
+
+class TestTaskArchive(unittest.TestCase):
+    def setUp(self):
+        self.test_file = "test_archive_tasks.json"
+        self.directory = f"{self.test_file}.archive"
+        self.archive = TaskArchive(self.directory)
+        self.future_date = datetime.now() + timedelta(days=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        for filename in (self.test_file, f"{self.test_file}.lock"):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def _completada(self, name, completed_at):
+        task = Task(name, "Desc", self.future_date, Priority.MEDIA)
+        task.completed = True
+        task.progress = 100
+        task.last_update = completed_at
+        return task
+
+    def test_segmentos_por_mes(self):
+        tareas = [self._completada("Enero", datetime(2026, 1, 15)),
+                  self._completada("Marzo", datetime(2026, 3, 2)),
+                  self._completada("Marzo 2", datetime(2026, 3, 20))]
+        self.archive.add(tareas)
+        self.assertEqual(self.archive.segments(), {"2026-01": 1, "2026-03": 2})
+        self.assertEqual(len(self.archive), 3)
+        self.assertEqual([task_to_dict(t) for t in TaskArchive(self.directory).load()],
+                         [task_to_dict(t) for t in tareas])
+
+    def test_consulta_por_intervalo_lee_solo_sus_segmentos(self):
+        self.archive.add([self._completada("Enero", datetime(2026, 1, 15)),
+                          self._completada("Marzo", datetime(2026, 3, 2))])
+        with open(os.path.join(self.directory, "2026-01.ndjson"), 'w', encoding='utf-8') as file:
+            file.write("dañado\n")
+        tareas = self.archive.load(since=datetime(2026, 3, 1))
+        self.assertEqual([t.name for t in tareas], ["Marzo"])
+
+    def test_tarea_archivada_dos_veces(self):
+        tarea = self._completada("Repetida", datetime(2026, 5, 1))
+        self.archive.add([tarea])
+        tarea.name = "Repetida (última)"
+        self.archive.add([tarea])
+        self.assertEqual([t.name for t in self.archive.load()], ["Repetida (última)"])
+
+    def test_gestor_archiva_las_completadas(self):
+        manager = ProcrastinationManager(Storage(self.test_file), archive=self.archive)
+        manager.add_tasks([{"name": "Pendiente", "deadline": self.future_date},
+                           {"name": "Antigua", "deadline": self.future_date, "completed": True,
+                            "progress": 100, "last_update": datetime.now() - timedelta(days=30)},
+                           {"name": "Reciente", "deadline": self.future_date, "completed": True,
+                            "progress": 100}], allow_past=True)
+
+        archivadas = manager.archive_completed(older_than=timedelta(days=7))
+        self.assertEqual([t.name for t in archivadas], ["Antigua"])
+        self.assertEqual(sorted(t.name for t in manager.tasks), ["Pendiente", "Reciente"])
+        self.assertEqual(manager.get_category_stats()["General"]["total"], 2)
+        self.assertEqual(manager.search_tasks("antigua"), [])
+
+        otro = ProcrastinationManager(Storage(self.test_file), archive=TaskArchive(self.directory))
+        self.assertEqual(sorted(t.name for t in otro.tasks), ["Pendiente", "Reciente"])
+        archivadas = otro.get_archived_tasks()
+        self.assertEqual([t.name for t in archivadas], ["Antigua"])
+        self.assertEqual(otro.find_tasks("antigua", archivadas), archivadas)
+
+    def test_gestor_sin_archivo(self):
+        manager = ProcrastinationManager(Storage(self.test_file))
+        self.assertEqual(manager.get_archived_tasks(), [])
+        with self.assertRaises(ValueError):
+            manager.archive_completed()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from datetime import datetime
+from benchmarks.dataset import generate_tasks
+from benchmarks.suite import compare
+from src.data.storage import task_to_dict
+
+class TestBenchmarks(unittest.TestCase):
+    def test_datos_reproducibles(self):
+        ahora = datetime(2030, 1, 1)
+        primeras = [task_to_dict(t) for t in generate_tasks(200, seed=7, now=ahora)]
+        segundas = [task_to_dict(t) for t in generate_tasks(200, seed=7, now=ahora)]
+        self.assertEqual(primeras, segundas)
+        self.assertNotEqual(primeras, [task_to_dict(t) for t in generate_tasks(200, seed=8, now=ahora)])
+        self.assertEqual(len({tarea["id"] for tarea in primeras}), 200)
+
+    def test_distribuciones(self):
+        ahora = datetime(2030, 1, 1)
+        tareas = generate_tasks(2000, now=ahora)
+        completadas = [t for t in tareas if t.completed]
+        self.assertTrue(0.25 < len(completadas) / len(tareas) < 0.45)
+        self.assertTrue(all(t.progress == 100 for t in completadas))
+        self.assertTrue(all(t.last_update <= ahora for t in tareas))
+        self.assertTrue(any((ahora - t.last_update).days > 30 for t in tareas))
+        self.assertTrue(any(t.deadline < ahora for t in tareas))
+
+    def test_detecta_regresiones(self):
+        base = [{"operation": "carga", "tasks": 1000, "seconds": 0.100, "peak_bytes": 10_000_000},
+                {"operation": "lista", "tasks": 1000, "seconds": 0.0001, "peak_bytes": 1000}]
+        nuevos = [{"operation": "carga", "tasks": 1000, "seconds": 0.150, "peak_bytes": 10_100_000},
+                  {"operation": "lista", "tasks": 1000, "seconds": 0.0003, "peak_bytes": 3000},
+                  {"operation": "carga", "tasks": 5000, "seconds": 9.0, "peak_bytes": 1}]
+        regresiones = compare(nuevos, base, tolerance=0.25)
+        self.assertEqual(list(regresiones), [("carga", 1000)])
+        self.assertEqual(len(regresiones[("carga", 1000)]), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,6 @@
 import unittest
+import os
+import json
 from datetime import datetime, timedelta
 from src.data.category_manager import CategoryManager
 from src.models.task import Task, Priority
@@ -81,3 +83,56 @@ class TestCategoryManager(unittest.TestCase):
         self.assertEqual(stats["Trabajo"]["pending"], 1)
         self.assertEqual(stats["Trabajo"]["high_priority"], 1)
         self.assertEqual(stats["Trabajo"]["procrastinated"], 0)
+
+    def test_guarda_y_recupera_categorias(self):
+        archivo = "test_tasks.json.categories"
+        try:
+            categorias = CategoryManager(archivo)
+            categorias.add_category("Trabajo")
+            categorias.register_categories(["Casa", "Trabajo", "General"])
+            self.assertTrue(categorias.has_category("Casa"))
+            self.assertEqual(CategoryManager(archivo).get_categories(),
+                             {"General", "Trabajo", "Casa"})
+
+            categorias.remove_category("Casa")
+            self.assertEqual(CategoryManager(archivo).get_categories(), {"General", "Trabajo"})
+
+            with open(archivo, "w", encoding="utf-8") as file:
+                file.write("[dañado")
+            self.assertEqual(CategoryManager(archivo).get_categories(), {"General"})
+        finally:
+            if os.path.exists(archivo):
+                os.remove(archivo)
+
+    def test_vista_de_solo_lectura(self):
+        categorias = self.category_manager.get_categories()
+        self.assertIs(categorias, self.category_manager.get_categories())
+        self.category_manager.add_category("Trabajo")
+        self.assertIn("Trabajo", categorias)
+        with self.assertRaises(TypeError):
+            self.category_manager.get_counts()["Trabajo"] = 3
+        self.assertFalse(hasattr(categorias, "add"))
+
+    def test_guarda_numero_de_tareas_y_fecha(self):
+        archivo = "test_tasks.json.categories"
+        try:
+            categorias = CategoryManager(archivo)
+            categorias.add_category("Trabajo")
+            categorias.set_counts({"Trabajo": 2, "Casa": 1})
+            categorias.set_count("General", 4)
+            self.assertEqual(CategoryManager(archivo).get_counts()["General"], 0)
+            categorias.flush()
+
+            recuperadas = CategoryManager(archivo)
+            self.assertEqual(dict(recuperadas.get_counts()),
+                             {"General": 4, "Trabajo": 2, "Casa": 1})
+            self.assertIsNotNone(recuperadas.get_created("Trabajo"))
+            self.assertIsNone(recuperadas.get_created("General"))
+
+            with open(archivo, "w", encoding="utf-8") as file:
+                json.dump(["General", "Antigua"], file)
+            self.assertEqual(dict(CategoryManager(archivo).get_counts()),
+                             {"General": 0, "Antigua": 0})
+        finally:
+            if os.path.exists(archivo):
+                os.remove(archivo)
@@ -33,5 +33,6 @@ class TestFullWorkflow(unittest.TestCase):
     def tearDown(self):
         # Limpieza: eliminar archivo de prueba
         import os
-        if os.path.exists("test_integration.json"):
-            os.remove("test_integration.json")
+        for filename in ("test_integration.json", "test_integration.json.lock"):
+            if os.path.exists(filename):
+                os.remove(filename)
@@ -0,0 +1,146 @@
+import unittest
+import json
+import os
+from datetime import datetime, timedelta
+from unittest import mock
+from src.data.journal_storage import JournalStorage
+from src.models.task import Task, Priority
+
+class TestJournalStorage(unittest.TestCase):
+    def setUp(self):
+        self.test_file = "test_journal_tasks.json"
+        self.storage = JournalStorage(self.test_file, background=False)
+        self.future_date = datetime.now() + timedelta(days=1)
+
+    def tearDown(self):
+        for suffix in ("", ".journal", ".journal.old", ".tmp", ".lock"):
+            if os.path.exists(self.test_file + suffix):
+                os.remove(self.test_file + suffix)
+
+    def _new_task(self, name):
+        return Task(name, "Desc", self.future_date, Priority.MEDIA)
+
+    def test_anexa_sin_reescribir_instantanea(self):
+        tareas = [self._new_task("A"), self._new_task("B")]
+        self.storage.save_tasks(tareas)
+        tamano_instantanea = os.path.getsize(self.test_file)
+
+        tareas[0].update_progress(40)
+        self.storage.save_changes(tareas, changed=[tareas[0]])
+
+        self.assertEqual(os.path.getsize(self.test_file), tamano_instantanea)
+        with open(self.test_file + ".journal", encoding="utf-8") as file:
+            self.assertEqual(len(file.readlines()), 1)
+
+    def test_reaplica_diario_al_cargar(self):
+        tareas = [self._new_task("A"), self._new_task("B")]
+        self.storage.save_tasks(tareas)
+        nueva = self._new_task("C")
+        tareas.append(nueva)
+        self.storage.save_changes(tareas, changed=[nueva])
+        tareas[1].update_progress(60)
+        self.storage.save_changes(tareas, changed=[tareas[1]])
+        eliminada = tareas.pop(0)
+        self.storage.save_changes(tareas, deleted=[eliminada])
+
+        cargadas = JournalStorage(self.test_file).load_tasks()
+        self.assertEqual([t.name for t in cargadas], ["B", "C"])
+        self.assertEqual(cargadas[0].progress, 60)
+
+    def test_ignora_linea_incompleta(self):
+        tareas = [self._new_task("A")]
+        self.storage.save_changes(tareas, changed=tareas)
+        with open(self.test_file + ".journal", "a", encoding="utf-8") as file:
+            file.write('{"op":"set","task":{"id":"x","na')
+
+        cargadas = JournalStorage(self.test_file).load_tasks()
+        self.assertEqual([t.name for t in cargadas], ["A"])
+
+    def test_conserva_identificadores(self):
+        tareas = [self._new_task("A"), self._new_task("A")]
+        self.storage.save_changes(tareas, changed=tareas)
+        tareas[1].update_progress(30)
+        self.storage.save_changes(tareas, changed=[tareas[1]])
+
+        cargadas = JournalStorage(self.test_file).load_tasks()
+        self.assertEqual([t.id for t in cargadas], [t.id for t in tareas])
+        self.assertEqual([t.progress for t in cargadas], [0, 30])
+
+    def test_instantanea_sin_identificadores(self):
+        with open(self.test_file, "w", encoding="utf-8") as file:
+            json.dump([{"name": "Antigua", "description": "Desc",
+                        "deadline": "2025-08-23T00:00:00", "priority": "ALTA"}], file)
+        tarea = JournalStorage(self.test_file).load_tasks()[0]
+        tarea.update_progress(20)
+        JournalStorage(self.test_file).save_changes([tarea], changed=[tarea])
+
+        cargadas = JournalStorage(self.test_file).load_tasks()
+        self.assertEqual(len(cargadas), 1)
+        self.assertEqual(cargadas[0].progress, 20)
+
+    def test_compacta_al_superar_umbral(self):
+        storage = JournalStorage(self.test_file, compact_threshold=1, background=False)
+        tareas = [self._new_task("A"), self._new_task("B")]
+        storage.save_changes(tareas, changed=tareas)
+
+        self.assertFalse(os.path.exists(self.test_file + ".journal"))
+        with open(self.test_file, encoding="utf-8") as file:
+            self.assertEqual([t["id"] for t in json.load(file)], [t.id for t in tareas])
+
+        tareas[1].update_progress(10)
+        storage.save_changes(tareas, changed=[tareas[1]])
+        cargadas = JournalStorage(self.test_file).load_tasks()
+        self.assertEqual(cargadas[1].progress, 10)
+
+    def test_compactacion_sin_fsync(self):
+        storage = JournalStorage(self.test_file, compact_threshold=1, background=False,
+                                 fsync=False)
+        tareas = [self._new_task("A"), self._new_task("B")]
+        with mock.patch("os.fsync") as fsync:
+            storage.save_changes(tareas, changed=tareas)
+        fsync.assert_not_called()
+        self.assertFalse(os.path.exists(self.test_file + ".journal"))
+        self.assertEqual(len(JournalStorage(self.test_file).load_tasks()), 2)
+
+    def test_compactacion_en_segundo_plano(self):
+        storage = JournalStorage(self.test_file, compact_threshold=1)
+        tareas = [self._new_task(str(i)) for i in range(50)]
+        storage.save_changes(tareas, changed=tareas)
+        eliminada = tareas.pop(10)
+        storage.save_changes(tareas, deleted=[eliminada])
+        storage.wait_for_compaction()
+
+        cargadas = JournalStorage(self.test_file).load_tasks()
+        self.assertEqual([t.name for t in cargadas], [t.name for t in tareas])
+
+    def test_rotacion_conserva_diario_de_compactacion_fallida(self):
+        tareas = [self._new_task("A"), self._new_task("B")]
+        self.storage.save_tasks(tareas)
+        with open(self.test_file + ".journal.old", "w", encoding="utf-8") as file:
+            file.write(json.dumps({"op": "del", "id": tareas[0].id}) + "\n")
+
+        storage = JournalStorage(self.test_file, compact_threshold=1, background=False)
+        tarea = storage.load_tasks()[0]
+        # Simula que la instantánea de esta compactación tampoco llega a escribirse.
+        storage._write_snapshot = lambda snapshot: None
+        tarea.update_progress(30)
+        storage.save_changes([tarea], changed=[tarea])
+
+        cargadas = JournalStorage(self.test_file).load_tasks()
+        self.assertEqual([(t.name, t.progress) for t in cargadas], [("B", 30)])
+
+    def test_recupera_compactacion_interrumpida(self):
+        tareas = [self._new_task("A"), self._new_task("B"), self._new_task("C")]
+        self.storage.save_tasks(tareas)
+        eliminada = tareas.pop(0)
+        self.storage.save_changes(tareas, deleted=[eliminada])
+        # Simula una rotación cuya instantánea no llegó a escribirse.
+        os.replace(self.test_file + ".journal", self.test_file + ".journal.old")
+        with open(self.test_file + ".tmp", "w", encoding="utf-8") as file:
+            file.write("[")
+        with open(self.test_file + ".journal", "w", encoding="utf-8") as file:
+            file.write(json.dumps({"op": "del", "id": tareas[0].id}) + "\n")
+
+        cargadas = JournalStorage(self.test_file).load_tasks()
+        self.assertEqual([t.name for t in cargadas], ["C"])
+        self.assertFalse(os.path.exists(self.test_file + ".tmp"))
@@ -0,0 +1,347 @@
+import unittest
+import os
+import threading
+from datetime import datetime, timedelta
+from src.core.manager import ProcrastinationManager
+from src.data.category_manager import CategoryManager
+from src.data.progress_log import ProgressLog
+from src.data.storage import Storage
+from src.models.task import Task, Priority
+
+class TestProcrastinationManager(unittest.TestCase):
+    def setUp(self):
+        self.test_file = "test_manager_tasks.json"
+        self.manager = ProcrastinationManager(Storage(self.test_file))
+        self.deadline = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+
+    def tearDown(self):
+        for filename in (self.test_file, self.test_file + ".lock"):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def _reload(self):
+        return ProcrastinationManager(Storage(self.test_file))
+
+    def test_identificadores_persistentes(self):
+        self.manager.add_task("Tarea", "Desc", self.deadline, "2", "General")
+        self.manager.add_task("Tarea", "Otra", self.deadline, "2", "General")
+        ids = [t.id for t in self.manager.tasks]
+        self.assertEqual(len(set(ids)), 2)
+        self.assertEqual([t.id for t in self._reload().tasks], ids)
+
+    def test_tareas_con_mismo_nombre(self):
+        self.manager.add_task("Tarea", "Primera", self.deadline, "2", "General")
+        self.manager.add_task("Tarea", "Segunda", self.deadline, "2", "General")
+        segunda = self.manager.tasks[1]
+        self.manager.update_task_progress(segunda, 80)
+
+        recargado = self._reload()
+        self.assertEqual(recargado.get_task(segunda.id).progress, 80)
+        self.assertEqual(recargado.tasks[0].progress, 0)
+
+    def test_eliminar_tarea(self):
+        self.manager.add_task("A", "Desc", self.deadline, "1", "General")
+        self.manager.add_task("B", "Desc", self.deadline, "1", "General")
+        eliminada = self.manager.tasks[0]
+        self.manager.delete_task(eliminada)
+
+        self.assertIsNone(self.manager.get_task(eliminada.id))
+        self.assertEqual([t.name for t in self._reload().tasks], ["B"])
+
+    def test_indices_de_filtrado(self):
+        self.manager.add_task("A", "Desc", self.deadline, "3", "Trabajo")
+        self.manager.add_task("B", "Desc", self.deadline, "1", "Hogar")
+        self.manager.add_task("C", "Desc", self.deadline, "3", "Hogar")
+        a, b, c = self.manager.tasks
+        self.manager.complete_task(c)
+        self.manager.edit_task(b, "B", "Desc", self.deadline, "3", "Trabajo")
+
+        alta = self.manager.get_priority_tasks(self.manager.PRIORITY_MAP["3"])
+        self.assertEqual(alta, [a, b])
+        self.assertEqual(self.manager.get_category_tasks("Trabajo"), [a, b])
+        self.assertEqual(self.manager.get_category_tasks("Hogar"), [c])
+
+        self.manager.delete_task(a)
+        self.assertEqual(self.manager.get_category_tasks("Trabajo"), [b])
+        self.assertEqual(self.manager.get_category_tasks("Inexistente"), [])
+
+    def test_orden_por_prioridad(self):
+        for i, choice in enumerate(["1", "3", "2", "3", "1"]):
+            self.manager.add_task(str(i), "Desc", self.deadline, choice, "General")
+        self.manager.complete_task(self.manager.tasks[2])
+        esperado = sorted(self.manager.tasks, key=lambda x: (x.completed, x.priority.value),
+                          reverse=True)
+        self.assertEqual(self.manager.get_tasks(sort_by_priority=True), esperado)
+
+    def test_check_procrastination(self):
+        self.manager.add_task("A", "Desc", self.deadline, "2", "General")
+        self.manager.add_task("B", "Desc", self.deadline, "2", "General")
+        self.manager.add_task("C", "Desc", self.deadline, "2", "General")
+        a, b, c = self.manager.tasks
+        self.assertEqual(self.manager.check_procrastination(), [])
+
+        self.manager.procrastination_threshold = timedelta(0)
+        self.manager.complete_task(c)
+        self.assertEqual(set(self.manager.check_procrastination()), {a, b})
+
+        self.manager.procrastination_threshold = timedelta(hours=1)
+        self.assertEqual(self.manager.check_procrastination(), [])
+        a.last_update = datetime.now() - timedelta(hours=2)
+        self.manager.procrastination_threshold = timedelta(hours=1)
+        self.assertEqual(self.manager.check_procrastination(), [a])
+        self.manager.update_task_progress(a, 10)
+        self.assertEqual(self.manager.check_procrastination(), [])
+
+    def test_add_tasks_en_lote(self):
+        tareas = self.manager.add_tasks([
+            {"name": "A", "deadline": self.deadline, "priority": "3", "category": "Trabajo"},
+            {"name": "B", "deadline": self.deadline, "priority": "BAJA", "progress": 20},
+        ])
+        self.assertEqual([t.name for t in tareas], ["A", "B"])
+        self.assertIn("Trabajo", self.manager.category_manager.get_categories())
+        recargado = self._reload()
+        self.assertEqual([t.progress for t in recargado.tasks], [0, 20])
+
+    def test_add_tasks_valida_todo_antes_de_guardar(self):
+        with self.assertRaises(ValueError) as ctx:
+            self.manager.add_tasks([
+                {"name": "Valida", "deadline": self.deadline},
+                {"name": "Sin fecha"},
+                {"name": "Fecha mala", "deadline": "mañana"},
+            ])
+        self.assertIn("Elemento 2", str(ctx.exception))
+        self.assertIn("Elemento 3", str(ctx.exception))
+        self.assertEqual(self.manager.tasks, [])
+        self.assertFalse(os.path.exists(self.test_file))
+
+    def test_add_tasks_rechaza_fechas_con_zona_horaria(self):
+        self.manager.add_task("Previa", "Desc", self.deadline, "2", "General")
+        for campo in ("deadline", "last_update"):
+            with self.assertRaises(ValueError) as ctx:
+                self.manager.add_tasks([{"name": "Con zona", "deadline": self.deadline,
+                                         campo: self.deadline + "T10:00:00+02:00"}],
+                                       allow_past=True)
+            self.assertIn("Elemento 1", str(ctx.exception))
+        self.assertEqual([t.name for t in self.manager.get_tasks()], ["Previa"])
+        self.assertEqual(self.manager.get_category_tasks("General"), self.manager.tasks)
+        self.assertEqual(self.manager.check_procrastination(), [])
+        self.assertEqual([t.name for t in self._reload().tasks], ["Previa"])
+
+    def test_lotes_exigen_tipos_estrictos(self):
+        invalidas = [["no es un objeto"], [{"name": None, "deadline": self.deadline}],
+                     [{"name": "A", "deadline": self.deadline, "completed": "false"}],
+                     [{"name": "A", "deadline": self.deadline, "category": ""}],
+                     [{"name": "A", "deadline": self.deadline, "description": 3}]]
+        for entradas in invalidas:
+            with self.assertRaises(ValueError) as ctx:
+                self.manager.add_tasks(entradas)
+            self.assertIn("Elemento 1", str(ctx.exception))
+        self.assertEqual(self.manager.tasks, [])
+
+        tarea = self.manager.add_tasks([{"name": "A", "deadline": self.deadline}])[0]
+        for cambios in ({"completed": 1}, {"name": None}, {"category": "  "}, ["name"]):
+            with self.assertRaises(ValueError):
+                self.manager.update_tasks({tarea.id: cambios})
+        self.assertEqual((tarea.name, tarea.category, tarea.completed), ("A", "General", False))
+
+    def test_update_tasks_en_lote(self):
+        a, b = self.manager.add_tasks([{"name": "A", "deadline": self.deadline},
+                                       {"name": "B", "deadline": self.deadline}])
+        self.manager.update_tasks({a.id: {"progress": 50}, b.id: {"completed": True,
+                                                                  "category": "Hogar"}})
+        self.assertEqual(self.manager.get_category_tasks("Hogar"), [b])
+        recargado = self._reload()
+        self.assertEqual(recargado.get_task(a.id).progress, 50)
+        self.assertTrue(recargado.get_task(b.id).completed)
+
+        with self.assertRaises(ValueError):
+            self.manager.update_tasks({a.id: {"progress": 150}, "inexistente": {"name": "X"}})
+        self.assertEqual(a.progress, 50)
+
+    def test_delete_tasks_en_lote(self):
+        a, b, c = self.manager.add_tasks([{"name": n, "deadline": self.deadline}
+                                          for n in "ABC"])
+        with self.assertRaises(ValueError):
+            self.manager.delete_tasks([a.id, "inexistente"])
+        self.assertEqual(len(self.manager.tasks), 3)
+        self.manager.delete_tasks([a.id, c.id])
+        self.assertEqual([t.id for t in self._reload().tasks], [b.id])
+
+    def test_escritura_diferida(self):
+        manager = ProcrastinationManager(Storage(self.test_file), write_delay=60)
+        manager.add_task("A", "Desc", self.deadline, "2", "General")
+        manager.update_task_progress(manager.tasks[0], 30)
+        self.assertTrue(manager.dirty)
+        self.assertFalse(os.path.exists(self.test_file))
+
+        manager.flush()
+        self.assertFalse(manager.dirty)
+        self.assertEqual(self._reload().tasks[0].progress, 30)
+
+    def test_escritura_diferida_por_temporizador(self):
+        manager = ProcrastinationManager(Storage(self.test_file), write_delay=0.01)
+        manager.add_task("A", "Desc", self.deadline, "2", "General")
+        timer = manager._flush_timer
+        timer.join()
+        self.assertFalse(manager.dirty)
+        self.assertEqual(len(self._reload().tasks), 1)
+
+    def test_lote_agrupa_escrituras(self):
+        llamadas = []
+        storage = Storage(self.test_file)
+        original = storage.save_changes
+        storage.save_changes = lambda *args, **kwargs: (llamadas.append(kwargs),
+                                                        original(*args, **kwargs))
+        manager = ProcrastinationManager(storage)
+        with manager.batch():
+            manager.add_task("A", "Desc", self.deadline, "2", "General")
+            manager.add_task("B", "Desc", self.deadline, "2", "General")
+            manager.delete_task(manager.tasks[0])
+            self.assertEqual(llamadas, [])
+
+        self.assertEqual(len(llamadas), 1)
+        self.assertEqual([t.name for t in llamadas[0]["changed"]], ["B"])
+        self.assertEqual([t.name for t in llamadas[0]["deleted"]], ["A"])
+        self.assertEqual([t.name for t in self._reload().tasks], ["B"])
+
+    def test_refresca_cambios_de_otro_proceso(self):
+        self.manager.add_task("Propia", "Desc", self.deadline, "2", "General")
+        otro = self._reload()
+        otro.add_task("Ajena", "Desc", self.deadline, "3", "Trabajo")
+        tarea = otro.tasks[0]
+        otro.update_task_progress(tarea, 40)
+
+        self.assertTrue(self.manager.refresh())
+        self.assertEqual([t.name for t in self.manager.tasks], ["Propia", "Ajena"])
+        self.assertEqual(self.manager.tasks[0].progress, 40)
+        self.assertEqual([t.name for t in self.manager.get_category_tasks("Trabajo")], ["Ajena"])
+        self.assertFalse(self.manager.refresh())
+
+    def test_guardado_fusiona_y_recarga(self):
+        otro = self._reload()
+        otro.add_task("Ajena", "Desc", self.deadline, "1", "General")
+        self.manager.add_task("Propia", "Desc", self.deadline, "2", "General")
+        self.assertEqual({t.name for t in self.manager.tasks}, {"Ajena", "Propia"})
+        self.assertEqual({t.name for t in self._reload().tasks}, {"Ajena", "Propia"})
+
+
+    def test_estadisticas_por_categoria(self):
+        self.manager.add_task("A", "Desc", self.deadline, "3", "Trabajo")
+        self.manager.add_task("B", "Desc", self.deadline, "1", "General")
+        tarea = self.manager.tasks[0]
+        self.manager.complete_task(tarea)
+        self.assertEqual(self.manager.get_category_stats(),
+                         self.manager.category_manager.get_category_stats(self.manager.tasks))
+        self.manager.delete_task(tarea)
+        self.assertNotIn("Trabajo", self.manager.get_category_stats())
+
+    def test_historial_de_progreso(self):
+        registro = ProgressLog(self.test_file + ".progress")
+        try:
+            manager = ProcrastinationManager(Storage(self.test_file), progress_log=registro)
+            manager.add_task("Tarea", "Desc", self.deadline, "2", "Trabajo")
+            tarea = manager.tasks[0]
+            manager.update_task_progress(tarea, 60)
+            manager.complete_task(tarea)
+            self.assertEqual([p for _, p in manager.get_progress_history(tarea)], [0, 60, 60])
+            self.assertEqual(manager.get_daily_activity(days=1),
+                             {"Trabajo": {datetime.now().date(): 3}})
+            self.assertAlmostEqual(manager.get_progress_velocity(tarea, days=1), 60)
+        finally:
+            for filename in (registro.filename, registro.categories_filename):
+                if os.path.exists(filename):
+                    os.remove(filename)
+
+    def test_registrar_progreso_actualiza_estadisticas(self):
+        tarea = Task("Tarea", "Desc", datetime.now() + timedelta(days=3), Priority.MEDIA)
+        tarea.last_update = datetime.now() - timedelta(days=2)
+        Storage(self.test_file).save_tasks([tarea])
+        manager = self._reload()
+        self.assertEqual(manager.get_category_stats()["General"]["procrastinated"], 1)
+        manager.update_task_progress(manager.tasks[0], 10)
+        self.assertEqual(manager.get_category_stats()["General"]["procrastinated"], 0)
+
+    def test_buscar_tareas(self):
+        self.manager.add_task("Informe anual", "Redactar", self.deadline, "2", "Trabajo")
+        self.manager.add_task("Compra", "Leche y pan", self.deadline, "1", "Casa")
+        self.assertEqual([t.name for t in self.manager.find_tasks("INFORME")], ["Informe anual"])
+        self.assertEqual([t.name for t in self.manager.find_tasks("casa")], ["Compra"])
+        self.assertEqual(len(self.manager.find_tasks("")), 2)
+        solo_casa = self.manager.get_category_tasks("Casa")
+        self.assertEqual(self.manager.find_tasks("informe", solo_casa), [])
+
+    def test_carga_en_segundo_plano(self):
+        self.manager.add_task("Informe", "Desc", self.deadline, "2", "Trabajo")
+        puede_cargar = threading.Event()
+
+        class StorageLento(Storage):
+            def load_tasks(self):
+                puede_cargar.wait()
+                return super().load_tasks()
+
+        categorias = CategoryManager()
+        categorias.add_category("Casa")
+        manager = ProcrastinationManager(StorageLento(self.test_file),
+                                         category_manager=categorias, background_load=True)
+        self.assertFalse(manager.loaded)
+        self.assertIn("Casa", manager.category_manager.get_categories())
+        puede_cargar.set()
+        self.assertEqual([t.name for t in manager.tasks], ["Informe"])
+        self.assertTrue(manager.loaded)
+        self.assertEqual(categorias.get_categories(), {"General", "Casa", "Trabajo"})
+
+    def test_numero_de_tareas_por_categoria(self):
+        archivo = f"{self.test_file}.categories"
+        try:
+            manager = ProcrastinationManager(Storage(self.test_file),
+                                             category_manager=CategoryManager(archivo))
+            manager.add_task("Informe", "Desc", self.deadline, "3", "Trabajo")
+            manager.add_task("Limpiar", "Desc", self.deadline, "1", "Casa")
+            tarea = manager.get_category_tasks("Casa")[0]
+            manager.edit_task(tarea, "Limpiar", "Desc", self.deadline, "1", "Trabajo")
+            self.assertEqual(CategoryManager(archivo).get_counts()["Trabajo"], 2)
+
+            manager.delete_task(tarea)
+            categorias = CategoryManager(archivo)
+            self.assertEqual((categorias.get_counts()["Trabajo"], categorias.get_counts()["Casa"]),
+                             (1, 0))
+
+            with open(archivo, "w", encoding="utf-8") as file:
+                file.write("[]")
+            categorias = CategoryManager(archivo)
+            ProcrastinationManager(Storage(self.test_file), category_manager=categorias)
+            self.assertEqual(CategoryManager(archivo).get_counts()["Trabajo"], 1)
+        finally:
+            if os.path.exists(archivo):
+                os.remove(archivo)
+
+    def test_error_de_carga_en_segundo_plano(self):
+        with open(self.test_file, "w", encoding="utf-8") as file:
+            file.write("[{dañado")
+        manager = ProcrastinationManager(Storage(self.test_file), background_load=True)
+        manager._loader.join()
+        self.assertTrue(manager.loaded)
+        self.assertIsInstance(manager.load_error, ValueError)
+        with self.assertRaises(ValueError):
+            manager.get_tasks()
+        with self.assertRaises(ValueError):
+            manager.add_task("Nueva", "Desc", self.deadline, "2", "General")
+        with self.assertRaises(ValueError):
+            manager.flush()
+        with open(self.test_file, encoding="utf-8") as file:
+            self.assertEqual(file.read(), "[{dañado")
+
+    def test_search_tasks_sigue_las_modificaciones(self):
+        self.manager.add_task("Revisión anual", "Preparar documentación", self.deadline, "2", "Trabajo")
+        self.manager.add_task("Compra", "Leche y pan", self.deadline, "1", "Casa")
+        tarea = self.manager.search_tasks("revision")[0]
+        self.assertEqual(tarea.name, "Revisión anual")
+        self.assertEqual(self.manager.search_tasks("docu trabajo"), [tarea])
+
+        self.manager.edit_task(tarea, "Declaración", "Impuestos", self.deadline, "2", "Trabajo")
+        self.assertEqual(self.manager.search_tasks("revision"), [])
+        self.assertEqual(self.manager.search_tasks("declaracion"), [tarea])
+
+        self.manager.delete_task(tarea)
+        self.assertEqual(self.manager.search_tasks("impuestos"), [])
+        self.assertEqual([t.name for t in self._reload().search_tasks("leche")], ["Compra"])
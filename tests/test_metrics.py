@@ -0,0 +1,96 @@
+import unittest
+import json
+import os
+from datetime import datetime, timedelta
+from src.core import metrics
+from src.core.manager import ProcrastinationManager
+from src.core.metrics import MetricsRegistry, timed
+from src.data.storage import Storage
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.registro = MetricsRegistry(enabled=True)
+        self.test_file = "test_metrics_tasks.json"
+
+    def tearDown(self):
+        metrics.REGISTRY.disable()
+        metrics.REGISTRY.reset()
+        for filename in (self.test_file, f"{self.test_file}.lock", "test_metrics.json",
+                         "test_metrics.prom"):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_cuenta_llamadas_errores_y_bytes(self):
+        @timed("operacion", self.registro)
+        def operacion(fallar=False):
+            self.registro.add_bytes(read=10, written=3)
+            if fallar:
+                raise ValueError("fallo")
+
+        operacion()
+        with self.assertRaises(ValueError):
+            operacion(fallar=True)
+        datos = self.registro.snapshot()["operacion"]
+        self.assertEqual((datos.count, datos.errors), (2, 1))
+        self.assertEqual((datos.bytes_read, datos.bytes_written), (20, 6))
+        self.assertEqual(sum(datos.buckets), 2)
+
+    def test_bytes_de_la_operacion_mas_interna(self):
+        with self.registro.measure("externa"):
+            with self.registro.measure("interna"):
+                self.registro.add_bytes(written=5)
+            self.registro.add_bytes(read=7)
+        self.registro.add_bytes(read=1)
+        datos = self.registro.snapshot()
+        self.assertEqual(datos["interna"].bytes_written, 5)
+        self.assertEqual(datos["externa"].bytes_read, 7)
+        self.assertEqual(datos[metrics.UNATTRIBUTED].bytes_read, 1)
+
+    def test_desactivado_no_registra(self):
+        registro = MetricsRegistry()
+        llamada = timed("operacion", registro)(lambda: 42)
+        self.assertEqual(llamada(), 42)
+        registro.add_bytes(read=10)
+        self.assertEqual(registro.snapshot(), {})
+
+    def test_histograma_y_cuantiles(self):
+        for segundos in (0.00005, 0.0003, 0.0003, 20):
+            self.registro.observe("operacion", segundos)
+        datos = self.registro.snapshot()["operacion"]
+        self.assertEqual(datos.quantile(0.5), 0.0005)
+        self.assertEqual(datos.quantile(1), float('inf'))
+        texto = self.registro.to_prometheus()
+        self.assertIn('procrastination_operation_seconds_bucket{operation="operacion",le="0.0001"} 1',
+                      texto)
+        self.assertIn('procrastination_operation_seconds_bucket{operation="operacion",le="+Inf"} 4',
+                      texto)
+        self.assertIn('procrastination_operation_seconds_count{operation="operacion"} 4', texto)
+
+    def test_exportar_a_archivo(self):
+        self.registro.observe("operacion", 0.002)
+        self.registro.write("test_metrics.json")
+        self.registro.write("test_metrics.prom")
+        with open("test_metrics.json", encoding='utf-8') as file:
+            datos = json.load(file)
+        self.assertEqual(datos["operations"]["operacion"]["count"], 1)
+        self.assertEqual(datos["operations"]["operacion"]["buckets"]["0.0025"], 1)
+        with open("test_metrics.prom", encoding='utf-8') as file:
+            self.assertIn("# TYPE procrastination_operation_seconds histogram", file.read())
+
+    def test_gestor_y_almacenamiento_instrumentados(self):
+        metrics.REGISTRY.enable()
+        manager = ProcrastinationManager(Storage(self.test_file))
+        manager.add_task("Tarea", "Desc", (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d"),
+                         "2", "General")
+        manager.get_tasks()
+        ProcrastinationManager(Storage(self.test_file))
+        datos = metrics.REGISTRY.snapshot()
+        self.assertEqual(datos["manager.add_task"].count, 1)
+        self.assertEqual(datos["manager.get_tasks"].count, 1)
+        self.assertEqual(datos["manager.load"].count, 2)
+        self.assertGreater(datos["storage.save_changes"].bytes_written, 0)
+        self.assertEqual(datos["storage.load_tasks"].bytes_read,
+                         os.path.getsize(self.test_file))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import io
+from contextlib import redirect_stderr
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from src.core.manager import ProcrastinationManager
+from src.core.monitor import (ConsoleNotifier, LogFileNotifier, Notifier,
+                              ProcrastinationMonitor)
+from src.data.storage import Storage
+
+class RecordingNotifier(Notifier):
+    def __init__(self):
+        self.alerts = []
+        self.received = threading.Event()
+
+    def notify(self, tasks):
+        self.alerts.append([task.name for task in tasks])
+        self.received.set()
+
+class FailingNotifier(Notifier):
+    def notify(self, tasks):
+        raise OSError("sin conexión")
+
+class TestProcrastinationMonitor(unittest.TestCase):
+    def setUp(self):
+        self.test_file = "test_monitor_tasks.json"
+        self.manager = ProcrastinationManager(Storage(self.test_file))
+        self.manager.procrastination_threshold = timedelta(milliseconds=100)
+        self.deadline = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+        self.notifier = RecordingNotifier()
+        self.monitor = ProcrastinationMonitor(self.manager, [FailingNotifier(), self.notifier])
+
+    def tearDown(self):
+        self.monitor.stop()
+        for filename in (self.test_file, self.test_file + ".lock", "test_monitor_alertas.log"):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_alerta_al_vencer_sin_sondeo(self):
+        self.monitor.start()
+        self.manager.add_task("Tarea", "Desc", self.deadline, "3", "General")
+        self.assertTrue(self.notifier.received.wait(5))
+        self.assertEqual(self.notifier.alerts, [["Tarea"]])
+        self.assertEqual(len(self.monitor.errors), 1)
+
+    def test_sin_tareas_pendientes_espera_sin_limite(self):
+        self.assertIsNone(self.manager.next_procrastination_expiry())
+        self.manager.add_task("Tarea", "Desc", self.deadline, "2", "General")
+        self.assertIsNotNone(self.manager.next_procrastination_expiry())
+        self.manager.complete_task(self.manager.tasks[0])
+        self.assertIsNone(self.manager.next_procrastination_expiry())
+
+    def test_alerta_una_vez_por_episodio(self):
+        self.manager.procrastination_threshold = timedelta(0)
+        self.manager.add_task("Tarea", "Desc", self.deadline, "2", "General")
+        tarea = self.manager.tasks[0]
+        time.sleep(0.01)
+        self.assertEqual([t.name for t in self.monitor.check()], ["Tarea"])
+        self.assertEqual(self.monitor.check(), [])
+        self.manager.update_task_progress(tarea, 20)
+        time.sleep(0.01)
+        self.monitor.check()
+        self.assertEqual(self.notifier.alerts, [["Tarea"], ["Tarea"]])
+
+    def test_notificadores_de_consola_y_archivo(self):
+        self.manager.add_task("Tarea", "Desc", self.deadline, "3", "Trabajo")
+        tareas = self.manager.tasks
+        salida = io.StringIO()
+        ConsoleNotifier(salida).notify(tareas)
+        self.assertIn("Tarea", salida.getvalue())
+        LogFileNotifier("test_monitor_alertas.log").notify(tareas)
+        with open("test_monitor_alertas.log", encoding='utf-8') as file:
+            self.assertIn(f"id={tareas[0].id}", file.read())
+
+    def test_error_de_carga_detiene_el_monitor(self):
+        with open(self.test_file, "w", encoding="utf-8") as file:
+            file.write("[{dañado")
+        manager = ProcrastinationManager(Storage(self.test_file), background_load=True)
+        self.monitor = ProcrastinationMonitor(manager, [self.notifier])
+        salida = io.StringIO()
+        with redirect_stderr(salida):
+            self.monitor.start()
+            self.monitor._thread.join(5)
+        self.assertFalse(self.monitor._thread.is_alive())
+        self.assertEqual(self.monitor.errors, [manager.load_error])
+        self.assertIn("Monitor de procrastinación detenido", salida.getvalue())
+
+    def test_notificador_sin_notify(self):
+        class Incompleto(Notifier):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incompleto()
+
+if __name__ == '__main__':
+    unittest.main()
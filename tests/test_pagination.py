@@ -0,0 +1,34 @@
+import unittest
+from src.ui.pagination import Paginator
+
+class TestPaginator(unittest.TestCase):
+    def setUp(self):
+        self.paginador = Paginator([f"T{numero}" for numero in range(1, 26)], page_size=10)
+
+    def test_paginas(self):
+        self.assertEqual(self.paginador.page_count, 3)
+        self.assertEqual(self.paginador.page_items()[0], (1, "T1"))
+        self.assertTrue(self.paginador.next())
+        self.assertTrue(self.paginador.next())
+        self.assertEqual(self.paginador.page_items(), [(21, "T21"), (22, "T22"), (23, "T23"),
+                                                       (24, "T24"), (25, "T25")])
+        self.assertFalse(self.paginador.next())
+        self.paginador.go_to(1)
+        self.assertFalse(self.paginador.previous())
+
+    def test_saltar_a_numero(self):
+        self.paginador.show(17)
+        self.assertEqual(self.paginador.page, 2)
+        self.assertEqual(self.paginador.get(17), "T17")
+        with self.assertRaises(ValueError):
+            self.paginador.show(26)
+        with self.assertRaises(ValueError):
+            self.paginador.go_to(4)
+
+    def test_lista_vacia(self):
+        vacio = Paginator([], page_size=10)
+        self.assertEqual(vacio.page_count, 1)
+        self.assertEqual(vacio.page_items(), [])
+
+if __name__ == '__main__':
+    unittest.main()
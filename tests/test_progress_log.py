@@ -0,0 +1,91 @@
+import unittest
+import os
+from datetime import datetime, timedelta
+from src.data.progress_log import ProgressLog
+from src.models.task import Task, Priority
+
+class TestProgressLog(unittest.TestCase):
+    def setUp(self):
+        self.test_file = "test_tasks.progress"
+        self.log = ProgressLog(self.test_file)
+        self.now = datetime(2025, 6, 10, 18, 0)
+
+    def tearDown(self):
+        for filename in (self.test_file, self.log.categories_filename):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def _task(self, name, category="General"):
+        return Task(name, "Desc", self.now + timedelta(days=30), Priority.MEDIA, category,
+                    is_loading=True)
+
+    def _record(self, task, progress, days_ago):
+        task.progress = progress
+        task.last_update = self.now - timedelta(days=days_ago)
+        self.log.record(task)
+
+    def test_historial_por_rango_y_persistencia(self):
+        tarea = self._task("A")
+        for progreso, dias in ((0, 9), (20, 6), (50, 2)):
+            self._record(tarea, progreso, dias)
+        self.assertEqual([p for _, p in self.log.history(tarea.id)], [0, 20, 50])
+        desde = self.now - timedelta(days=7)
+        self.assertEqual([p for _, p in self.log.history(tarea.id, since=desde)], [20, 50])
+
+        recargado = ProgressLog(self.test_file)
+        self.assertEqual(len(recargado), 3)
+        self.assertEqual(recargado.history(tarea.id), self.log.history(tarea.id))
+
+    def test_velocidad(self):
+        tarea = self._task("A")
+        self._record(tarea, 10, 9)
+        self._record(tarea, 30, 5)
+        self._record(tarea, 80, 1)
+        self.assertEqual(self.log.velocity(tarea.id, days=7, now=self.now), (80 - 10) / 7)
+        self.assertEqual(self.log.velocity(tarea.id, days=7, now=self.now - timedelta(days=9)), 0)
+        self.assertEqual(self.log.velocity(self._task("Sin eventos").id, now=self.now), 0)
+
+    def test_actividad_diaria_por_categoria(self):
+        trabajo = self._task("A", "Trabajo")
+        casa = self._task("B", "Casa")
+        self._record(trabajo, 10, 0)
+        self._record(trabajo, 20, 0)
+        self._record(casa, 10, 1)
+        self._record(casa, 30, 10)
+        actividad = ProgressLog(self.test_file).daily_activity(days=3, now=self.now)
+        hoy = self.now.date()
+        self.assertEqual(actividad, {"Trabajo": {hoy: 2},
+                                     "Casa": {hoy - timedelta(days=1): 1}})
+
+    def test_categorias_de_varios_procesos(self):
+        otro = ProgressLog(self.test_file)
+        self._record(self._task("A", "Casa"), 10, 0)
+        tarea = self._task("B", "Trabajo\nextra")
+        tarea.last_update = self.now
+        otro.record(tarea)
+        self._record(self._task("C", "Trabajo\nextra"), 10, 0)
+        actividad = ProgressLog(self.test_file).daily_activity(days=3, now=self.now)
+        self.assertEqual({categoria: sum(dias.values()) for categoria, dias in actividad.items()},
+                         {"Casa": 1, "Trabajo\nextra": 2})
+        self.assertEqual(otro.daily_activity(days=3, now=self.now).keys(), actividad.keys())
+
+    def test_descarta_registro_incompleto(self):
+        tarea = self._task("A")
+        self._record(tarea, 40, 1)
+        with open(self.test_file, 'ab') as file:
+            file.write(b"\x00" * 5)
+        self.assertEqual(len(ProgressLog(self.test_file)), 1)
+
+    def test_registrar_sin_consultar_no_lee_el_archivo(self):
+        tarea = self._task("A")
+        self._record(tarea, 10, 3)
+        log = ProgressLog(self.test_file)
+        tarea.progress = 40
+        tarea.last_update = self.now
+        log.record(tarea)
+        self.assertFalse(log._events_loaded)
+        self.assertEqual([p for _, p in log.history(tarea.id)], [10, 40])
+        self.assertEqual(len(log), 2)
+
+if __name__ == '__main__':
+    unittest.main()
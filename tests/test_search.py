@@ -0,0 +1,107 @@
+import os
+import unittest
+from datetime import datetime, timedelta
+from src.core import search
+from src.core.search import SearchIndex, normalize, tokenize
+from src.models.task import Task, Priority
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = SearchIndex()
+        self.deadline = datetime.now() + timedelta(days=3)
+        self.test_file = "test_tasks.json.search"
+
+    def tearDown(self):
+        if os.path.exists(self.test_file):
+            os.remove(self.test_file)
+
+    def _task(self, name, description="", category="General"):
+        task = Task(name, description, self.deadline, Priority.MEDIA, category)
+        self.index.add(task)
+        return task
+
+    def test_normaliza_mayusculas_y_acentos(self):
+        self.assertEqual(normalize("Canción ÁRBOL Pingüino"), "cancion arbol pinguino")
+        self.assertEqual(tokenize("¿Revisión del año, 2024?"), ["revision", "del", "ano", "2024"])
+
+    def test_busca_sin_acentos_y_por_prefijo(self):
+        cancion = self._task("Canción de cumpleaños", "Ensayar", "Música")
+        informe = self._task("Informe", "Programar la revisión", "Trabajo")
+        self.assertEqual(self.index.search("cancion"), [cancion.id])
+        self.assertEqual(self.index.search("MUSICA"), [cancion.id])
+        self.assertEqual(self.index.search("prog revi"), [informe.id])
+        self.assertEqual(self.index.search("cancion trabajo"), [])
+        self.assertEqual(self.index.search("  "), [])
+
+    def test_tolera_una_errata(self):
+        tarea = self._task("Presupuesto trimestral")
+        self.assertEqual(self.index.search("presupusto"), [tarea.id])
+        self.assertEqual(self.index.search("trimestrak"), [tarea.id])
+        self.assertEqual(self.index.search("presupeusto"), [tarea.id])
+        self.assertEqual(self.index.search("presupusto", fuzzy=False), [])
+        # Las palabras cortas no se buscan de forma aproximada.
+        self.assertEqual(self.index.search("trm"), [])
+
+    def test_ordena_por_relevancia(self):
+        prefijo = self._task("Programación")
+        exacta = self._task("Programa")
+        otra = self._task("Programar")
+        self.assertEqual(self.index.search("programa"), [exacta.id, prefijo.id, otra.id])
+        self.assertEqual(self.index.search("programa", limit=1), [exacta.id])
+
+    def test_actualiza_al_modificar_y_eliminar(self):
+        tarea = self._task("Compra", "Leche")
+        self.index.remove(tarea)
+        tarea.name = "Limpieza"
+        tarea.last_update = datetime.now() + timedelta(seconds=1)
+        self.index.add(tarea)
+        self.assertEqual(self.index.search("compra"), [])
+        self.assertEqual(self.index.search("limpieza"), [tarea.id])
+        self.index.forget(tarea)
+        self.assertEqual(self.index.search("leche"), [])
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index._postings, {})
+
+    def test_exige_eliminar_antes_de_modificar(self):
+        tarea = self._task("Compra")
+        tarea.last_update += timedelta(seconds=1)
+        with self.assertRaises(ValueError):
+            self.index.add(tarea)
+
+    def test_reutiliza_el_indice_guardado(self):
+        self.index = SearchIndex(self.test_file)
+        informe = self._task("Informe anual")
+        compra = self._task("Compra semanal")
+        borrada = self._task("Llamada pendiente")
+        self.index.save()
+
+        original = search.tokenize
+        search.tokenize = lambda text: self.fail("No debería volver a analizar la tarea")
+        try:
+            cargado = SearchIndex(self.test_file)
+            cargado.load([informe, compra])
+        finally:
+            search.tokenize = original
+        self.assertEqual(cargado.search("anual"), [informe.id])
+        self.assertEqual(cargado.search("llamada"), [])
+        self.assertEqual(len(cargado), 2)
+
+        # Si la tarea cambió desde que se guardó, se vuelve a analizar.
+        compra.name = "Limpieza"
+        compra.last_update += timedelta(seconds=1)
+        cargado = SearchIndex(self.test_file)
+        cargado.load([informe, compra, borrada])
+        self.assertEqual(cargado.search("compra"), [])
+        self.assertEqual(cargado.search("limpieza"), [compra.id])
+        self.assertEqual(cargado.search("pendiente"), [borrada.id])
+
+    def test_ignora_un_indice_danado(self):
+        with open(self.test_file, "w", encoding="utf-8") as file:
+            file.write("{no es json")
+        index = SearchIndex(self.test_file)
+        tarea = Task("Compra", "", self.deadline, Priority.MEDIA)
+        index.load([tarea])
+        self.assertEqual(index.search("compra"), [tarea.id])
+
+if __name__ == '__main__':
+    unittest.main()
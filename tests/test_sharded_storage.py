@@ -0,0 +1,90 @@
+import unittest
+import os
+import shutil
+from datetime import datetime, timedelta
+from src.core.manager import ProcrastinationManager
+from src.data.sharded_storage import ShardedStorage
+from src.data.storage import StorageConflictError, task_to_dict
+from src.models.task import Task, Priority
+
+class TestShardedStorage(unittest.TestCase):
+    def setUp(self):
+        self.directory = "test_tasks.shards"
+        self.storage = ShardedStorage(self.directory, fsync=False)
+        self.future_date = datetime.now() + timedelta(days=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        if os.path.exists(self.storage.lock_filename):
+            os.remove(self.storage.lock_filename)
+
+    def _tareas(self):
+        return [Task("Informe", "Revisar cifras", self.future_date, Priority.ALTA, "Trabajo"),
+                Task("Canción", "Ensayar ♪", self.future_date, Priority.BAJA, "Ocio"),
+                Task("Reunión", "Preparar", self.future_date, Priority.MEDIA, "Trabajo"),
+                Task("Rara", "Categoría con barra", self.future_date, Priority.MEDIA, "a/b")]
+
+    def test_ida_y_vuelta(self):
+        tareas = self._tareas()
+        self.storage.save_tasks(tareas)
+        cargadas = ShardedStorage(self.directory).load_tasks()
+        self.assertEqual(sorted((task_to_dict(t) for t in cargadas), key=lambda d: d['id']),
+                         sorted((task_to_dict(t) for t in tareas), key=lambda d: d['id']))
+        self.assertEqual(len(os.listdir(self.directory)), 4)
+        self.assertTrue(self.storage.shard_filename("a/b").startswith(self.directory))
+
+    def test_solo_se_reescriben_los_fragmentos_afectados(self):
+        tareas = self._tareas()
+        self.storage.save_tasks(tareas)
+        ocio = self.storage.shard_filename("Ocio")
+        antes = os.stat(ocio).st_ino
+        tareas[0].update_progress(50)
+        self.storage.save_changes(tareas, changed=[tareas[0]])
+        self.assertEqual(os.stat(ocio).st_ino, antes)
+        cargada = next(t for t in ShardedStorage(self.directory).load_tasks()
+                       if t.id == tareas[0].id)
+        self.assertEqual(cargada.progress, 50)
+
+    def test_cambio_de_categoria_mueve_la_tarea(self):
+        tareas = self._tareas()
+        self.storage.save_tasks(tareas)
+        tareas[1].category = "Trabajo"
+        self.storage.update_task(tareas[1])
+        self.assertIsNone(self.storage.shard_filename("Ocio"))
+        self.assertEqual(len(self.storage.load_category("Trabajo")), 3)
+
+    def test_cargar_una_categoria_no_lee_las_demas(self):
+        self.storage.save_tasks(self._tareas())
+        with open(self.storage.shard_filename("Ocio"), 'w', encoding='utf-8') as file:
+            file.write("dañado")
+        self.assertEqual(sorted(t.name for t in self.storage.load_category("Trabajo")),
+                         ["Informe", "Reunión"])
+        self.assertEqual(self.storage.load_category("Inexistente"), [])
+
+    def test_conflicto_y_fusion_entre_procesos(self):
+        tareas = self._tareas()
+        self.storage.save_tasks(tareas)
+        otro = ShardedStorage(self.directory)
+        suyas = otro.load_tasks()
+        nueva = Task("Nueva", "Desc", self.future_date, Priority.ALTA, "Ocio")
+        self.assertFalse(otro.save_changes(suyas + [nueva], changed=[nueva]))
+
+        tareas[0].update_progress(10)
+        self.assertTrue(self.storage.save_changes(tareas, changed=[tareas[0]]))
+        self.assertEqual(len(ShardedStorage(self.directory).load_tasks()), 5)
+
+        propia = next(t for t in suyas if t.id == tareas[0].id)
+        propia.update_progress(90)
+        with self.assertRaises(StorageConflictError):
+            otro.save_changes(suyas, changed=[propia])
+
+    def test_gestor_sobre_fragmentos(self):
+        manager = ProcrastinationManager(self.storage)
+        manager.add_task("Tarea", "Desc", self.future_date.strftime("%Y-%m-%d"), "2", "Casa")
+        tarea = manager.get_tasks()[0]
+        manager.delete_task(tarea)
+        self.assertIsNone(self.storage.shard_filename("Casa"))
+        self.assertEqual(ProcrastinationManager(ShardedStorage(self.directory)).tasks, [])
+
+if __name__ == '__main__':
+    unittest.main()
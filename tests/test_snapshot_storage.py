@@ -0,0 +1,106 @@
+import unittest
+import json
+import os
+from datetime import datetime, timedelta
+from src.cli import main
+from src.data.storage import Storage, StorageConflictError, task_to_dict
+from src.data.snapshot_storage import SnapshotStorage
+from src.models.task import Task, Priority
+
+class TestSnapshotStorage(unittest.TestCase):
+    def setUp(self):
+        self.test_file = "test_tasks.snap"
+        self.json_file = "test_snapshot.json"
+        self.storage = SnapshotStorage(self.test_file, backups=1)
+        self.future_date = datetime.now() + timedelta(days=1)
+
+    def tearDown(self):
+        for filename in (self.test_file, self.storage.lock_filename,
+                         self.storage.backup_filename(1), self.json_file,
+                         f"{self.json_file}.lock", "test_snapshot_copia.json",
+                         "test_snapshot_copia.json.lock"):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def _tareas(self):
+        tareas = [Task("Informe", "Revisar cifras", self.future_date, Priority.ALTA, "Trabajo"),
+                  Task("Canción", "Ensayar el estribillo ♪", self.future_date, Priority.BAJA, "Ocio"),
+                  Task("", "", self.future_date, Priority.MEDIA, "Trabajo")]
+        tareas[0].update_progress(40)
+        tareas[1].completed = True
+        return tareas
+
+    def test_ida_y_vuelta(self):
+        tareas = self._tareas()
+        self.storage.save_tasks(tareas)
+        cargadas = SnapshotStorage(self.test_file).load_tasks()
+        self.assertEqual([task_to_dict(t) for t in cargadas], [task_to_dict(t) for t in tareas])
+
+    def test_identificadores_que_no_son_uuid(self):
+        with open(self.json_file, 'w', encoding='utf-8') as file:
+            json.dump([{"id": "tarea-1", "name": "Antigua", "description": "Desc",
+                        "deadline": "2025-08-23T00:00:00", "priority": "ALTA"}], file)
+        tareas = Storage(self.json_file).load_tasks()
+        self.storage.save_tasks(tareas)
+        self.assertEqual(self.storage.load_tasks()[0].id, "tarea-1")
+
+    def test_vista_perezosa(self):
+        tareas = self._tareas()
+        self.storage.save_tasks(tareas)
+        with self.storage.open_view() as vista:
+            self.assertEqual(len(vista), 3)
+            self.assertEqual(vista[1].name, "Canción")
+            self.assertEqual(vista[-1].id, tareas[2].id)
+            self.assertEqual([t.category for t in vista[:2]], ["Trabajo", "Ocio"])
+            with self.assertRaises(IndexError):
+                vista[3]
+
+    def test_archivo_que_no_es_instantanea(self):
+        with open(self.test_file, 'wb') as file:
+            file.write(b'[{"name": "JSON"}]' + bytes(64))
+        with self.assertRaises(ValueError):
+            self.storage.load_tasks()
+
+    def test_recupera_la_copia_si_esta_danada(self):
+        self.storage.save_tasks(self._tareas())
+        self.storage.save_tasks(self._tareas()[:1])
+        with open(self.test_file, 'r+b') as file:
+            file.truncate(os.path.getsize(self.test_file) - 4)
+        self.assertEqual(len(self.storage.load_tasks()), 3)
+        self.assertEqual(self.storage.recovered_from, self.storage.backup_filename(1))
+
+    def test_fusiona_cambios_de_otro_proceso(self):
+        tareas = self._tareas()
+        self.storage.save_tasks(tareas)
+        otro = SnapshotStorage(self.test_file)
+        suyas = otro.load_tasks()
+        mias = self.storage.load_tasks()
+
+        suyas[0].update_progress(90)
+        otro.save_changes(suyas, changed=[suyas[0]])
+        mias[1].update_progress(10)
+        self.storage.save_changes(mias, changed=[mias[1]])
+
+        cargadas = SnapshotStorage(self.test_file).load_tasks()
+        self.assertEqual([t.progress for t in cargadas[:2]], [90, 10])
+
+        suyas = otro.load_tasks()
+        suyas[2].update_progress(5)
+        otro.save_changes(suyas, changed=[suyas[2]])
+        mias[2].update_progress(7)
+        with self.assertRaises(StorageConflictError):
+            self.storage.save_changes(mias, changed=[mias[2]])
+
+    def test_convertir_desde_y_hacia_json(self):
+        tareas = self._tareas()
+        Storage(self.json_file).save_tasks(tareas)
+        self.assertEqual(main(["--file", self.json_file, "convert", "--to", "snapshot",
+                               self.test_file]), 0)
+        self.assertEqual(main(["--storage", "snapshot", "--file", self.test_file, "convert",
+                               "--to", "json", "test_snapshot_copia.json"]), 0)
+        with open(self.json_file, encoding='utf-8') as original:
+            with open("test_snapshot_copia.json", encoding='utf-8') as copia:
+                self.assertEqual(json.load(copia), json.load(original))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import os
+from datetime import datetime, timedelta
+from src.data.storage import Storage
+from src.data.sqlite_storage import SqliteStorage, migrate_from_json
+from src.models.task import Task, Priority
+
+class TestSqliteStorage(unittest.TestCase):
+    def setUp(self):
+        self.test_file = "test_tasks.db"
+        self.storage = SqliteStorage(self.test_file)
+        self.future_date = datetime.now() + timedelta(days=1)
+
+    def tearDown(self):
+        self.storage.close()
+        for filename in (self.test_file, "test_migracion.json", "test_migracion.json.lock",
+                         "test_migracion.db"):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_guardar_y_cargar_tareas(self):
+        tarea = Task("Test", "Desc", self.future_date, Priority.MEDIA, "Trabajo")
+        self.storage.save_task(tarea)
+        otra = SqliteStorage(self.test_file)
+        tareas = otra.load_tasks()
+        otra.close()
+        self.assertEqual(len(tareas), 1)
+        self.assertEqual(tareas[0].name, "Test")
+        self.assertEqual(tareas[0].category, "Trabajo")
+
+    def test_actualizar_tarea(self):
+        tarea = Task("Test", "Desc", self.future_date, Priority.MEDIA)
+        self.storage.save_task(tarea)
+        tarea.update_progress(75)
+        self.storage.update_task(tarea)
+        otra = SqliteStorage(self.test_file)
+        self.assertEqual(otra.load_tasks()[0].progress, 75)
+        otra.close()
+
+    def test_actualizar_tarea_inexistente(self):
+        self.storage.save_task(Task("Existente", "Desc", self.future_date, Priority.MEDIA))
+        self.storage.update_task(Task("Inexistente", "Desc", self.future_date, Priority.MEDIA))
+        tareas = self.storage.load_tasks()
+        self.assertEqual([t.name for t in tareas], ["Existente"])
+
+    def test_save_changes(self):
+        tareas = [Task(str(i), "Desc", self.future_date, Priority.BAJA) for i in range(3)]
+        self.storage.save_changes(tareas, changed=tareas)
+        tareas[2].completed = True
+        eliminada = tareas.pop(0)
+        self.storage.save_changes(tareas, changed=[tareas[1]], deleted=[eliminada])
+
+        otra = SqliteStorage(self.test_file)
+        cargadas = otra.load_tasks()
+        otra.close()
+        self.assertEqual([t.name for t in cargadas], ["1", "2"])
+        self.assertTrue(cargadas[1].completed)
+
+    def test_consultas_filtradas(self):
+        alta = Task("Alta", "Desc", self.future_date, Priority.ALTA, "Trabajo")
+        baja = Task("Baja", "Desc", self.future_date, Priority.BAJA, "Hogar")
+        vieja = Task("Vieja", "Desc", self.future_date, Priority.ALTA, "Hogar")
+        vieja.last_update = datetime.now() - timedelta(days=3)
+        hecha = Task("Hecha", "Desc", self.future_date, Priority.ALTA, "Trabajo")
+        hecha.completed = True
+        self.storage.save_tasks([alta, baja, vieja, hecha])
+
+        self.assertEqual(self.storage.query_tasks(category="Hogar"), [baja, vieja])
+        self.assertEqual(self.storage.query_tasks(priority=Priority.ALTA, completed=False),
+                         [alta, vieja])
+        self.assertEqual(self.storage.query_tasks(
+            completed=False, updated_before=datetime.now() - timedelta(days=1)), [vieja])
+
+    def test_misma_fila_mismo_objeto(self):
+        self.storage.save_task(Task("Test", "Desc", self.future_date, Priority.MEDIA))
+        otra = SqliteStorage(self.test_file)
+        tareas = otra.load_tasks()
+        self.assertIs(otra.query_tasks(category="General")[0], tareas[0])
+        otra.close()
+
+    def test_cambios_de_otra_conexion(self):
+        tarea = Task("Test", "Desc", self.future_date, Priority.MEDIA)
+        self.storage.save_task(tarea)
+        otra = SqliteStorage(self.test_file)
+        cargada = otra.load_tasks()[0]
+        tarea.update_progress(60)
+        self.storage.update_task(tarea)
+        actual = otra.query_tasks(category="General")[0]
+        self.assertEqual(actual.progress, 60)
+        self.assertEqual(cargada.progress, 0)
+        self.assertIs(otra.load_tasks()[0], actual)
+        self.storage.save_changes([], deleted=[tarea])
+        self.assertEqual(otra.load_tasks(), [])
+        otra.close()
+
+    def test_migracion_desde_json(self):
+        tareas = [Task(str(i), "Desc", self.future_date, Priority.MEDIA) for i in range(3)]
+        Storage("test_migracion.json").save_tasks(tareas)
+        self.assertEqual(migrate_from_json("test_migracion.json", "test_migracion.db"), 3)
+        migradas = SqliteStorage("test_migracion.db")
+        self.assertEqual([t.name for t in migradas.load_tasks()], ["0", "1", "2"])
+        migradas.close()
@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime, timedelta
+from src.core.staleness import StalenessTracker
+from src.models.task import Task, Priority
+
+class TestStalenessTracker(unittest.TestCase):
+    def setUp(self):
+        self.tracker = StalenessTracker(timedelta(hours=1))
+        self.now = datetime.now()
+        self.future_date = self.now + timedelta(days=1)
+
+    def _task(self, name, hours_ago):
+        task = Task(name, "Desc", self.future_date, Priority.MEDIA)
+        task.last_update = self.now - timedelta(hours=hours_ago)
+        return task
+
+    def test_detecta_tareas_estancadas(self):
+        vieja = self._task("Vieja", 2)
+        reciente = self._task("Reciente", 0)
+        self.tracker.track(vieja)
+        self.tracker.track(reciente)
+        self.assertEqual(self.tracker.stale(self.now), [vieja])
+        self.assertEqual(self.tracker.stale(self.now + timedelta(hours=2)), [vieja, reciente])
+
+    def test_actualizar_tarea_la_retira(self):
+        tarea = self._task("Tarea", 2)
+        self.tracker.track(tarea)
+        self.assertEqual(self.tracker.stale(self.now), [tarea])
+        tarea.last_update = self.now
+        self.tracker.track(tarea)
+        self.assertEqual(self.tracker.stale(self.now), [])
+        self.assertEqual(self.tracker.next_expiry(), self.now + timedelta(hours=1))
+
+    def test_completadas_y_eliminadas(self):
+        completada = self._task("Completada", 2)
+        completada.completed = True
+        eliminada = self._task("Eliminada", 2)
+        self.tracker.track(completada)
+        self.tracker.track(eliminada)
+        self.tracker.untrack(eliminada)
+        self.assertEqual(self.tracker.stale(self.now), [])
+        self.assertIsNone(self.tracker.next_expiry())
+
+    def test_cambiar_umbral(self):
+        tarea = self._task("Tarea", 2)
+        self.tracker.track(tarea)
+        self.assertEqual(self.tracker.stale(self.now), [tarea])
+        self.tracker.threshold = timedelta(hours=3)
+        self.assertEqual(self.tracker.stale(self.now), [])
+        self.assertEqual(self.tracker.next_expiry(), tarea.last_update + timedelta(hours=3))
+
+    def test_umbral_inclusivo(self):
+        tracker = StalenessTracker(timedelta(hours=1), inclusive=True)
+        tarea = self._task("Tarea", 1)
+        tracker.track(tarea)
+        self.assertEqual(tracker.stale(self.now), [tarea])
+        self.tracker.track(tarea)
+        self.assertEqual(self.tracker.stale(self.now), [])
+
+    def test_compacta_entradas_obsoletas(self):
+        tarea = self._task("Tarea", 0)
+        for _ in range(500):
+            self.tracker.track(tarea)
+        self.assertLess(len(self.tracker._heap), 100)
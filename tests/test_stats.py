@@ -0,0 +1,56 @@
+import unittest
+from datetime import datetime, timedelta
+from src.core.stats import CategoryStats
+from src.data.category_manager import CategoryManager
+from src.models.task import Task, Priority
+
+class TestCategoryStats(unittest.TestCase):
+    def setUp(self):
+        self.stats = CategoryStats()
+        self.now = datetime.now()
+        self.future_date = self.now + timedelta(days=3)
+
+    def _task(self, name, category, priority=Priority.MEDIA, days_ago=0, completed=False):
+        task = Task(name, "Desc", self.future_date, priority, category)
+        task.last_update = self.now - timedelta(days=days_ago)
+        task.completed = completed
+        return task
+
+    def test_coincide_con_el_calculo_completo(self):
+        tareas = [
+            self._task("A", "Trabajo", Priority.ALTA, days_ago=2),
+            self._task("B", "Trabajo", completed=True, days_ago=5),
+            self._task("C", "Casa", days_ago=1),
+            self._task("D", "Casa", Priority.ALTA),
+        ]
+        for tarea in tareas:
+            self.stats.add(tarea)
+        esperado = CategoryManager().get_category_stats(tareas)
+        self.assertEqual(self.stats.get(self.now + timedelta(seconds=1)), esperado)
+
+    def test_actualiza_contadores_al_modificar(self):
+        tarea = self._task("A", "Trabajo", Priority.ALTA, days_ago=2)
+        self.stats.add(tarea)
+        self.assertEqual(self.stats.get(self.now)["Trabajo"]["procrastinated"], 1)
+
+        self.stats.remove(tarea)
+        tarea.last_update = self.now
+        tarea.category = "Casa"
+        self.stats.add(tarea)
+        estadisticas = self.stats.get(self.now)
+        self.assertNotIn("Trabajo", estadisticas)
+        self.assertEqual(estadisticas["Casa"], {'total': 1, 'completed': 0, 'pending': 1,
+                                                'high_priority': 1, 'procrastinated': 0})
+        self.assertEqual(self.stats.get(self.now + timedelta(days=1))["Casa"]["procrastinated"], 1)
+
+    def test_tarea_completada_no_cuenta_como_procrastinada(self):
+        tarea = self._task("A", "Trabajo", days_ago=2)
+        self.stats.add(tarea)
+        self.stats.get(self.now)
+        self.stats.remove(tarea)
+        tarea.completed = True
+        self.stats.add(tarea)
+        self.assertEqual(self.stats.get(self.now)["Trabajo"]["procrastinated"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
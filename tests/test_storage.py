@@ -2,7 +2,8 @@ import unittest
 import json
 import os
 from datetime import datetime, timedelta
-from src.data.storage import Storage
+from src.core.manager import ProcrastinationManager
+from src.data.storage import Storage, StorageConflictError
 from src.models.task import Task, Priority
 
 class TestStorage(unittest.TestCase):
@@ -13,8 +14,9 @@ class TestStorage(unittest.TestCase):
         self.future_date = datetime.now() + timedelta(days=1)
     
     def tearDown(self):
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
+        for filename in (self.test_file, self.storage.lock_filename):
+            if os.path.exists(filename):
+                os.remove(filename)
     
     def test_guardar_y_cargar_tareas(self):
         tarea = Task("Test", "Desc", self.future_date, Priority.MEDIA)
@@ -41,3 +43,135 @@ class TestStorage(unittest.TestCase):
         tareas = self.storage.load_tasks()
         self.assertEqual(len(tareas), 1)
         self.assertEqual(tareas[0].name, "Existente")
+
+    def test_actualizar_tarea_con_nombre_repetido(self):
+        primera = Task("Test", "Primera", self.future_date, Priority.MEDIA)
+        segunda = Task("Test", "Segunda", self.future_date, Priority.MEDIA)
+        self.storage.save_tasks([primera, segunda])
+        segunda.update_progress(40)
+        self.storage.update_task(segunda)
+        tareas = self.storage.load_tasks()
+        self.assertEqual([t.progress for t in tareas], [0, 40])
+        self.assertEqual([t.id for t in tareas], [primera.id, segunda.id])
+
+    def test_identificador_estable_sin_id_guardado(self):
+        with open(self.test_file, 'w', encoding='utf-8') as file:
+            json.dump([{"name": "Antigua", "description": "Desc",
+                        "deadline": "2025-08-23T00:00:00", "priority": "ALTA"}], file)
+        self.assertEqual(self.storage.load_tasks()[0].id, self.storage.load_tasks()[0].id)
+
+    def test_registros_antiguos_identicos(self):
+        registro = {"name": "Repetida", "description": "Desc",
+                    "deadline": "2025-08-23T00:00:00", "priority": "ALTA"}
+        with open(self.test_file, 'w', encoding='utf-8') as file:
+            json.dump([registro, registro], file)
+        manager = ProcrastinationManager(self.storage)
+        self.assertEqual(len(manager.tasks), 2)
+        manager.update_task_progress(manager.tasks[0], 30)
+        self.assertEqual(len(Storage(self.test_file).load_tasks()), 2)
+
+    def test_carga_incremental_por_bloques(self):
+        tareas = [Task(f"Tarea {i}", "x" * 500, self.future_date, Priority.BAJA)
+                  for i in range(300)]
+        self.storage.save_tasks(tareas)
+        iterador = self.storage.iter_tasks()
+        self.assertEqual(next(iterador).name, "Tarea 0")
+        self.assertEqual([t.id for t in self.storage.iter_tasks()], [t.id for t in tareas])
+
+    def test_archivo_invalido(self):
+        with open(self.test_file, 'w', encoding='utf-8') as file:
+            file.write('[{"name": "Incompleta"')
+        with self.assertRaises(json.JSONDecodeError):
+            self.storage.load_tasks()
+
+    def test_formato_ndjson(self):
+        archivo = "test_tasks.ndjson"
+        storage = Storage(archivo)
+        try:
+            primera = Task("Primera", "Desc", self.future_date, Priority.ALTA)
+            storage.save_tasks([primera])
+            storage.save_task(Task("Segunda", "Desc", self.future_date, Priority.BAJA))
+            with open(archivo, encoding='utf-8') as file:
+                self.assertEqual(len(file.readlines()), 2)
+
+            primera.update_progress(30)
+            storage.update_task(primera)
+            tareas = storage.load_tasks()
+            self.assertEqual([t.name for t in tareas], ["Primera", "Segunda"])
+            self.assertEqual(tareas[0].progress, 30)
+        finally:
+            os.remove(archivo)
+            os.remove(storage.lock_filename)
+
+    def test_escritura_atomica_conserva_original_si_falla(self):
+        self.storage.save_tasks([Task("Original", "Desc", self.future_date, Priority.MEDIA)])
+        rota = Task("Rota", "Desc", self.future_date, Priority.MEDIA)
+        rota.deadline = None
+        with self.assertRaises(AttributeError):
+            self.storage.save_tasks([rota])
+        self.assertEqual([t.name for t in self.storage.load_tasks()], ["Original"])
+        self.assertEqual([f for f in os.listdir('.') if f.endswith('.tmp')], [])
+
+    def test_recupera_desde_copia_de_seguridad(self):
+        storage = Storage(self.test_file, backups=2)
+        try:
+            for nombre in ("Primera", "Segunda", "Tercera"):
+                storage.save_tasks([Task(nombre, "Desc", self.future_date, Priority.MEDIA)])
+            self.assertFalse(os.path.exists(storage.backup_filename(3)))
+            with open(self.test_file, 'w', encoding='utf-8') as file:
+                file.write('[{"name": "Trunc')
+
+            tareas = storage.load_tasks()
+            self.assertEqual([t.name for t in tareas], ["Segunda"])
+            self.assertEqual(storage.recovered_from, storage.backup_filename(1))
+        finally:
+            for numero in (1, 2):
+                if os.path.exists(storage.backup_filename(numero)):
+                    os.remove(storage.backup_filename(numero))
+
+    def test_sin_copia_valida_propaga_el_error(self):
+        with open(self.test_file, 'w', encoding='utf-8') as file:
+            file.write('no es json')
+        with self.assertRaises(ValueError):
+            Storage(self.test_file, backups=1).load_tasks()
+
+    def test_fusiona_cambios_de_otro_proceso(self):
+        comun = Task("Comun", "Desc", self.future_date, Priority.MEDIA)
+        self.storage.save_tasks([comun])
+        otro = Storage(self.test_file)
+        tarea_otro = otro.load_tasks()[0]
+        self.storage.load_tasks()
+
+        nueva = Task("Nueva", "Desc", self.future_date, Priority.ALTA)
+        self.assertFalse(otro.save_changes([tarea_otro, nueva], changed=[nueva]))
+        self.assertTrue(self.storage.has_external_changes())
+
+        propia = Task("Propia", "Desc", self.future_date, Priority.BAJA)
+        self.assertTrue(self.storage.save_changes([comun, propia], changed=[propia]))
+        self.assertFalse(self.storage.has_external_changes())
+        self.assertEqual([t.name for t in otro.load_tasks()], ["Comun", "Nueva", "Propia"])
+
+    def test_conflicto_si_otro_proceso_modifica_la_misma_tarea(self):
+        comun = Task("Comun", "Desc", self.future_date, Priority.MEDIA)
+        self.storage.save_tasks([comun])
+        otro = Storage(self.test_file)
+        tarea_otro = otro.load_tasks()[0]
+        self.storage.load_tasks()
+
+        tarea_otro.last_update = datetime.now() + timedelta(seconds=1)
+        tarea_otro.progress = 50
+        otro.save_changes([tarea_otro], changed=[tarea_otro])
+
+        comun.progress = 20
+        comun.last_update = datetime.now() + timedelta(seconds=2)
+        with self.assertRaises(StorageConflictError) as contexto:
+            self.storage.save_changes([comun], changed=[comun])
+        self.assertEqual(contexto.exception.task_ids, [comun.id])
+        self.assertEqual(otro.load_tasks()[0].progress, 50)
+
+    def test_cerrojo_reentrante(self):
+        with self.storage.lock():
+            with self.storage.lock():
+                self.storage.save_tasks([Task("Dentro", "Desc", self.future_date, Priority.BAJA)])
+            self.assertEqual(len(self.storage.load_tasks()), 1)
+        self.assertTrue(os.path.exists(self.storage.lock_filename))
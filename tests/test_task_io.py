@@ -0,0 +1,65 @@
+import unittest
+import os
+from datetime import datetime, timedelta
+from src.cli import main
+from src.data.storage import Storage
+from src.data.task_io import detect_format, read_records, write_records
+from src.models.task import Task, Priority
+
+class TestTaskIO(unittest.TestCase):
+    def setUp(self):
+        self.files = []
+        self.future_date = datetime.now() + timedelta(days=1)
+
+    def tearDown(self):
+        for filename in self.files + [name + ".lock" for name in self.files]:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def _file(self, name):
+        self.files.append(name)
+        return name
+
+    def test_detectar_formato(self):
+        self.assertEqual(detect_format("tareas.CSV"), "csv")
+        self.assertEqual(detect_format("tareas.jsonl"), "ndjson")
+        self.assertEqual(detect_format("tareas.txt", "json"), "json")
+        with self.assertRaises(ValueError):
+            detect_format("tareas.txt")
+
+    def test_ida_y_vuelta_en_todos_los_formatos(self):
+        registros = [{"id": "1", "name": "Añadir", "description": "Desc, con coma",
+                      "deadline": "2030-01-01T00:00:00", "priority": "ALTA", "progress": 40,
+                      "last_update": "2025-01-01T10:00:00", "category": "Trabajo",
+                      "completed": True}]
+        for extension in ("csv", "json", "ndjson"):
+            archivo = self._file(f"test_io.{extension}")
+            self.assertEqual(write_records(archivo, registros), 1)
+            self.assertEqual(list(read_records(archivo)), registros)
+
+    def test_cli_importar_y_exportar(self):
+        tareas = self._file("test_cli_tasks.json")
+        origen = self._file("test_cli_origen.csv")
+        destino = self._file("test_cli_destino.ndjson")
+        with open(origen, "w", encoding="utf-8") as file:
+            file.write("name,description,deadline,priority,category\n")
+            file.write(f"A,Desc,{self.future_date:%Y-%m-%d},3,Trabajo\n")
+            file.write(f"B,,{self.future_date:%Y-%m-%d},,\n")
+
+        self.assertEqual(main(["--file", tareas, "import", origen]), 0)
+        cargadas = Storage(tareas).load_tasks()
+        self.assertEqual([(t.name, t.priority, t.category) for t in cargadas],
+                         [("A", Priority.ALTA, "Trabajo"), ("B", Priority.MEDIA, "General")])
+
+        self.assertEqual(main(["--file", tareas, "export", destino]), 0)
+        self.assertEqual([r["id"] for r in read_records(destino)], [t.id for t in cargadas])
+
+    def test_cli_rechaza_fechas_pasadas(self):
+        tareas = self._file("test_cli_tasks.json")
+        origen = self._file("test_cli_origen.json")
+        pasada = Task("Vieja", "Desc", datetime(2020, 1, 1), Priority.BAJA, is_loading=True)
+        Storage(origen).save_tasks([pasada])
+
+        self.assertEqual(main(["--file", tareas, "import", origen]), 1)
+        self.assertEqual(main(["--file", tareas, "import", origen, "--allow-past"]), 0)
+        self.assertEqual([t.id for t in Storage(tareas).load_tasks()], [pasada.id])